@@ -0,0 +1,161 @@
+"""Login throughput and its effect on other traffic on a single uvicorn worker.
+
+Usage: python benchmarks/login_throughput.py [--login-clients 0,8,32] [--read-clients 8] [--duration 10]
+
+Seeds a temporary SQLite database (users with bcrypt hashes at the configured
+cost, a small exercise catalog), starts `uvicorn --workers 1`, then for each
+login client count runs that many threads posting /auth/login next to
+--read-clients threads reading the exercise list and /health. Prints login
+req/s and 503s, and read req/s with latency percentiles.
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASSWORD = "secret123"
+USERS = 50
+READ_PATHS = ["/api/v1/exercises", "/health"]
+
+
+def seed(database_url: str) -> None:
+    """Create the schema, users sharing one password hash and a few exercises."""
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, BACKEND_DIR)
+    from sqlalchemy import insert
+
+    from src.infrastructure.auth.password_service import PasswordService
+    from src.infrastructure.database.models import ExerciseModel, UserModel
+    from src.infrastructure.database.session import Database
+
+    database = Database(database_url)
+    database.create_tables()
+    db = database.SessionLocal()
+    hashed = PasswordService.hash_password(PASSWORD)
+    db.execute(
+        insert(UserModel),
+        [{"email": f"user{i}@example.com", "username": f"user{i}", "hashed_password": hashed} for i in range(USERS)],
+    )
+    db.execute(insert(ExerciseModel), [{"name": f"Exercise {i}", "is_custom": False} for i in range(20)])
+    db.commit()
+    db.close()
+
+
+def request(conn: http.client.HTTPConnection, method: str, path: str, body=None, headers=None):
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def load(port: int, headers: dict, login_clients: int, read_clients: int, duration: float) -> None:
+    logins = {"ok": 0, "shed": 0, "errors": 0}
+    reads = []
+    read_errors = [0]
+    stop_at = time.monotonic() + duration
+
+    def login_client(index: int) -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        body = json.dumps({"email": f"user{index % USERS}@example.com", "password": PASSWORD})
+        while time.monotonic() < stop_at:
+            try:
+                status, _ = request(conn, "POST", "/api/v1/auth/login", body, {"Content-Type": "application/json"})
+            except (OSError, http.client.HTTPException):
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+                status = 0
+            if status == 200:
+                logins["ok"] += 1
+            elif status == 503:
+                logins["shed"] += 1
+                time.sleep(0.1)
+            else:
+                logins["errors"] += 1
+
+    def read_client(index: int) -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        n = index
+        while time.monotonic() < stop_at:
+            path = READ_PATHS[n % len(READ_PATHS)]
+            n += 1
+            started = time.perf_counter()
+            try:
+                status, _ = request(conn, "GET", path, headers=headers)
+            except (OSError, http.client.HTTPException):
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+                status = 0
+            if status != 200:
+                read_errors[0] += 1
+            reads.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=login_client, args=(i,)) for i in range(login_clients)]
+    threads += [threading.Thread(target=read_client, args=(i,)) for i in range(read_clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reads.sort()
+    print(
+        f"login clients={login_clients:<3} logins {logins['ok'] / duration:6.1f} req/s"
+        f"  503 {logins['shed']:<5} errors {logins['errors']:<3}"
+        f"| reads {len(reads) / duration:7.1f} req/s"
+        f"  p50 {reads[len(reads) // 2] * 1000:7.1f} ms"
+        f"  p95 {reads[int(len(reads) * 0.95)] * 1000:7.1f} ms  errors {read_errors[0]}"
+    )
+
+
+def run(database_url: str, port: int, login_counts, read_clients: int, duration: float) -> None:
+    env = dict(os.environ, DATABASE_URL=database_url, SECRET_KEY=os.environ["SECRET_KEY"])
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.presentation.main:app", "--workers", "1",
+         "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                request(conn, "GET", "/health")
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        _, body = request(
+            conn, "POST", "/api/v1/auth/login",
+            body=json.dumps({"email": "user0@example.com", "password": PASSWORD}),
+            headers={"Content-Type": "application/json"},
+        )
+        headers = {"Authorization": f"Bearer {json.loads(body)['access_token']}"}
+        for login_clients in login_counts:
+            load(port, headers, login_clients, read_clients, duration)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--login-clients", default="0,8,32", help="comma-separated concurrent login client counts")
+    parser.add_argument("--read-clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8797)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{directory}/benchmark.db"
+        seed(database_url)
+        run(database_url, args.port, [int(value) for value in args.login_clients.split(",")],
+            args.read_clients, args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Per-query Python overhead of the prebuilt repository statements vs a fresh select() and lambda_stmt.
+
+Usage: python benchmarks/prebuilt_statements.py [--iterations 2000] [--repeat 3]
+
+Seeds a temporary SQLite database (see training_reads.py) with a follow and 60
+exercises visible to user 1, then runs each hot lookup three ways through the
+same Session.scalars call: the module-level statement the repository executes,
+a select() built anew on every call (what the repositories did before) and a
+lambda_stmt. The identity map is cleared between calls so every call builds
+its ORM objects. Prints the best mean time per call over --repeat rounds of
+--iterations calls; the row counts of the three variants are checked to match.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from functools import partial
+
+from training_reads import seed
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def lookups():
+    """(name, parameters, prebuilt, build fresh, build lambda) for each hot lookup."""
+    from sqlalchemy import lambda_stmt, select
+
+    from src.infrastructure.database.models import (
+        ExerciseModel,
+        FollowModel,
+        TrainingModel,
+        UserModel,
+    )
+    from src.infrastructure.repositories import (
+        exercise_repository_impl,
+        follow_repository_impl,
+        training_repository_impl,
+        user_repository_impl,
+    )
+    from src.infrastructure.repositories.training_repository_impl import (
+        _implementations_load_option,
+    )
+
+    def user_fresh(user_id):
+        return select(UserModel).where(UserModel.id == user_id)
+
+    def user_lambda(user_id):
+        return lambda_stmt(lambda: select(UserModel).where(UserModel.id == user_id))
+
+    def follow_fresh(follower_id, following_id):
+        return select(FollowModel).where(FollowModel.follower_id == follower_id, FollowModel.following_id == following_id)
+
+    def follow_lambda(follower_id, following_id):
+        return lambda_stmt(
+            lambda: select(FollowModel).where(
+                FollowModel.follower_id == follower_id, FollowModel.following_id == following_id
+            )
+        )
+
+    def exercises_fresh(user_id):
+        return select(ExerciseModel).where(
+            (ExerciseModel.user_id == user_id)
+            | ((ExerciseModel.is_custom == False) & (ExerciseModel.user_id.is_(None)))  # noqa: E712
+        )
+
+    def exercises_lambda(user_id):
+        return lambda_stmt(
+            lambda: select(ExerciseModel).where(
+                (ExerciseModel.user_id == user_id)
+                | ((ExerciseModel.is_custom == False) & (ExerciseModel.user_id.is_(None)))  # noqa: E712
+            )
+        )
+
+    result = [
+        ("user by id", {"user_id": 1}, user_repository_impl._USER_BY_ID, user_fresh, user_lambda),
+        (
+            "follow by pair",
+            {"follower_id": 2, "following_id": 1},
+            follow_repository_impl._FOLLOW_BY_PAIR,
+            follow_fresh,
+            follow_lambda,
+        ),
+    ]
+    for load_strategy in training_repository_impl.TrainingRepositoryImpl.LOAD_STRATEGIES:
+        option = _implementations_load_option(load_strategy)
+
+        def training_fresh(training_id, option=option):
+            return select(TrainingModel).options(option).where(TrainingModel.id == training_id)
+
+        def training_lambda(training_id, option=option, load_strategy=load_strategy):
+            # The load option is not a SQL element, so the cache key tracks the strategy instead
+            return lambda_stmt(
+                lambda: select(TrainingModel).options(option).where(TrainingModel.id == training_id),
+                track_on=[load_strategy],
+            )
+
+        result.append(
+            (
+                f"training by id ({load_strategy})",
+                {"training_id": 1},
+                training_repository_impl._TRAINING_BY_ID[load_strategy],
+                training_fresh,
+                training_lambda,
+            )
+        )
+    result.append(
+        (
+            "exercises list",
+            {"user_id": 1},
+            exercise_repository_impl._EXERCISES_VISIBLE_TO_USER,
+            exercises_fresh,
+            exercises_lambda,
+        )
+    )
+    return result
+
+
+def execute(db, statement, parameters=None):
+    """Run a statement the way the repositories do and return its ORM objects."""
+    return db.scalars(statement, parameters).unique().all()
+
+
+def execute_built(db, build, parameters):
+    """Build the statement for these values, then run it."""
+    return execute(db, build(**parameters))
+
+
+def measure(db, run, iterations: int, repeat: int):
+    """Best mean seconds per call over `repeat` rounds and the row count of one call."""
+    rows = len(run())
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            run()
+            db.expunge_all()
+        best = min(best, (time.perf_counter() - started) / iterations)
+    return best, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{directory}/benchmark.db"
+        os.environ.setdefault("SECRET_KEY", "benchmark")
+        os.environ["DATABASE_URL"] = database_url
+        sys.path.insert(0, BACKEND_DIR)
+        from sqlalchemy import insert
+
+        from src.domain.entities.follow import FollowStatus
+        from src.infrastructure.database.models import ExerciseModel, FollowModel, UserModel
+        from src.infrastructure.database.session import Database
+
+        database = Database(database_url)
+        seed(database, trainings=10, exercises=5, sets=4)
+        db = database.SessionLocal()
+        db.execute(insert(UserModel), [{"email": "follower@example.com", "username": "follower", "hashed_password": "x"}])
+        db.execute(insert(FollowModel), [{"follower_id": 2, "following_id": 1, "status": FollowStatus.APPROVED}])
+        db.execute(
+            insert(ExerciseModel), [{"name": f"Custom {i}", "is_custom": True, "user_id": 1} for i in range(40)]
+        )
+        db.commit()
+
+        print(f"{args.iterations} calls x {args.repeat} rounds ({database.engine.dialect.name}), us per call")
+        print(f"{'lookup':26} {'rows':>5} {'prebuilt':>9} {'select()':>9} {'lambda':>9}")
+        for name, parameters, prebuilt, fresh, with_lambda in lookups():
+            timings = []
+            row_counts = set()
+            for run in (
+                partial(execute, db, prebuilt, parameters),
+                partial(execute_built, db, fresh, parameters),
+                partial(execute_built, db, with_lambda, parameters),
+            ):
+                seconds, rows = measure(db, run, args.iterations, args.repeat)
+                timings.append(seconds)
+                row_counts.add(rows)
+            assert len(row_counts) == 1, name
+            print(f"{name:26} {rows:5} " + " ".join(f"{seconds * 1e6:9.0f}" for seconds in timings))
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
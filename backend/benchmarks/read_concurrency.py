@@ -0,0 +1,191 @@
+"""Concurrent-request throughput of the hot training reads on a single uvicorn worker.
+
+Usage: python benchmarks/read_concurrency.py --database-url URL [--clients 8,32,64] [--duration 10]
+
+DROPS AND RECREATES all tables in the given database (use a scratch one),
+seeds one user's history (600 trainings x 6 exercises x 4 sets), starts
+`uvicorn --workers 1` and runs client threads round-robin over the training
+summary list, the full list of the last month and single trainings. Prints
+req/s and latency percentiles per client count. Without --database-url a
+temporary SQLite database is used.
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EMAIL, PASSWORD = "bench@example.com", "secret123"
+TRAININGS = 600
+PATHS = [
+    "/api/v1/trainings?view=summary",
+    "/api/v1/trainings?start_date=2025-07-24T00:00:00",
+    "/api/v1/trainings/{id}",
+]
+
+
+def seed(database_url: str) -> None:
+    """Recreate the schema and a training history for one user."""
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, BACKEND_DIR)
+    from sqlalchemy import insert
+
+    from src.domain.entities.training import TrainingStatus
+    from src.infrastructure.auth.password_service import PasswordService
+    from src.infrastructure.database.base import Base
+    from src.infrastructure.database.models import (
+        ExerciseModel,
+        ImplementationModel,
+        SetModel,
+        TrainingModel,
+        UserModel,
+    )
+    from src.infrastructure.database.session import Database
+
+    database = Database(database_url)
+    Base.metadata.drop_all(database.engine)
+    database.create_tables()
+    db = database.SessionLocal()
+    db.execute(
+        insert(UserModel),
+        [{"email": EMAIL, "username": "bench", "hashed_password": PasswordService().hash_password(PASSWORD)}],
+    )
+    db.execute(insert(ExerciseModel), [{"name": f"Exercise {i}", "is_custom": False} for i in range(20)])
+    db.execute(
+        insert(TrainingModel),
+        [
+            {
+                "user_id": 1,
+                "date_time": datetime(2024, 1, 1) + timedelta(days=i),
+                "status": TrainingStatus.COMPLETED,
+                "exercise_count": 6,
+                "set_count": 24,
+                "total_volume": 6 * 8 * (50 + 55 + 60 + 65),
+                "top_weight": 65,
+            }
+            for i in range(TRAININGS)
+        ],
+    )
+    db.execute(
+        insert(ImplementationModel),
+        [
+            {"training_id": t + 1, "exercise_id": (t + e) % 20 + 1, "order_index": e}
+            for t in range(TRAININGS)
+            for e in range(6)
+        ],
+    )
+    db.execute(
+        insert(SetModel),
+        [
+            {"implementation_id": i + 1, "order_index": k, "weight": 50 + 5 * k, "reps": 8}
+            for i in range(TRAININGS * 6)
+            for k in range(4)
+        ],
+    )
+    db.commit()
+    db.close()
+    database.engine.dispose()
+
+
+def request(conn: http.client.HTTPConnection, method: str, path: str, body=None, headers=None):
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def load(port: int, headers: dict, clients: int, duration: float) -> None:
+    latencies = {path: [] for path in PATHS}
+    errors = [0]
+    stop_at = time.monotonic() + duration
+
+    def client(index: int) -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        n = index
+        while time.monotonic() < stop_at:
+            template = PATHS[n % len(PATHS)]
+            path = template.format(id=n % TRAININGS + 1)
+            n += 1
+            started = time.perf_counter()
+            try:
+                status, _ = request(conn, "GET", path, headers=headers)
+            except (OSError, http.client.HTTPException):
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+                status = 0
+            if status != 200:
+                errors[0] += 1
+            latencies[template].append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"clients={clients:<3} total {total / duration:8.1f} req/s  errors {errors[0]}")
+    for path, values in latencies.items():
+        values.sort()
+        print(
+            f"  {path[:50]:50} {len(values) / duration:8.1f} req/s"
+            f"  p50 {values[len(values) // 2] * 1000:7.1f} ms"
+            f"  p95 {values[int(len(values) * 0.95)] * 1000:7.1f} ms"
+        )
+
+
+def run(database_url: str, port: int, client_counts, duration: float) -> None:
+    env = dict(os.environ, DATABASE_URL=database_url, SECRET_KEY=os.environ["SECRET_KEY"])
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.presentation.main:app", "--workers", "1",
+         "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                request(conn, "GET", "/health")
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        _, body = request(
+            conn, "POST", "/api/v1/auth/login",
+            body=json.dumps({"email": EMAIL, "password": PASSWORD}),
+            headers={"Content-Type": "application/json"},
+        )
+        headers = {"Authorization": f"Bearer {json.loads(body)['access_token']}"}
+        load(port, headers, 4, 2)  # Warm up
+        for clients in client_counts:
+            load(port, headers, clients, duration)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="scratch database (all tables are dropped)")
+    parser.add_argument("--clients", default="8,32,64", help="comma-separated concurrent client counts")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8798)
+    args = parser.parse_args()
+    client_counts = [int(value) for value in args.clients.split(",")]
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite:///{directory}/benchmark.db"
+        seed(database_url)
+        run(database_url, args.port, client_counts, args.duration)
+
+
+if __name__ == "__main__":
+    main()
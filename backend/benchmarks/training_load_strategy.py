@@ -0,0 +1,122 @@
+"""Rows, bytes and hydration time of TrainingRepositoryImpl.get_all: joined vs selectin loading.
+
+Usage: python benchmarks/training_load_strategy.py [--database-url URL] [--trainings 1000] [--exercises 5] [--sets 4] [--repeat 5]
+
+Seeds one user's history (see training_reads.py), then loads all of it through
+TrainingRepositoryImpl with each TRAINING_LOAD_STRATEGY. Per strategy it prints
+the statements issued, the rows they return, an estimate of the bytes
+transferred (the width of every returned value), the best wall time of
+get_all over --repeat runs, the best time of running the same statements and
+fetching their raw rows, and the difference between the two: the time spent
+building ORM objects and entities. With --database-url the given database is
+used and ALL ITS TABLES ARE DROPPED (use a scratch one); otherwise a temporary
+SQLite database.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+
+from training_reads import seed
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def value_bytes(value) -> int:
+    """Approximate wire size of one returned value."""
+    if value is None:
+        return 0
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, (bool, int, float, Decimal, date)):
+        return 8
+    return len(str(value))
+
+
+def record_statements(database, load):
+    """Run load once, returning the SELECT statements it issued with their parameters."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(database.engine, "before_cursor_execute", record)
+    try:
+        db = database.SessionLocal()
+        load(db)
+        db.close()
+    finally:
+        event.remove(database.engine, "before_cursor_execute", record)
+    return statements
+
+
+def raw_fetch(database, statements):
+    """Run the statements on a plain connection and fetch every row: (rows, approximate bytes, seconds)."""
+    rows = size = 0
+    with database.engine.connect() as connection:
+        started = time.perf_counter()
+        results = [connection.exec_driver_sql(statement, parameters).fetchall() for statement, parameters in statements]
+        seconds = time.perf_counter() - started
+    for result in results:
+        rows += len(result)
+        size += sum(value_bytes(value) for row in result for value in row)
+    return rows, size, seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="scratch database (all tables are dropped)")
+    parser.add_argument("--trainings", type=int, default=1000)
+    parser.add_argument("--exercises", type=int, default=5)
+    parser.add_argument("--sets", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite:///{directory}/benchmark.db"
+        os.environ.setdefault("SECRET_KEY", "benchmark")
+        os.environ["DATABASE_URL"] = database_url
+        sys.path.insert(0, BACKEND_DIR)
+        from src.infrastructure.database.base import Base
+        from src.infrastructure.database.session import Database
+        from src.infrastructure.repositories import TrainingRepositoryImpl
+
+        database = Database(database_url)
+        Base.metadata.drop_all(bind=database.engine)
+        seed(database, args.trainings, args.exercises, args.sets)
+        print(f"{args.trainings} trainings x {args.exercises} exercises x {args.sets} sets ({database.engine.dialect.name})")
+        print(f"{'strategy':10} {'queries':>7} {'rows':>8} {'~bytes':>10} {'get_all':>10} {'sql+fetch':>10} {'hydration':>10}")
+
+        for strategy in TrainingRepositoryImpl.LOAD_STRATEGIES:
+            def load(db):
+                return TrainingRepositoryImpl(db, strategy).get_all(1)
+
+            statements = record_statements(database, load)
+            best_total = best_raw = float("inf")
+            for _ in range(args.repeat):
+                db = database.SessionLocal()
+                started = time.perf_counter()
+                trainings = load(db)
+                best_total = min(best_total, time.perf_counter() - started)
+                db.close()
+                rows, size, seconds = raw_fetch(database, statements)
+                best_raw = min(best_raw, seconds)
+            assert len(trainings) == args.trainings
+            print(
+                f"{strategy:10} {len(statements):7} {rows:8} {size:10} "
+                f"{best_total * 1000:8.1f}ms {best_raw * 1000:8.1f}ms {(best_total - best_raw) * 1000:8.1f}ms"
+            )
+
+        if args.database_url:
+            Base.metadata.drop_all(bind=database.engine)
+
+
+if __name__ == "__main__":
+    main()
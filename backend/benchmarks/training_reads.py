@@ -0,0 +1,132 @@
+"""Latency and allocations of the training list: ORM entities/DTOs vs TrainingReadModel.
+
+Usage: python benchmarks/training_reads.py [--trainings 1000] [--exercises 5] [--sets 4] [--repeat 5]
+
+Seeds a temporary SQLite database with one user's history, then builds the
+GET /trainings response both ways, including the TrainingResponse validation
+FastAPI performs. Prints the best wall time over --repeat runs, then the
+tracemalloc peak of one more run (traced separately, since tracing slows
+allocation-heavy code down).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def seed(database, trainings: int, exercises: int, sets: int) -> None:
+    """Create the schema and a training history for user 1."""
+    from sqlalchemy import insert
+
+    from src.domain.entities.training import TrainingStatus
+    from src.infrastructure.database.models import (
+        ExerciseModel,
+        ImplementationModel,
+        SetModel,
+        TrainingModel,
+        UserModel,
+    )
+
+    database.create_tables()
+    db = database.SessionLocal()
+    db.execute(insert(UserModel), [{"email": "bench@example.com", "username": "bench", "hashed_password": "x"}])
+    db.execute(insert(ExerciseModel), [{"name": f"Exercise {i}", "is_custom": False} for i in range(20)])
+    db.execute(
+        insert(TrainingModel),
+        [
+            {"user_id": 1, "date_time": datetime(2022, 1, 1) + timedelta(days=i), "status": TrainingStatus.COMPLETED}
+            for i in range(trainings)
+        ],
+    )
+    db.execute(
+        insert(ImplementationModel),
+        [
+            {"training_id": t + 1, "exercise_id": (t + e) % 20 + 1, "order_index": e}
+            for t in range(trainings)
+            for e in range(exercises)
+        ],
+    )
+    db.execute(
+        insert(SetModel),
+        [
+            {"implementation_id": i + 1, "order_index": k, "weight": 50 + 5 * k, "reps": 8}
+            for i in range(trainings * exercises)
+            for k in range(sets)
+        ],
+    )
+    db.commit()
+    db.close()
+
+
+def orm_path(db):
+    """Repository entities -> DTOs -> response schemas (the path before TrainingReadModel)."""
+    from src.application.use_cases.trainings.get_training_by_id import GetTrainingByIdUseCase
+    from src.infrastructure.repositories import TrainingRepositoryImpl
+    from src.presentation.api.v1.trainings import dto_to_response
+
+    trainings = TrainingRepositoryImpl(db).get_all(1)
+    return [dto_to_response(GetTrainingByIdUseCase._to_dto(t)) for t in trainings]
+
+
+def read_model_path(db):
+    """Core rows -> response dicts, validated like FastAPI's response_model."""
+    from src.infrastructure.read_models import TrainingReadModel
+    from src.presentation.schemas.training_schemas import TrainingResponse
+
+    return [TrainingResponse.model_validate(t) for t in TrainingReadModel(db).list_for_user(1)]
+
+
+def measure(database, build, repeat: int):
+    """Best wall time in seconds over `repeat` runs and the traced peak in bytes of one run."""
+    best = float("inf")
+    for _ in range(repeat):
+        db = database.SessionLocal()
+        started = time.perf_counter()
+        result = build(db)
+        best = min(best, time.perf_counter() - started)
+        db.close()
+
+    db = database.SessionLocal()
+    tracemalloc.start()
+    build(db)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.close()
+    return best, peak, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trainings", type=int, default=1000)
+    parser.add_argument("--exercises", type=int, default=5)
+    parser.add_argument("--sets", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{directory}/benchmark.db"
+        os.environ.setdefault("SECRET_KEY", "benchmark")
+        os.environ["DATABASE_URL"] = database_url
+        sys.path.insert(0, BACKEND_DIR)
+        from src.infrastructure.database.session import Database
+
+        database = Database(database_url)
+        seed(database, args.trainings, args.exercises, args.sets)
+        print(f"{args.trainings} trainings x {args.exercises} exercises x {args.sets} sets")
+
+        results = {}
+        for name, build in (("orm", orm_path), ("read model", read_model_path)):
+            seconds, peak, results[name] = measure(database, build, args.repeat)
+            print(f"{name:12} {seconds * 1000:9.1f} ms  peak {peak / 2**20:7.1f} MiB")
+
+        same = [r.model_dump() for r in results["orm"]] == [r.model_dump() for r in results["read model"]]
+        print(f"responses equal: {same}")
+
+
+if __name__ == "__main__":
+    main()
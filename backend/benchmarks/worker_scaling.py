@@ -0,0 +1,169 @@
+"""Throughput of the production launcher (gunicorn.conf.py) for different worker counts.
+
+Usage: python benchmarks/worker_scaling.py [--workers 1,2,4] [--clients 16] [--duration 10]
+
+Seeds a temporary SQLite database (one user, 600 trainings x 6 exercises x 4 sets),
+then for each worker count starts gunicorn, logs in and hammers the training
+summary list and /health from client threads, printing req/s and latency
+percentiles. Run it on the target hardware; the client threads share the CPU
+with the server, so leave cores free for them.
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EMAIL, PASSWORD = "bench@example.com", "secret123"
+PATHS = ["/api/v1/trainings?view=summary&start_date=2025-01-01T00:00:00", "/health"]
+
+
+def seed(database_url: str) -> None:
+    """Create the schema and a training history for one user."""
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, BACKEND_DIR)
+    from sqlalchemy import insert
+
+    from src.domain.entities.training import TrainingStatus
+    from src.infrastructure.auth.password_service import PasswordService
+    from src.infrastructure.database.models import (
+        ExerciseModel,
+        ImplementationModel,
+        SetModel,
+        TrainingModel,
+        UserModel,
+    )
+    from src.infrastructure.database.session import Database
+
+    database = Database(database_url)
+    database.create_tables()
+    db = database.SessionLocal()
+    trainings = 600
+    db.execute(
+        insert(UserModel),
+        [{"email": EMAIL, "username": "bench", "hashed_password": PasswordService().hash_password(PASSWORD)}],
+    )
+    db.execute(insert(ExerciseModel), [{"name": f"Exercise {i}", "is_custom": False} for i in range(20)])
+    db.execute(
+        insert(TrainingModel),
+        [
+            {"user_id": 1, "date_time": datetime(2024, 1, 1) + timedelta(days=i), "status": TrainingStatus.COMPLETED}
+            for i in range(trainings)
+        ],
+    )
+    db.execute(
+        insert(ImplementationModel),
+        [
+            {"training_id": t + 1, "exercise_id": (t + e) % 20 + 1, "order_index": e}
+            for t in range(trainings)
+            for e in range(6)
+        ],
+    )
+    db.execute(
+        insert(SetModel),
+        [
+            {"implementation_id": i + 1, "order_index": k, "weight": 50 + 5 * k, "reps": 8}
+            for i in range(trainings * 6)
+            for k in range(4)
+        ],
+    )
+    db.commit()
+    db.close()
+
+
+def request(conn: http.client.HTTPConnection, method: str, path: str, body=None, headers=None):
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def run(workers: int, port: int, env: dict, clients: int, duration: float) -> None:
+    env = dict(env, WEB_CONCURRENCY=str(workers), BACKEND_PORT=str(port))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "src.presentation.main:app", "-c", "gunicorn.conf.py",
+         "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                request(conn, "GET", "/health")
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        _, body = request(
+            conn, "POST", "/api/v1/auth/login",
+            body=json.dumps({"email": EMAIL, "password": PASSWORD}),
+            headers={"Content-Type": "application/json"},
+        )
+        headers = {"Authorization": f"Bearer {json.loads(body)['access_token']}"}
+        time.sleep(1)  # Let every worker finish booting
+
+        latencies = {path: [] for path in PATHS}
+        errors = [0]
+        stop_at = time.monotonic() + duration
+
+        def client(path: str) -> None:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            while time.monotonic() < stop_at:
+                started = time.perf_counter()
+                try:
+                    status, _ = request(conn, "GET", path, headers=headers)
+                except (OSError, http.client.HTTPException):
+                    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                    status = 0
+                if status != 200:
+                    errors[0] += 1
+                latencies[path].append(time.perf_counter() - started)
+
+        threads = [threading.Thread(target=client, args=(PATHS[i % 2],)) for i in range(clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for path, values in latencies.items():
+            values.sort()
+            print(
+                f"workers={workers:<2} {path[:40]:40} {len(values) / duration:8.1f} req/s"
+                f"  p50 {values[len(values) // 2] * 1000:7.1f} ms"
+                f"  p95 {values[int(len(values) * 0.95)] * 1000:7.1f} ms"
+            )
+        if errors[0]:
+            print(f"workers={workers:<2} errors: {errors[0]}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated worker counts")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    print(f"available CPUs: {len(os.sched_getaffinity(0))}")
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{directory}/benchmark.db"
+        seed(database_url)
+        env = dict(os.environ, DATABASE_URL=database_url, SECRET_KEY=os.environ["SECRET_KEY"])
+        for workers in (int(value) for value in args.workers.split(",")):
+            run(workers, args.port, env, args.clients, args.duration)
+
+
+if __name__ == "__main__":
+    main()
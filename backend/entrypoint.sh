@@ -84,5 +84,6 @@ cd /app
 alembic upgrade head
 
 echo "Starting application"
-exec uvicorn src.presentation.main:app --host 0.0.0.0 --port ${BACKEND_PORT:-8000}
+# Preloaded multi-worker server (see gunicorn.conf.py); `kill -HUP 1` restarts workers gracefully
+exec gunicorn src.presentation.main:app -c gunicorn.conf.py
 
@@ -0,0 +1,60 @@
+"""Gunicorn settings for production: `gunicorn src.presentation.main:app -c gunicorn.conf.py`.
+
+The app is imported once in the master (preload) and forked into uvicorn
+workers; each worker opens its own connection pool and warms up on startup.
+Send HUP to the master for a graceful rolling restart of the workers.
+"""
+import math
+import os
+
+# Default worker count is capped: every worker has its own connection pool, so
+# the database sees up to workers * (DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW)
+# connections (4 * (10 + 10) = 80 with the defaults, under PostgreSQL's default
+# max_connections=100). Raise WEB_CONCURRENCY only together with that budget.
+DEFAULT_MAX_WORKERS = 4
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: the affinity mask, limited by the cgroup v2 CPU quota."""
+    cpus = len(os.sched_getaffinity(0))
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as file:
+            quota, period = file.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+bind = f"0.0.0.0:{os.environ.get('BACKEND_PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.environ.get("WEB_CONCURRENCY") or min(available_cpus(), DEFAULT_MAX_WORKERS))
+
+# Addresses of the reverse proxies / load balancers in front of the app,
+# comma-separated ("*" trusts any peer, only safe when the port is not reachable
+# directly). For requests from them, uvicorn's ProxyHeadersMiddleware takes the
+# client address from X-Forwarded-For, which per-IP rate limits key on; without
+# it every client behind the proxy shares the proxy's address and bucket.
+forwarded_allow_ips = os.environ.get("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+# Import the application and build shared state before forking, so workers
+# start from a copy-on-write image instead of importing everything again
+preload_app = True
+
+# Workers get this long to finish in-flight requests on restart/shutdown
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", 30))
+timeout = int(os.environ.get("WORKER_TIMEOUT", 60))
+keepalive = 5
+
+# Recycle each worker after this many requests (0 disables); the jitter
+# staggers recycling so workers do not restart at the same time
+max_requests = int(os.environ.get("WORKER_MAX_REQUESTS", 0))
+max_requests_jitter = max(max_requests // 10, 0)
+
+
+def when_ready(server):
+    """Runs in the master after the app has been preloaded, before workers fork."""
+    from src.presentation.warmup import prepare_for_fork
+
+    prepare_for_fork(server.app.wsgi())
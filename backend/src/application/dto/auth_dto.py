@@ -19,6 +19,13 @@ class LoginUserDTO:
     password: str
 
 
+@dataclass
+class RefreshTokenDTO:
+    """DTO for exchanging or revoking a refresh token."""
+
+    refresh_token: str
+
+
 @dataclass
 class UserResponseDTO:
     """DTO for user response."""
@@ -36,5 +43,7 @@ class TokenResponseDTO:
 
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None  # Access token lifetime in seconds
 
 
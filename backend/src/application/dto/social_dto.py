@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from src.domain.entities.training_reaction import ReactionType
+from src.application.dto.training_dto import TrainingSummaryDTO
+
+
+@dataclass
+class TrainingSocialSummaryDTO:
+    """DTO for a training's reaction counts, the caller's reaction and comment count."""
+
+    training_id: int
+    reaction_counts: Dict[ReactionType, int]  # Every reaction type, zero included
+    my_reaction: Optional[ReactionType]
+    comment_count: int
+
+
+@dataclass
+class FeedItemDTO:
+    """DTO for an activity feed entry with its author and training summary."""
+
+    id: int
+    author_id: int
+    author_username: str
+    created_at: datetime
+    training: TrainingSummaryDTO
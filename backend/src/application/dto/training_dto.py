@@ -63,7 +63,26 @@ class TrainingResponseDTO:
     created_at: datetime
     share_token: Optional[str] = None
     implementations: List[ImplementationDTO] = field(default_factory=list)
+    exercise_count: int = 0
+    set_count: int = 0
+    total_volume: float = 0.0
+    top_weight: Optional[float] = None
 
 
+@dataclass
+class TrainingSummaryDTO:
+    """DTO for a training list row (aggregated totals instead of sets)."""
 
-
+    id: int
+    user_id: int
+    training_template_id: Optional[int]
+    date_time: datetime
+    duration: Optional[int]
+    notes: Optional[str]
+    status: TrainingStatus
+    created_at: datetime
+    share_token: Optional[str] = None
+    exercise_count: int = 0
+    set_count: int = 0
+    total_volume: float = 0.0
+    top_weight: Optional[float] = None
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+
+from src.domain.entities.training_import import ImportStatus, ImportFormat
+
+
+@dataclass
+class TrainingImportResponseDTO:
+    """DTO for training import job status and progress."""
+
+    id: int
+    file_format: ImportFormat
+    status: ImportStatus
+    processed_rows: int
+    imported_trainings: int
+    skipped_rows: int
+    created_at: datetime
+    error: Optional[str] = None
+    finished_at: Optional[datetime] = None
@@ -1,22 +1,23 @@
-from datetime import timedelta
+from datetime import datetime
+from uuid import uuid4
 
+from src.domain.repositories.refresh_token_repository import IRefreshTokenRepository
 from src.domain.repositories.user_repository import IUserRepository
 from src.infrastructure.auth.password_service import PasswordService
-from src.infrastructure.auth.jwt_service import JWTService
-from src.infrastructure.settings import settings
 from src.application.dto.auth_dto import LoginUserDTO, TokenResponseDTO
+from src.application.use_cases.auth.session_tokens import issue_session_tokens
 
 
 class AuthenticateUserUseCase:
     """Use case for user authentication."""
 
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(self, user_repository: IUserRepository, refresh_token_repository: IRefreshTokenRepository):
         self.user_repository = user_repository
+        self.refresh_token_repository = refresh_token_repository
         self.password_service = PasswordService()
-        self.jwt_service = JWTService()
 
     def execute(self, dto: LoginUserDTO) -> TokenResponseDTO:
-        """Authenticate user and return access token."""
+        """Authenticate user and start a login session: access and refresh token."""
         # Get user by email
         user = self.user_repository.get_by_email(dto.email)
         if not user:
@@ -26,16 +27,12 @@ class AuthenticateUserUseCase:
         if not self.password_service.verify_password(dto.password, user.hashed_password):
             raise ValueError("Invalid email or password")
 
-        # Create access token
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = self.jwt_service.create_access_token(
-            data={"sub": str(user.id), "email": user.email},
-            expires_delta=access_token_expires,
-        )
-
-        return TokenResponseDTO(access_token=access_token, token_type="bearer")
-
-
-
-
+        # Upgrade hashes made with an older cost factor while the plain password is at hand;
+        # the password itself is unchanged, so the password version (and other sessions) stay valid
+        if self.password_service.needs_rehash(user.hashed_password):
+            user.hashed_password = self.password_service.hash_password(dto.password)
+            user = self.user_repository.update(user)
 
+        # Logins are rare, so they also clear the user's expired refresh tokens
+        self.refresh_token_repository.delete_expired(user.id, datetime.utcnow())
+        return issue_session_tokens(user, uuid4().hex, self.refresh_token_repository)
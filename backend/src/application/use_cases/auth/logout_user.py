@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from src.domain.repositories.refresh_token_repository import IRefreshTokenRepository
+from src.infrastructure.auth.refresh_token_service import RefreshTokenService
+from src.application.dto.auth_dto import RefreshTokenDTO
+
+
+class LogoutUserUseCase:
+    """Use case for ending a login session."""
+
+    def __init__(self, refresh_token_repository: IRefreshTokenRepository):
+        self.refresh_token_repository = refresh_token_repository
+
+    def execute(self, dto: RefreshTokenDTO) -> None:
+        """Revoke the refresh token's session; its access tokens stop working too."""
+        stored = self.refresh_token_repository.get_by_hash(RefreshTokenService.hash_token(dto.refresh_token))
+        if stored and stored.revoked_at is None:
+            self.refresh_token_repository.revoke_session(stored.session_id, datetime.utcnow())
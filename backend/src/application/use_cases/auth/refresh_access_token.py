@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from src.domain.repositories.refresh_token_repository import IRefreshTokenRepository
+from src.domain.repositories.user_repository import IUserRepository
+from src.infrastructure.auth.refresh_token_service import RefreshTokenService
+from src.application.dto.auth_dto import RefreshTokenDTO, TokenResponseDTO
+from src.application.use_cases.auth.session_tokens import issue_session_tokens
+
+
+class RefreshAccessTokenUseCase:
+    """Use case for exchanging a refresh token for new tokens (no password check)."""
+
+    def __init__(self, user_repository: IUserRepository, refresh_token_repository: IRefreshTokenRepository):
+        self.user_repository = user_repository
+        self.refresh_token_repository = refresh_token_repository
+
+    def execute(self, dto: RefreshTokenDTO) -> TokenResponseDTO:
+        """Rotate the refresh token and issue a new access token for its session."""
+        now = datetime.utcnow()
+        stored = self.refresh_token_repository.get_by_hash(RefreshTokenService.hash_token(dto.refresh_token))
+        if not stored or stored.revoked_at is not None or stored.expires_at <= now:
+            raise ValueError("Invalid refresh token")
+
+        if not self.refresh_token_repository.rotate(stored.id, now):
+            # Already exchanged once: the token leaked or was replayed, so end the whole session
+            self.refresh_token_repository.revoke_session(stored.session_id, now)
+            raise ValueError("Invalid refresh token")
+
+        user = self.user_repository.get_by_id(stored.user_id)
+        if not user:
+            raise ValueError("Invalid refresh token")
+
+        # The new access token carries the current password version
+        return issue_session_tokens(user, stored.session_id, self.refresh_token_repository)
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+from src.domain.entities.refresh_token import RefreshToken
+from src.domain.entities.user import User
+from src.domain.repositories.refresh_token_repository import IRefreshTokenRepository
+from src.infrastructure.auth.jwt_service import JWTService
+from src.infrastructure.auth.refresh_token_service import RefreshTokenService
+from src.infrastructure.settings import settings
+from src.application.dto.auth_dto import TokenResponseDTO
+
+
+def issue_session_tokens(
+    user: User, session_id: str, refresh_token_repository: IRefreshTokenRepository
+) -> TokenResponseDTO:
+    """Access token and a new refresh token for the user's login session."""
+    refresh_token, token_hash = RefreshTokenService.generate()
+    refresh_token_repository.create(
+        RefreshToken(
+            id=None,
+            user_id=user.id,
+            session_id=session_id,
+            token_hash=token_hash,
+            expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = JWTService.create_access_token(
+        data={
+            "sub": str(user.id),
+            "email": user.email,
+            "pwv": user.password_version,
+            "sid": session_id,
+        },
+        expires_delta=access_token_expires,
+    )
+    return TokenResponseDTO(
+        access_token=access_token,
+        token_type="bearer",
+        refresh_token=refresh_token,
+        expires_in=int(access_token_expires.total_seconds()),
+    )
@@ -1,18 +1,23 @@
 from datetime import datetime
 from src.domain.repositories.training_comment_repository import ITrainingCommentRepository
+from src.domain.repositories.training_repository import ITrainingRepository
 from src.domain.entities.training_comment import TrainingComment
 
 
 class AddCommentUseCase:
     """Use case for adding a comment to a training."""
 
-    def __init__(self, comment_repository: ITrainingCommentRepository):
+    def __init__(self, comment_repository: ITrainingCommentRepository, training_repository: ITrainingRepository):
         self.comment_repository = comment_repository
+        self.training_repository = training_repository
 
     def execute(self, training_id: int, user_id: int, text: str) -> TrainingComment:
         """Add a comment to a training."""
         if not text or not text.strip():
             raise ValueError("Comment text cannot be empty")
+        # Archived trainings are moved back, since comments reference the hot row
+        if not self.training_repository.restore_if_archived(training_id):
+            raise ValueError(f"Training with id {training_id} not found")
 
         now = datetime.utcnow()
         comment = TrainingComment(
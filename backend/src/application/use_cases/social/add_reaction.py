@@ -1,16 +1,22 @@
 from datetime import datetime
 from src.domain.repositories.training_reaction_repository import ITrainingReactionRepository
+from src.domain.repositories.training_repository import ITrainingRepository
 from src.domain.entities.training_reaction import TrainingReaction, ReactionType
 
 
 class AddReactionUseCase:
     """Use case for adding a reaction to a training."""
 
-    def __init__(self, reaction_repository: ITrainingReactionRepository):
+    def __init__(self, reaction_repository: ITrainingReactionRepository, training_repository: ITrainingRepository):
         self.reaction_repository = reaction_repository
+        self.training_repository = training_repository
 
     def execute(self, training_id: int, user_id: int, reaction_type: ReactionType) -> TrainingReaction:
         """Add a reaction to a training."""
+        # Archived trainings are moved back, since reactions reference the hot row
+        if not self.training_repository.restore_if_archived(training_id):
+            raise ValueError(f"Training with id {training_id} not found")
+
         # Check if user already reacted
         existing = self.reaction_repository.get_by_training_and_user(training_id, user_id)
         if existing:
@@ -0,0 +1,24 @@
+from typing import List, Optional
+from src.domain.repositories.feed_repository import IFeedRepository
+from src.application.dto.social_dto import FeedItemDTO
+from src.application.use_cases.trainings.get_training_summaries import GetTrainingSummariesUseCase
+
+
+class GetFeedUseCase:
+    """Use case for getting the activity feed of the users a user follows."""
+
+    def __init__(self, feed_repository: IFeedRepository):
+        self.feed_repository = feed_repository
+
+    def execute(self, user_id: int, before_id: Optional[int] = None, limit: int = 50) -> List[FeedItemDTO]:
+        """Get a page of the user's feed, newest first."""
+        return [
+            FeedItemDTO(
+                id=entry.id,
+                author_id=entry.author_id,
+                author_username=author_username,
+                created_at=entry.created_at,
+                training=GetTrainingSummariesUseCase._to_dto(training),
+            )
+            for entry, author_username, training in self.feed_repository.get_page(user_id, before_id, limit)
+        ]
@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional, Tuple
 from src.domain.repositories.follow_repository import IFollowRepository
-from src.domain.entities.follow import Follow
+from src.domain.entities.follow import Follow, FollowStatus
 
 
 class GetFollowersUseCase:
@@ -9,8 +9,12 @@ class GetFollowersUseCase:
     def __init__(self, follow_repository: IFollowRepository):
         self.follow_repository = follow_repository
 
-    def execute(self, user_id: int) -> List[Follow]:
-        """Get all followers of a user."""
-        return self.follow_repository.get_followers(user_id)
-
-
+    def execute(
+        self,
+        user_id: int,
+        status: Optional[FollowStatus] = None,
+        before_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[Tuple[Follow, str]]:
+        """Get a page of a user's followers with their usernames, newest first."""
+        return self.follow_repository.get_followers_with_usernames(user_id, status, before_id, limit)
@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional, Tuple
 from src.domain.repositories.follow_repository import IFollowRepository
-from src.domain.entities.follow import Follow
+from src.domain.entities.follow import Follow, FollowStatus
 
 
 class GetFollowingUseCase:
@@ -9,8 +9,12 @@ class GetFollowingUseCase:
     def __init__(self, follow_repository: IFollowRepository):
         self.follow_repository = follow_repository
 
-    def execute(self, user_id: int) -> List[Follow]:
-        """Get all users that a user is following."""
-        return self.follow_repository.get_following(user_id)
-
-
+    def execute(
+        self,
+        user_id: int,
+        status: Optional[FollowStatus] = None,
+        before_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[Tuple[Follow, str]]:
+        """Get a page of the users a user follows with their usernames, newest first."""
+        return self.follow_repository.get_following_with_usernames(user_id, status, before_id, limit)
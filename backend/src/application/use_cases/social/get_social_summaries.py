@@ -0,0 +1,34 @@
+from typing import List, Sequence
+from src.domain.repositories.training_comment_repository import ITrainingCommentRepository
+from src.domain.repositories.training_reaction_repository import ITrainingReactionRepository
+from src.domain.entities.training_reaction import ReactionSummary, ReactionType
+from src.application.dto.social_dto import TrainingSocialSummaryDTO
+
+
+class GetSocialSummariesUseCase:
+    """Use case for getting reaction and comment summaries of many trainings at once."""
+
+    def __init__(
+        self, reaction_repository: ITrainingReactionRepository, comment_repository: ITrainingCommentRepository
+    ):
+        self.reaction_repository = reaction_repository
+        self.comment_repository = comment_repository
+
+    def execute(self, training_ids: Sequence[int], user_id: int) -> List[TrainingSocialSummaryDTO]:
+        """Get summaries in request order (duplicates removed); two queries in total."""
+        training_ids = list(dict.fromkeys(training_ids))
+        reactions = self.reaction_repository.get_summaries(training_ids, user_id)
+        comment_counts = self.comment_repository.count_by_trainings(training_ids)
+
+        summaries = []
+        for training_id in training_ids:
+            reaction = reactions.get(training_id, ReactionSummary())
+            summaries.append(
+                TrainingSocialSummaryDTO(
+                    training_id=training_id,
+                    reaction_counts={t: reaction.counts.get(t, 0) for t in ReactionType},
+                    my_reaction=reaction.user_reaction,
+                    comment_count=comment_counts.get(training_id, 0),
+                )
+            )
+        return summaries
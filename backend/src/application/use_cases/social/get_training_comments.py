@@ -1,4 +1,5 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 from src.domain.repositories.training_comment_repository import ITrainingCommentRepository
 from src.domain.entities.training_comment import TrainingComment
 
@@ -9,8 +10,8 @@ class GetTrainingCommentsUseCase:
     def __init__(self, comment_repository: ITrainingCommentRepository):
         self.comment_repository = comment_repository
 
-    def execute(self, training_id: int) -> List[TrainingComment]:
-        """Get all comments for a training."""
-        return self.comment_repository.get_by_training(training_id)
-
-
+    def execute(
+        self, training_id: int, after: Optional[Tuple[datetime, int]] = None, limit: int = 50
+    ) -> List[Tuple[TrainingComment, str]]:
+        """Get a page of a training's comments with their authors' usernames, oldest first."""
+        return self.comment_repository.get_by_training_with_usernames(training_id, after, limit)
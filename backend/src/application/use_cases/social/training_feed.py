@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Optional
+
+from src.domain.entities.training import Training, TrainingStatus
+from src.domain.repositories.feed_repository import IFeedRepository
+from src.infrastructure.settings import settings
+
+
+def update_training_feed(
+    training: Training, previous_status: Optional[TrainingStatus], feed_repository: IFeedRepository
+) -> None:
+    """Publish a training to followers' feeds once it is completed, withdraw it when it no longer is.
+
+    Up to FEED_FANOUT_MAX_FOLLOWERS followers get an entry each; an author with
+    more gets one shared entry instead, merged into their followers' feeds on read.
+    """
+    was_completed = previous_status == TrainingStatus.COMPLETED
+    if (training.status == TrainingStatus.COMPLETED) == was_completed:
+        return
+    if was_completed:
+        feed_repository.delete_for_training(training.id)
+        return
+
+    now = datetime.utcnow()
+    max_followers = settings.FEED_FANOUT_MAX_FOLLOWERS
+    if feed_repository.count_followers(training.user_id, max_followers + 1) > max_followers:
+        feed_repository.add_shared(training.user_id, training.id, now)
+    else:
+        feed_repository.fan_out(training.user_id, training.id, now)
@@ -1,11 +1,13 @@
 from src.domain.repositories.follow_repository import IFollowRepository
+from src.domain.repositories.feed_repository import IFeedRepository
 
 
 class UnfollowUserUseCase:
     """Use case for unfollowing a user."""
 
-    def __init__(self, follow_repository: IFollowRepository):
+    def __init__(self, follow_repository: IFollowRepository, feed_repository: IFeedRepository):
         self.follow_repository = follow_repository
+        self.feed_repository = feed_repository
 
     def execute(self, follower_id: int, following_id: int) -> None:
         """Unfollow a user."""
@@ -15,5 +17,6 @@ class UnfollowUserUseCase:
             raise ValueError("Not following this user")
 
         self.follow_repository.delete(follower_id, following_id)
+        self.feed_repository.delete_for_follower(follower_id, following_id)
 
 
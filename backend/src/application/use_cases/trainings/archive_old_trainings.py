@@ -0,0 +1,22 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+from src.domain.repositories.training_repository import ITrainingRepository
+
+
+class ArchiveOldTrainingsUseCase:
+    """Use case for moving old completed trainings to cold storage."""
+
+    def __init__(self, training_repository: ITrainingRepository):
+        self.training_repository = training_repository
+
+    def execute(self, older_than_days: int, batch_size: int = 500) -> Iterator[int]:
+        """Archive in batches, yielding the number moved per batch so the caller can commit it."""
+        if older_than_days < 1:
+            raise ValueError("older_than_days must be at least 1")
+        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        while True:
+            archived = self.training_repository.archive_completed_before(cutoff, batch_size)
+            if not archived:
+                return
+            yield archived
@@ -9,14 +9,17 @@ from src.domain.value_objects.rest_time import RestTime
 from src.domain.value_objects.duration import Duration
 from src.domain.value_objects.rpe import RPE
 from src.domain.repositories.training_repository import ITrainingRepository
+from src.domain.repositories.feed_repository import IFeedRepository
 from src.application.dto.training_dto import CreateTrainingDTO, TrainingResponseDTO, ImplementationDTO, SetDTO
+from src.application.use_cases.social.training_feed import update_training_feed
 
 
 class CreateTrainingUseCase:
     """Use case for creating a training."""
 
-    def __init__(self, training_repository: ITrainingRepository):
+    def __init__(self, training_repository: ITrainingRepository, feed_repository: IFeedRepository):
         self.training_repository = training_repository
+        self.feed_repository = feed_repository
 
     def execute(self, dto: CreateTrainingDTO, user_id: int) -> TrainingResponseDTO:
         """Create a new training."""
@@ -68,6 +71,7 @@ class CreateTrainingUseCase:
         )
 
         created_training = self.training_repository.create(training)
+        update_training_feed(created_training, None, self.feed_repository)
         return self._to_dto(created_training)
 
     @staticmethod
@@ -105,6 +109,10 @@ class CreateTrainingUseCase:
             created_at=training.created_at,
             share_token=training.share_token,
             implementations=impl_dtos,
+            exercise_count=training.exercise_count,
+            set_count=training.set_count,
+            total_volume=training.total_volume,
+            top_weight=training.top_weight,
         )
 
 
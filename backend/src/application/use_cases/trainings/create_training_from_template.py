@@ -68,6 +68,10 @@ class CreateTrainingFromTemplateUseCase:
             created_at=training.created_at,
             share_token=training.share_token,
             implementations=impl_dtos,
+            exercise_count=training.exercise_count,
+            set_count=training.set_count,
+            total_volume=training.total_volume,
+            top_weight=training.top_weight,
         )
 
 
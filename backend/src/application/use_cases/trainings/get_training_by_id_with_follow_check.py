@@ -1,7 +1,7 @@
 from typing import Optional
 
-from src.domain.repositories.training_repository import ITrainingRepository
-from src.domain.repositories.follow_repository import IFollowRepository
+from src.domain.repositories.async_training_repository import IAsyncTrainingRepository
+from src.domain.repositories.async_follow_repository import IAsyncFollowRepository
 from src.domain.entities.follow import FollowStatus
 from src.application.dto.training_dto import TrainingResponseDTO, ImplementationDTO, SetDTO
 
@@ -11,15 +11,15 @@ class GetTrainingByIdWithFollowCheckUseCase:
 
     def __init__(
         self,
-        training_repository: ITrainingRepository,
-        follow_repository: IFollowRepository,
+        training_repository: IAsyncTrainingRepository,
+        follow_repository: IAsyncFollowRepository,
     ):
         self.training_repository = training_repository
         self.follow_repository = follow_repository
 
-    def execute(self, training_id: int, current_user_id: int) -> Optional[TrainingResponseDTO]:
+    async def execute(self, training_id: int, current_user_id: int) -> Optional[TrainingResponseDTO]:
         """Get training by ID. Allows access if user owns the training or has approved follow relationship."""
-        training = self.training_repository.get_by_id(training_id)
+        training = await self.training_repository.get_by_id(training_id)
         if not training:
             return None
 
@@ -28,7 +28,7 @@ class GetTrainingByIdWithFollowCheckUseCase:
             return self._to_dto(training)
 
         # Check if current user has approved follow relationship with training owner
-        follow = self.follow_repository.get_by_ids(current_user_id, training.user_id)
+        follow = await self.follow_repository.get_by_ids(current_user_id, training.user_id)
         if follow and follow.status == FollowStatus.APPROVED:
             return self._to_dto(training)
 
@@ -69,5 +69,9 @@ class GetTrainingByIdWithFollowCheckUseCase:
             created_at=training.created_at,
             share_token=training.share_token,
             implementations=impl_dtos,
+            exercise_count=training.exercise_count,
+            set_count=training.set_count,
+            total_volume=training.total_volume,
+            top_weight=training.top_weight,
         )
 
@@ -0,0 +1,19 @@
+from typing import Optional
+
+from src.domain.repositories.training_import_repository import ITrainingImportRepository
+from src.application.dto.training_import_dto import TrainingImportResponseDTO
+from src.application.use_cases.trainings.start_training_import import StartTrainingImportUseCase
+
+
+class GetTrainingImportUseCase:
+    """Use case for reading training import progress."""
+
+    def __init__(self, training_import_repository: ITrainingImportRepository):
+        self.training_import_repository = training_import_repository
+
+    def execute(self, import_id: int, user_id: int) -> Optional[TrainingImportResponseDTO]:
+        """Get import job by ID (only the owner can see it)."""
+        training_import = self.training_import_repository.get_by_id(import_id)
+        if not training_import or training_import.user_id != user_id:
+            return None
+        return StartTrainingImportUseCase._to_dto(training_import)
@@ -0,0 +1,42 @@
+from typing import List, Optional
+from datetime import datetime
+
+from src.domain.entities.training import TrainingSummary
+from src.domain.repositories.async_training_repository import IAsyncTrainingRepository
+from src.application.dto.training_dto import TrainingSummaryDTO
+
+
+class GetTrainingSummariesUseCase:
+    """Use case for listing trainings as summary rows (stored totals, no sets loaded)."""
+
+    def __init__(self, training_repository: IAsyncTrainingRepository):
+        self.training_repository = training_repository
+
+    async def execute(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[TrainingSummaryDTO]:
+        """Get training summaries for a user, optionally filtered by date range."""
+        summaries = await self.training_repository.get_summaries(user_id, start_date, end_date)
+        return [self._to_dto(s) for s in summaries]
+
+    @staticmethod
+    def _to_dto(summary: TrainingSummary) -> TrainingSummaryDTO:
+        """Convert domain projection to DTO."""
+        return TrainingSummaryDTO(
+            id=summary.id,
+            user_id=summary.user_id,
+            training_template_id=summary.training_template_id,
+            date_time=summary.date_time,
+            duration=summary.duration,
+            notes=summary.notes,
+            status=summary.status,
+            created_at=summary.created_at,
+            share_token=summary.share_token,
+            exercise_count=summary.exercise_count,
+            set_count=summary.set_count,
+            total_volume=summary.total_volume,
+            top_weight=summary.top_weight,
+        )
@@ -0,0 +1,220 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime
+
+from src.domain.entities.exercise import Exercise
+from src.domain.entities.training import Training, TrainingStatus
+from src.domain.entities.training_import import TrainingImport, ImportStatus
+from src.domain.entities.implementation import Implementation
+from src.domain.entities.set import Set
+from src.domain.value_objects.exercise_name import ExerciseName
+from src.domain.value_objects.weight import Weight
+from src.domain.value_objects.reps import Reps
+from src.domain.value_objects.rest_time import RestTime
+from src.domain.value_objects.duration import Duration
+from src.domain.value_objects.rpe import RPE
+from src.domain.repositories.training_repository import ITrainingRepository
+from src.domain.repositories.exercise_repository import IExerciseRepository
+from src.domain.repositories.training_import_repository import ITrainingImportRepository
+from src.application.dto.training_import_dto import TrainingImportResponseDTO
+from src.application.use_cases.trainings.start_training_import import StartTrainingImportUseCase
+
+
+@dataclass
+class _PendingTraining:
+    """Training assembled from consecutive import rows, exercises still referenced by name."""
+
+    date_time: datetime
+    duration: Optional[int]
+    notes: Optional[str]
+    implementations: List[Tuple[str, List[Set]]] = field(default_factory=list)  # (exercise name, sets)
+
+
+class ImportTrainingsUseCase:
+    """Use case for bulk-importing historical trainings from parsed file rows.
+
+    Each row is one set: date_time, exercise (name), weight, reps and optional
+    rest_time, duration, rpe, notes, training_duration. Consecutive rows with
+    the same date_time form one training, consecutive rows with the same
+    exercise form one implementation. Only one batch of trainings is held in
+    memory at a time.
+    """
+
+    def __init__(
+        self,
+        training_repository: ITrainingRepository,
+        exercise_repository: IExerciseRepository,
+        training_import_repository: ITrainingImportRepository,
+        batch_size: int = 500,
+    ):
+        self.training_repository = training_repository
+        self.exercise_repository = exercise_repository
+        self.training_import_repository = training_import_repository
+        self.batch_size = batch_size
+        # Lowercased exercise name -> exercise ID, filled batch by batch
+        self._exercise_ids: Dict[str, int] = {}
+
+    def execute(
+        self, import_id: int, rows: Iterable[Dict[str, Any]]
+    ) -> Iterator[TrainingImportResponseDTO]:
+        """Import rows, yielding progress after every batch so the caller can commit it."""
+        training_import = self.training_import_repository.get_by_id(import_id)
+        if not training_import:
+            raise ValueError(f"Training import with id {import_id} not found")
+
+        training_import.status = ImportStatus.RUNNING
+        yield self._save(training_import)
+
+        batch: List[_PendingTraining] = []
+        current: Optional[_PendingTraining] = None
+        for row in rows:
+            training_import.processed_rows += 1
+            parsed = self._parse_row(row)
+            if parsed is None:
+                training_import.skipped_rows += 1
+                continue
+            date_time, exercise_name, set_entity, duration, notes = parsed
+
+            if current is None or current.date_time != date_time:
+                if current is not None:
+                    batch.append(current)
+                if len(batch) >= self.batch_size:
+                    self._import_batch(training_import, batch)
+                    batch = []
+                    yield self._save(training_import)
+                current = _PendingTraining(date_time=date_time, duration=duration, notes=notes)
+
+            if (
+                not current.implementations
+                or current.implementations[-1][0].lower() != exercise_name.lower()
+            ):
+                current.implementations.append((exercise_name, []))
+            sets = current.implementations[-1][1]
+            set_entity.order_index = len(sets)
+            sets.append(set_entity)
+
+        if current is not None:
+            batch.append(current)
+        self._import_batch(training_import, batch)
+
+        training_import.status = ImportStatus.COMPLETED
+        training_import.finished_at = datetime.utcnow()
+        yield self._save(training_import)
+
+    def mark_failed(self, import_id: int, error: str) -> Optional[TrainingImportResponseDTO]:
+        """Record that an import stopped with an error."""
+        training_import = self.training_import_repository.get_by_id(import_id)
+        if not training_import:
+            return None
+        training_import.status = ImportStatus.FAILED
+        training_import.error = error
+        training_import.finished_at = datetime.utcnow()
+        return self._save(training_import)
+
+    def _import_batch(self, training_import: TrainingImport, batch: List[_PendingTraining]) -> None:
+        """Resolve exercise names for a batch and insert its trainings."""
+        if not batch:
+            return
+        self._resolve_exercises(
+            (name for pending in batch for name, _ in pending.implementations),
+            training_import.user_id,
+        )
+
+        trainings = []
+        for pending in batch:
+            implementations = [
+                Implementation(
+                    id=None,
+                    training_id=0,  # Will be set when saved
+                    exercise_id=self._exercise_ids[name.lower()],
+                    order_index=order_index,
+                    sets=sets,
+                )
+                for order_index, (name, sets) in enumerate(pending.implementations)
+            ]
+            trainings.append(
+                Training(
+                    id=None,
+                    user_id=training_import.user_id,
+                    training_template_id=None,
+                    date_time=pending.date_time,
+                    duration=pending.duration,
+                    notes=pending.notes,
+                    status=TrainingStatus.COMPLETED,
+                    implementations=implementations,
+                    created_at=training_import.created_at,
+                    updated_at=training_import.created_at,
+                )
+            )
+        training_import.imported_trainings += self.training_repository.bulk_create(trainings)
+
+    def _resolve_exercises(self, names: Iterable[str], user_id: int) -> None:
+        """Map exercise names to IDs with one catalog lookup, creating custom exercises for unknown names."""
+        missing: Dict[str, str] = {}
+        for name in names:
+            if name.lower() not in self._exercise_ids:
+                missing.setdefault(name.lower(), name)
+        if not missing:
+            return
+        for key, exercise in self.exercise_repository.get_by_names(missing.values(), user_id).items():
+            self._exercise_ids[key] = exercise.id
+
+        now = datetime.utcnow()
+        for key, name in missing.items():
+            if key in self._exercise_ids:
+                continue
+            created = self.exercise_repository.create(
+                Exercise(
+                    id=None,
+                    name=ExerciseName(name),
+                    description=None,
+                    image_path=None,
+                    is_custom=True,
+                    user_id=user_id,
+                    muscle_group_ids=[],
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            self._exercise_ids[key] = created.id
+
+    @staticmethod
+    def _parse_row(
+        row: Dict[str, Any],
+    ) -> Optional[Tuple[datetime, str, Set, Optional[int], Optional[str]]]:
+        """Validate one row; returns None for rows with missing or invalid values."""
+
+        def value(key: str) -> Any:
+            raw = row.get(key)
+            if isinstance(raw, str):
+                raw = raw.strip()
+            return None if raw in (None, "") else raw
+
+        def optional_int(key: str) -> Optional[int]:
+            raw = value(key)
+            return None if raw is None else int(raw)
+
+        try:
+            date_time = value("date_time")
+            if not isinstance(date_time, datetime):
+                date_time = datetime.fromisoformat(str(date_time))
+            exercise_name = str(ExerciseName(str(value("exercise") or "")))
+            set_entity = Set(
+                id=None,
+                implementation_id=0,  # Will be set when saved
+                order_index=0,  # Set when the row is grouped into its implementation
+                weight=Weight(float(value("weight"))),
+                reps=Reps(int(value("reps"))),
+                rest_time=RestTime.optional(optional_int("rest_time")),
+                duration=Duration.optional(optional_int("duration")),
+                rpe=RPE.optional(optional_int("rpe")),
+            )
+            training_duration = optional_int("training_duration")
+        except (ValueError, TypeError):
+            return None
+        notes = value("notes")
+        return date_time, exercise_name, set_entity, training_duration, str(notes) if notes else None
+
+    def _save(self, training_import: TrainingImport) -> TrainingImportResponseDTO:
+        """Persist import progress."""
+        return StartTrainingImportUseCase._to_dto(self.training_import_repository.update(training_import))
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from src.domain.entities.training_import import TrainingImport, ImportFormat
+from src.domain.repositories.training_import_repository import ITrainingImportRepository
+from src.application.dto.training_import_dto import TrainingImportResponseDTO
+
+
+class StartTrainingImportUseCase:
+    """Use case for registering a pending training import job."""
+
+    def __init__(self, training_import_repository: ITrainingImportRepository):
+        self.training_import_repository = training_import_repository
+
+    def execute(self, user_id: int, file_format: ImportFormat) -> TrainingImportResponseDTO:
+        """Create a pending import job for the user."""
+        training_import = TrainingImport(
+            id=None,
+            user_id=user_id,
+            file_format=file_format,
+            created_at=datetime.utcnow(),
+        )
+        created_import = self.training_import_repository.create(training_import)
+        return self._to_dto(created_import)
+
+    @staticmethod
+    def _to_dto(training_import: TrainingImport) -> TrainingImportResponseDTO:
+        """Convert domain entity to DTO."""
+        return TrainingImportResponseDTO(
+            id=training_import.id,
+            file_format=training_import.file_format,
+            status=training_import.status,
+            processed_rows=training_import.processed_rows,
+            imported_trainings=training_import.imported_trainings,
+            skipped_rows=training_import.skipped_rows,
+            created_at=training_import.created_at,
+            error=training_import.error,
+            finished_at=training_import.finished_at,
+        )
@@ -7,14 +7,17 @@ from src.domain.value_objects.rest_time import RestTime
 from src.domain.value_objects.duration import Duration
 from src.domain.value_objects.rpe import RPE
 from src.domain.repositories.training_repository import ITrainingRepository
+from src.domain.repositories.feed_repository import IFeedRepository
 from src.application.dto.training_dto import UpdateTrainingDTO, TrainingResponseDTO, ImplementationDTO, SetDTO
+from src.application.use_cases.social.training_feed import update_training_feed
 
 
 class UpdateTrainingUseCase:
     """Use case for updating a training."""
 
-    def __init__(self, training_repository: ITrainingRepository):
+    def __init__(self, training_repository: ITrainingRepository, feed_repository: IFeedRepository):
         self.training_repository = training_repository
+        self.feed_repository = feed_repository
 
     def execute(self, training_id: int, dto: UpdateTrainingDTO, user_id: int) -> TrainingResponseDTO:
         """Update a training."""
@@ -27,6 +30,8 @@ class UpdateTrainingUseCase:
         if training.user_id != user_id:
             raise ValueError("You don't have permission to update this training")
 
+        previous_status = training.status
+
         # Update fields
         if dto.date_time is not None:
             training.date_time = dto.date_time
@@ -66,6 +71,7 @@ class UpdateTrainingUseCase:
             training.implementations = implementations
 
         updated_training = self.training_repository.update(training)
+        update_training_feed(updated_training, previous_status, self.feed_repository)
         return self._to_dto(updated_training)
 
     @staticmethod
@@ -103,6 +109,10 @@ class UpdateTrainingUseCase:
             created_at=training.created_at,
             share_token=training.share_token,
             implementations=impl_dtos,
+            exercise_count=training.exercise_count,
+            set_count=training.set_count,
+            total_volume=training.total_volume,
+            top_weight=training.top_weight,
         )
 
 
@@ -38,14 +38,7 @@ class CreateBodyMetricUseCase:
         created_metric = self.body_metric_repository.create(body_metric)
 
         # Update user's current weight and height if provided
-        user = self.user_repository.get_by_id(user_id)
-        if user:
-            if dto.weight is not None:
-                user.weight = dto.weight
-            if dto.height is not None:
-                user.height = dto.height
-            user.updated_at = now
-            self.user_repository.update(user)
+        self.user_repository.update_measurements(user_id, weight=dto.weight, height=dto.height)
 
         return BodyMetricResponseDTO(
             id=created_metric.id,
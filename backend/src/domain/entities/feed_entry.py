@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+
+
+@dataclass
+class FeedEntry:
+    """Activity feed entry: a completed training of a followed user."""
+
+    id: Optional[int]
+    user_id: Optional[int]  # Feed owner; None for a shared entry of an author with many followers
+    author_id: int
+    training_id: int
+    created_at: datetime
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+
+
+@dataclass
+class RefreshToken:
+    """Refresh token entity. Only a hash of the token is stored; times are naive UTC."""
+
+    id: Optional[int]
+    user_id: int
+    session_id: str  # Shared by the tokens one login rotates through; access tokens carry it as "sid"
+    token_hash: str
+    expires_at: datetime
+    rotated_at: Optional[datetime] = None  # Exchanged for a newer token of the session
+    revoked_at: Optional[datetime] = None  # Session ended (logout or token reuse)
@@ -30,4 +30,27 @@ class Training:
     updated_at: datetime
     share_token: Optional[str] = None  # Token for public sharing
     implementations: List[Implementation] = field(default_factory=list)
+    # Stored totals, maintained by the repository on every write
+    exercise_count: int = 0
+    set_count: int = 0
+    total_volume: float = 0.0  # Sum of weight * reps over all sets
+    top_weight: Optional[float] = None  # Heaviest set weight
 
+
+@dataclass
+class TrainingSummary:
+    """Read-only projection of a training with aggregated totals (no sets loaded)."""
+
+    id: int
+    user_id: int
+    training_template_id: Optional[int]
+    date_time: datetime
+    duration: Optional[int]  # Duration in seconds
+    notes: Optional[str]
+    status: TrainingStatus
+    created_at: datetime
+    share_token: Optional[str] = None
+    exercise_count: int = 0
+    set_count: int = 0
+    total_volume: float = 0.0  # Sum of weight * reps over all sets
+    top_weight: Optional[float] = None  # Heaviest set weight
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+from enum import Enum
+
+
+class ImportStatus(str, Enum):
+    """Training import job status enum."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ImportFormat(str, Enum):
+    """Supported training import file formats."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+@dataclass
+class TrainingImport:
+    """Training import entity (background bulk import of historical workouts)."""
+
+    id: Optional[int]
+    user_id: int
+    file_format: ImportFormat
+    created_at: datetime
+    status: ImportStatus = ImportStatus.PENDING
+    processed_rows: int = 0  # Rows read from the file so far
+    imported_trainings: int = 0
+    skipped_rows: int = 0  # Rows with missing or invalid values
+    error: Optional[str] = None
+    finished_at: Optional[datetime] = None
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -25,3 +25,9 @@ class TrainingReaction:
     created_at: datetime
 
 
+@dataclass
+class ReactionSummary:
+    """Reaction counts of one training by type, and the reaction of the user asking."""
+
+    counts: Dict[ReactionType, int] = field(default_factory=dict)
+    user_reaction: Optional[ReactionType] = None
@@ -18,6 +18,13 @@ class User:
     height: Optional[float] = None  # Current height in cm
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Bumped by every password change; access tokens carry it
+    password_version: int = 0
+
+    def change_password(self, hashed_password: str) -> None:
+        """Set a new password, so tokens issued for the previous one stop being accepted."""
+        self.hashed_password = hashed_password
+        self.password_version += 1
 
     def get_training_templates(self, templates: List["TrainingTemplate"]) -> List["TrainingTemplate"]:
         """Get training templates for this user."""
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..entities.follow import Follow
+
+
+class IAsyncFollowRepository(ABC):
+    """Interface for the async Follow read repository (Port), used by hot read endpoints."""
+
+    @abstractmethod
+    async def get_by_ids(self, follower_id: int, following_id: int) -> Optional[Follow]:
+        """Get follow relationship by follower and following IDs."""
+        pass
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Optional, List
+from datetime import datetime
+
+from ..entities.training import Training, TrainingSummary
+
+
+class IAsyncTrainingRepository(ABC):
+    """Interface for the async Training read repository (Port), used by hot read endpoints."""
+
+    @abstractmethod
+    async def get_by_id(self, training_id: int) -> Optional[Training]:
+        """Get training by ID."""
+        pass
+
+    @abstractmethod
+    async def get_summaries(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[TrainingSummary]:
+        """Get per-training totals for a user without loading implementations and sets."""
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..entities.user import User
+
+
+class IAsyncUserRepository(ABC):
+    """Interface for the async User read repository (Port), used by hot read endpoints."""
+
+    @abstractmethod
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 
 from ..entities.exercise import Exercise
 
@@ -17,6 +17,16 @@ class IExerciseRepository(ABC):
         """Get exercise by ID."""
         pass
 
+    @abstractmethod
+    def get_many(self, exercise_ids: Iterable[int]) -> Dict[int, Exercise]:
+        """Get exercises by IDs in one query, mapped by ID (missing IDs are omitted)."""
+        pass
+
+    @abstractmethod
+    def get_by_names(self, names: Iterable[str], user_id: int) -> Dict[str, Exercise]:
+        """Get exercises visible to a user by name in one query, mapped by lowercased name."""
+        pass
+
     @abstractmethod
     def get_all(self, user_id: Optional[int] = None, include_system: bool = True) -> List[Exercise]:
         """Get all exercises, optionally filtered by user."""
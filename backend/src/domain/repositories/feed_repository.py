@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from ..entities.feed_entry import FeedEntry
+from ..entities.training import TrainingSummary
+
+
+class IFeedRepository(ABC):
+    """Interface for activity feed repository (Port)."""
+
+    @abstractmethod
+    def count_followers(self, author_id: int, up_to: int) -> int:
+        """Count the author's approved followers, stopping at up_to."""
+        pass
+
+    @abstractmethod
+    def fan_out(self, author_id: int, training_id: int, created_at: datetime) -> int:
+        """Write an entry for the training into every approved follower's feed; returns the number written."""
+        pass
+
+    @abstractmethod
+    def add_shared(self, author_id: int, training_id: int, created_at: datetime) -> None:
+        """Write one entry for the training that every approved follower's feed reads."""
+        pass
+
+    @abstractmethod
+    def delete_for_training(self, training_id: int) -> None:
+        """Delete every feed entry of a training."""
+        pass
+
+    @abstractmethod
+    def delete_for_follower(self, user_id: int, author_id: int) -> None:
+        """Delete the author's entries from a user's feed."""
+        pass
+
+    @abstractmethod
+    def get_page(
+        self, user_id: int, before_id: Optional[int], limit: int
+    ) -> List[Tuple[FeedEntry, str, TrainingSummary]]:
+        """Get a page of a user's feed with author usernames and trainings, newest first, below the before_id cursor."""
+        pass
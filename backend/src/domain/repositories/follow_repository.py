@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from ..entities.follow import Follow, FollowStatus
 
@@ -23,13 +23,17 @@ class IFollowRepository(ABC):
         pass
 
     @abstractmethod
-    def get_followers(self, user_id: int) -> List[Follow]:
-        """Get all users following a user."""
+    def get_followers_with_usernames(
+        self, user_id: int, status: Optional[FollowStatus], before_id: Optional[int], limit: int
+    ) -> List[Tuple[Follow, str]]:
+        """Get a page of a user's followers with their usernames, newest first, below the before_id cursor."""
         pass
 
     @abstractmethod
-    def get_following(self, user_id: int) -> List[Follow]:
-        """Get all users a user is following."""
+    def get_following_with_usernames(
+        self, user_id: int, status: Optional[FollowStatus], before_id: Optional[int], limit: int
+    ) -> List[Tuple[Follow, str]]:
+        """Get a page of the users a user follows with their usernames, newest first, below the before_id cursor."""
         pass
 
     @abstractmethod
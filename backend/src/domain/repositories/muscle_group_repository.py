@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 
 from ..entities.muscle_group import MuscleGroup
 
@@ -17,6 +17,11 @@ class IMuscleGroupRepository(ABC):
         """Get muscle group by ID."""
         pass
 
+    @abstractmethod
+    def get_many(self, muscle_group_ids: Iterable[int]) -> Dict[int, MuscleGroup]:
+        """Get muscle groups by IDs in one query, mapped by ID (missing IDs are omitted)."""
+        pass
+
     @abstractmethod
     def get_all(self, include_system: bool = True) -> List[MuscleGroup]:
         """Get all muscle groups."""
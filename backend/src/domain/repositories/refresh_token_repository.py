@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from ..entities.refresh_token import RefreshToken
+
+
+class IRefreshTokenRepository(ABC):
+    """Interface for RefreshToken repository (Port)."""
+
+    @abstractmethod
+    def create(self, refresh_token: RefreshToken) -> RefreshToken:
+        """Store a new refresh token."""
+        pass
+
+    @abstractmethod
+    def get_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """Get refresh token by the hash of its value."""
+        pass
+
+    @abstractmethod
+    def rotate(self, token_id: int, rotated_at: datetime) -> bool:
+        """Mark a token as exchanged; False if it was already rotated or revoked."""
+        pass
+
+    @abstractmethod
+    def revoke_session(self, session_id: str, revoked_at: datetime) -> None:
+        """Revoke every token of a login session."""
+        pass
+
+    @abstractmethod
+    def delete_expired(self, user_id: int, now: datetime) -> None:
+        """Delete a user's expired tokens."""
+        pass
+
+    @abstractmethod
+    def get_revoked_sessions(self, since: datetime) -> List[Tuple[str, datetime]]:
+        """Session IDs revoked since the given time, with their revocation time."""
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Optional, List, Sequence, Tuple
 
 from ..entities.training_comment import TrainingComment
 
@@ -28,8 +29,13 @@ class ITrainingCommentRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_training(self, training_id: int) -> List[TrainingComment]:
-        """Get all comments for a training."""
+    def get_by_training_with_usernames(
+        self, training_id: int, after: Optional[Tuple[datetime, int]], limit: int
+    ) -> List[Tuple[TrainingComment, str]]:
+        """Get a page of a training's comments with their authors' usernames, oldest first, after the (created_at, id) cursor."""
         pass
 
-
+    @abstractmethod
+    def count_by_trainings(self, training_ids: Sequence[int]) -> Dict[int, int]:
+        """Get the comment count per training, for trainings with comments."""
+        pass
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..entities.training_import import TrainingImport
+
+
+class ITrainingImportRepository(ABC):
+    """Interface for TrainingImport repository (Port)."""
+
+    @abstractmethod
+    def create(self, training_import: TrainingImport) -> TrainingImport:
+        """Create a new import job."""
+        pass
+
+    @abstractmethod
+    def get_by_id(self, import_id: int) -> Optional[TrainingImport]:
+        """Get import job by ID."""
+        pass
+
+    @abstractmethod
+    def update(self, training_import: TrainingImport) -> TrainingImport:
+        """Update import job status and progress."""
+        pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List, Sequence
 
-from ..entities.training_reaction import TrainingReaction
+from ..entities.training_reaction import ReactionSummary, TrainingReaction
 
 
 class ITrainingReactionRepository(ABC):
@@ -27,4 +27,7 @@ class ITrainingReactionRepository(ABC):
         """Get all reactions for a training."""
         pass
 
-
+    @abstractmethod
+    def get_summaries(self, training_ids: Sequence[int], user_id: int) -> Dict[int, ReactionSummary]:
+        """Get reaction counts by type and the user's reaction per training, for trainings with reactions."""
+        pass
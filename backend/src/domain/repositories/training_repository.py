@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from datetime import datetime
 
-from ..entities.training import Training
+from ..entities.training import Training, TrainingSummary
 from ..entities.implementation import Implementation
 
 
@@ -14,6 +14,11 @@ class ITrainingRepository(ABC):
         """Create a new training."""
         pass
 
+    @abstractmethod
+    def bulk_create(self, trainings: List[Training]) -> int:
+        """Insert many trainings with their implementations and sets, return the number inserted."""
+        pass
+
     @abstractmethod
     def get_by_id(self, training_id: int) -> Optional[Training]:
         """Get training by ID."""
@@ -29,6 +34,16 @@ class ITrainingRepository(ABC):
         """Get all trainings for a user, optionally filtered by date range."""
         pass
 
+    @abstractmethod
+    def get_summaries(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[TrainingSummary]:
+        """Get per-training totals for a user without loading implementations and sets."""
+        pass
+
     @abstractmethod
     def update(self, training: Training) -> Training:
         """Update training."""
@@ -39,6 +54,11 @@ class ITrainingRepository(ABC):
         """Delete training."""
         pass
 
+    @abstractmethod
+    def restore_if_archived(self, training_id: int) -> bool:
+        """Make sure the training is in the hot table (restoring it from the archive), return whether it exists."""
+        pass
+
     @abstractmethod
     def get_last_exercise_implementation(
         self, user_id: int, exercise_id: int
@@ -47,8 +67,8 @@ class ITrainingRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_share_token(self, share_token: str) -> Optional[Training]:
-        """Get training by share token."""
+    def archive_completed_before(self, cutoff: datetime, limit: int) -> int:
+        """Move up to `limit` completed trainings older than cutoff to cold storage, return the number moved."""
         pass
 
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 
 from ..entities.user import User
 
@@ -17,6 +17,11 @@ class IUserRepository(ABC):
         """Get user by ID."""
         pass
 
+    @abstractmethod
+    def get_many(self, user_ids: Iterable[int]) -> Dict[int, User]:
+        """Get users by IDs in one query, mapped by ID (missing IDs are omitted)."""
+        pass
+
     @abstractmethod
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
@@ -27,6 +32,13 @@ class IUserRepository(ABC):
         """Update user."""
         pass
 
+    @abstractmethod
+    def update_measurements(
+        self, user_id: int, weight: Optional[float] = None, height: Optional[float] = None
+    ) -> None:
+        """Set the user's current weight and/or height (None leaves a value unchanged)."""
+        pass
+
     @abstractmethod
     def delete(self, user_id: int) -> None:
         """Delete user."""
@@ -350,10 +350,15 @@ class AnalyticsService:
 
         muscle_group_volume: Dict[int, float] = defaultdict(float)
 
+        # Get all exercises used in these trainings in one batch
+        exercises = exercise_repository.get_many(
+            impl.exercise_id for training in completed_trainings for impl in training.implementations
+        )
+
         for training in completed_trainings:
             for impl in training.implementations:
                 # Get exercise to find muscle groups
-                exercise = exercise_repository.get_by_id(impl.exercise_id)
+                exercise = exercises.get(impl.exercise_id)
                 if exercise:
                     # Calculate volume for this implementation
                     volume = AnalyticsService.calculate_volume(impl.sets)
@@ -387,10 +392,15 @@ class AnalyticsService:
 
         muscle_group_frequency: Dict[int, set] = defaultdict(set)
 
+        # Get all exercises used in these trainings in one batch
+        exercises = exercise_repository.get_many(
+            impl.exercise_id for training in completed_trainings for impl in training.implementations
+        )
+
         for training in completed_trainings:
             training_date = training.date_time.date() if isinstance(training.date_time, datetime) else training.date_time
             for impl in training.implementations:
-                exercise = exercise_repository.get_by_id(impl.exercise_id)
+                exercise = exercises.get(impl.exercise_id)
                 if exercise:
                     for muscle_group_id in exercise.muscle_group_ids:
                         # Use set to count unique training dates per muscle group
@@ -0,0 +1,3 @@
+from .training_codec import encode_training, decode_training
+
+__all__ = ["encode_training", "decode_training"]
@@ -0,0 +1,103 @@
+import json
+import zlib
+from datetime import datetime
+from typing import Any, Dict
+
+from src.domain.entities.training import Training, TrainingStatus
+from src.domain.entities.implementation import Implementation
+from src.domain.entities.set import Set
+from src.domain.value_objects.weight import Weight
+from src.domain.value_objects.reps import Reps
+from src.domain.value_objects.rest_time import RestTime
+from src.domain.value_objects.duration import Duration
+from src.domain.value_objects.rpe import RPE
+
+# Bump when the payload layout changes; decode_training checks it
+PAYLOAD_VERSION = 1
+
+
+def encode_training(training: Training) -> bytes:
+    """Serialize a training with implementations and sets to compressed JSON."""
+    payload: Dict[str, Any] = {
+        "v": PAYLOAD_VERSION,
+        "id": training.id,
+        "user_id": training.user_id,
+        "training_template_id": training.training_template_id,
+        "date_time": training.date_time.isoformat(),
+        "duration": training.duration,
+        "notes": training.notes,
+        "status": training.status.value,
+        "created_at": training.created_at.isoformat(),
+        "updated_at": training.updated_at.isoformat(),
+        "exercise_count": training.exercise_count,
+        "set_count": training.set_count,
+        "total_volume": training.total_volume,
+        "top_weight": training.top_weight,
+        # Implementations as [exercise_id, order_index, sets], sets as
+        # [order_index, weight, reps, rest_time, duration, rpe]
+        "implementations": [
+            [
+                impl.exercise_id,
+                impl.order_index,
+                [
+                    [
+                        s.order_index,
+                        float(s.weight.value),
+                        int(s.reps.value),
+                        int(s.rest_time.value) if s.rest_time else None,
+                        int(s.duration.value) if s.duration else None,
+                        int(s.rpe.value) if s.rpe else None,
+                    ]
+                    for s in impl.sets
+                ],
+            ]
+            for impl in training.implementations
+        ],
+    }
+    return zlib.compress(json.dumps(payload, separators=(",", ":")).encode())
+
+
+def decode_training(data: bytes) -> Training:
+    """Rebuild a training entity from an archive payload (implementation and set ids are not kept)."""
+    payload = json.loads(zlib.decompress(data))
+    if payload.get("v") != PAYLOAD_VERSION:
+        raise ValueError(f"Unsupported training archive payload version: {payload.get('v')}")
+
+    implementations = [
+        Implementation(
+            id=None,
+            training_id=payload["id"],
+            exercise_id=exercise_id,
+            order_index=order_index,
+            sets=[
+                Set(
+                    id=None,
+                    implementation_id=0,
+                    order_index=set_order_index,
+                    weight=Weight(weight),
+                    reps=Reps(reps),
+                    rest_time=RestTime.optional(rest_time),
+                    duration=Duration.optional(duration),
+                    rpe=RPE.optional(rpe),
+                )
+                for set_order_index, weight, reps, rest_time, duration, rpe in sets
+            ],
+        )
+        for exercise_id, order_index, sets in payload["implementations"]
+    ]
+    return Training(
+        id=payload["id"],
+        user_id=payload["user_id"],
+        training_template_id=payload["training_template_id"],
+        date_time=datetime.fromisoformat(payload["date_time"]),
+        duration=payload["duration"],
+        notes=payload["notes"],
+        status=TrainingStatus(payload["status"]),
+        created_at=datetime.fromisoformat(payload["created_at"]),
+        updated_at=datetime.fromisoformat(payload["updated_at"]),
+        implementations=implementations,
+        exercise_count=payload["exercise_count"],
+        set_count=payload["set_count"],
+        total_volume=payload["total_volume"],
+        top_weight=payload["top_weight"],
+    )
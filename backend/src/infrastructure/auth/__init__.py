@@ -1,9 +1,17 @@
-from .jwt_service import JWTService
+from .jwt_service import JWTService, VerifiedTokenCache, verified_token_cache
 from .password_service import PasswordService
+from .principal_cache import PrincipalCache, principal_cache
+from .refresh_token_service import RefreshTokenService
+from .revocation_filter import RevocationFilter, revocation_filter
 
-__all__ = ["JWTService", "PasswordService"]
-
-
-
-
-
+__all__ = [
+    "JWTService",
+    "VerifiedTokenCache",
+    "verified_token_cache",
+    "PasswordService",
+    "PrincipalCache",
+    "principal_cache",
+    "RefreshTokenService",
+    "RevocationFilter",
+    "revocation_filter",
+]
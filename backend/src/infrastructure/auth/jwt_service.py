@@ -1,11 +1,65 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 from jose import JWTError, jwt
 
 from src.infrastructure.settings import settings
 
 
+class VerifiedTokenCache:
+    """
+    Bounded, per-process LRU of token digest -> payload of a token that passed
+    verification, kept until the token's exp claim.
+
+    A dashboard load sends many requests with one token within seconds; all
+    but the first skip the signature check and JSON decoding. Only valid
+    tokens are cached, so garbage tokens cannot evict real ones.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes) -> Optional[dict]:
+        """Cached payload, None on a miss or once the token has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: bytes, payload: dict) -> None:
+        expires_at = payload.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache(settings.JWT_CACHE_MAX_SIZE)
+
+
 class JWTService:
     """Service for JWT token generation and verification."""
 
@@ -23,14 +77,14 @@ class JWTService:
 
     @staticmethod
     def verify_token(token: str) -> Optional[dict]:
-        """Verify and decode a JWT token."""
-        try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            return payload
-        except JWTError:
-            return None
-
-
-
-
-
+        """Verify and decode a JWT token (repeat verifications come from verified_token_cache)."""
+        key = verified_token_cache.key(token)
+        payload = verified_token_cache.get(key)
+        if payload is None:
+            try:
+                payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            except JWTError:
+                return None
+            verified_token_cache.put(key, payload)
+        # Callers get their own copy, so the cached payload stays as verified
+        return dict(payload)
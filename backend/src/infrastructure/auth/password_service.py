@@ -1,13 +1,14 @@
 import bcrypt
 import hashlib
 
+from src.infrastructure.settings import settings
+
 
 class PasswordService:
     """Service for password hashing and verification using bcrypt."""
 
-    # Bcrypt cost factor (rounds = 2^cost)
-    # 12 is a good balance between security and performance
-    BCRYPT_ROUNDS = 12
+    # Bcrypt cost factor (rounds = 2^cost), PASSWORD_HASH_ROUNDS (12 by default)
+    BCRYPT_ROUNDS = settings.PASSWORD_HASH_ROUNDS
     # Bcrypt has a 72-byte limit, so we use SHA-256 for longer passwords
     BCRYPT_MAX_LENGTH = 72
 
@@ -53,6 +54,15 @@ class PasswordService:
         # Return as string (bcrypt hash is always ASCII)
         return hashed.decode('utf-8')
 
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """Whether the hash was made with a cost factor other than the current one."""
+        try:
+            # bcrypt hashes look like $2b$12$<salt and hash>
+            return int(hashed_password.split('$')[2]) != PasswordService.BCRYPT_ROUNDS
+        except (IndexError, ValueError):
+            return False
+
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a password against a hash."""
@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.infrastructure.settings import settings
+
+
+class PrincipalCache:
+    """
+    Bounded, per-process TTL cache of authenticated principals: user id ->
+    password version of a user known to exist.
+
+    Lets the auth dependencies skip the user lookup on most requests. Writes
+    through UserRepositoryImpl invalidate their user right away; changes made
+    by another worker are seen once the entry expires.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, Tuple[int, float]]" = OrderedDict()
+
+    def get(self, user_id: int) -> Optional[int]:
+        """Cached password version of the user, None on a miss or an expired entry."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            version, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return version
+
+    def put(self, user_id: int, version: int) -> None:
+        """Remember that the user exists with this password version."""
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (version, time.monotonic() + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Forget the user (deleted, or password changed)."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_MAX_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
@@ -0,0 +1,18 @@
+import hashlib
+import secrets
+from typing import Tuple
+
+
+class RefreshTokenService:
+    """Service for opaque refresh token generation and hashing."""
+
+    @staticmethod
+    def generate() -> Tuple[str, str]:
+        """New refresh token and its hash."""
+        token = secrets.token_urlsafe(32)
+        return token, RefreshTokenService.hash_token(token)
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """sha256 of the token: tokens are 256 random bits, so a slow hash like bcrypt adds nothing."""
+        return hashlib.sha256(token.encode()).hexdigest()
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from anyio import to_thread
+
+from src.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationFilter:
+    """
+    Per-process set of revoked login sessions whose access tokens may not have
+    expired yet, so checking an access token's "sid" claim costs no query.
+
+    Revocations made by this worker are added right away; those made by other
+    workers arrive with the periodic sync. Entries older than the access token
+    lifetime are dropped, since every token of the session has expired by then.
+    """
+
+    def __init__(self, retention_seconds: float, sync_interval_seconds: float):
+        self.retention = timedelta(seconds=retention_seconds)
+        self.sync_interval = sync_interval_seconds
+        self._lock = threading.Lock()
+        self._revoked: Dict[str, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def is_revoked(self, session_id: str) -> bool:
+        return session_id in self._revoked
+
+    def add(self, session_id: str, revoked_at: datetime) -> None:
+        """Record a session revoked by this worker."""
+        with self._lock:
+            self._revoked[session_id] = revoked_at
+
+    def merge(self, sessions: Iterable[Tuple[str, datetime]], now: datetime) -> None:
+        """Add synced revocations and drop those older than the retention."""
+        cutoff = now - self.retention
+        with self._lock:
+            revoked = {sid: at for sid, at in self._revoked.items() if at >= cutoff}
+            revoked.update((sid, at) for sid, at in sessions if at >= cutoff)
+            self._revoked = revoked
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revoked.clear()
+
+    def start(self, load: Callable[[datetime], Iterable[Tuple[str, datetime]]]) -> None:
+        """Sync from load(since) now and every sync interval, on the running event loop.
+
+        load is blocking and runs in the threadpool.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._sync(load))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _sync(self, load: Callable[[datetime], Iterable[Tuple[str, datetime]]]) -> None:
+        while True:
+            now = datetime.utcnow()
+            try:
+                sessions = await to_thread.run_sync(lambda: list(load(now - self.retention)))
+                self.merge(sessions, now)
+            except Exception:
+                logger.exception("Revoked session sync failed, keeping the current filter")
+            await asyncio.sleep(self.sync_interval)
+
+
+revocation_filter = RevocationFilter(
+    retention_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    sync_interval_seconds=settings.REVOCATION_SYNC_INTERVAL_SECONDS,
+)
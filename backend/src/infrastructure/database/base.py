@@ -3,7 +3,10 @@ from sqlalchemy.orm import DeclarativeBase
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
+
+    # Fetch server-generated defaults (created_at, updated_at) on flush
+    # instead of refreshing each row after insert/update.
+    __mapper_args__ = {"eager_defaults": True}
 
 
 
@@ -12,6 +12,11 @@ from .set_model import SetModel
 from .follow_model import FollowModel
 from .training_reaction_model import TrainingReactionModel
 from .training_comment_model import TrainingCommentModel
+from .training_import_model import TrainingImportModel
+from .training_archive_model import TrainingArchiveModel
+from .rate_limit_bucket_model import RateLimitBucketModel
+from .refresh_token_model import RefreshTokenModel
+from .feed_entry_model import FeedEntryModel
 
 __all__ = [
     "UserModel",
@@ -28,6 +33,11 @@ __all__ = [
     "FollowModel",
     "TrainingReactionModel",
     "TrainingCommentModel",
+    "TrainingImportModel",
+    "TrainingArchiveModel",
+    "RateLimitBucketModel",
+    "RefreshTokenModel",
+    "FeedEntryModel",
 ]
 
 
@@ -15,7 +15,7 @@ class ExerciseModel(Base):
     description = Column(String, nullable=True)
     image_path = Column(String, nullable=True)
     is_custom = Column(Boolean, default=False, nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -25,16 +25,19 @@ class ExerciseModel(Base):
         "ExerciseMuscleGroupModel",
         back_populates="exercise",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     implementation_templates = relationship(
         "ImplementationTemplateModel",
         back_populates="exercise",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     implementations = relationship(
         "ImplementationModel",
         back_populates="exercise",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
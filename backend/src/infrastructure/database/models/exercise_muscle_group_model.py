@@ -10,7 +10,7 @@ class ExerciseMuscleGroupModel(Base):
     __tablename__ = "exercise_muscle_groups"
 
     exercise_id = Column(Integer, ForeignKey("exercises.id", ondelete="CASCADE"), primary_key=True)
-    muscle_group_id = Column(Integer, ForeignKey("muscle_groups.id", ondelete="CASCADE"), primary_key=True)
+    muscle_group_id = Column(Integer, ForeignKey("muscle_groups.id", ondelete="CASCADE"), primary_key=True, index=True)
 
     # Relationships
     exercise = relationship("ExerciseModel", back_populates="muscle_group_associations")
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
+
+from src.infrastructure.database.base import Base
+
+
+class FeedEntryModel(Base):
+    """SQLAlchemy model for FeedEntry entity (naive UTC times)."""
+
+    __tablename__ = "feed_entries"
+
+    id = Column(Integer, primary_key=True)
+    # NULL for the single shared entry of an author above FEED_FANOUT_MAX_FOLLOWERS
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    author_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # Indexed for the cascade on training delete and for withdrawing entries
+    training_id = Column(Integer, ForeignKey("trainings.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False)
+
+    # A user's feed paged by id; shared entries of followed authors paged the same way
+    __table_args__ = (
+        Index("ix_feed_entries_user_id_id", "user_id", "id"),
+        Index(
+            "ix_feed_entries_author_id_id_shared",
+            "author_id",
+            "id",
+            postgresql_where=user_id.is_(None),
+            sqlite_where=user_id.is_(None),
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint, Enum as SQLEnum
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, UniqueConstraint, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -24,6 +24,9 @@ class FollowModel(Base):
     # Unique constraint: user cannot follow the same user twice
     __table_args__ = (
         UniqueConstraint('follower_id', 'following_id', name='uq_follower_following'),
+        # Follower/following pages (newest first by id), optionally filtered by status
+        Index('ix_follows_following_id_status_id', 'following_id', 'status', 'id'),
+        Index('ix_follows_follower_id_status_id', 'follower_id', 'status', 'id'),
     )
 
 
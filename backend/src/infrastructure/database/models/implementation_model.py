@@ -10,8 +10,8 @@ class ImplementationModel(Base):
     __tablename__ = "implementations"
 
     id = Column(Integer, primary_key=True, index=True)
-    training_id = Column(Integer, ForeignKey("trainings.id", ondelete="CASCADE"), nullable=False)
-    exercise_id = Column(Integer, ForeignKey("exercises.id", ondelete="CASCADE"), nullable=False)
+    training_id = Column(Integer, ForeignKey("trainings.id", ondelete="CASCADE"), nullable=False, index=True)
+    exercise_id = Column(Integer, ForeignKey("exercises.id", ondelete="CASCADE"), nullable=False, index=True)
     order_index = Column(Integer, nullable=False)
 
     # Relationships
@@ -21,6 +21,7 @@ class ImplementationModel(Base):
         "SetModel",
         back_populates="implementation",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="SetModel.order_index",
     )
 
@@ -10,7 +10,7 @@ class ImplementationTemplateModel(Base):
     __tablename__ = "implementation_templates"
 
     id = Column(Integer, primary_key=True, index=True)
-    training_template_id = Column(Integer, ForeignKey("training_templates.id", ondelete="CASCADE"), nullable=False)
+    training_template_id = Column(Integer, ForeignKey("training_templates.id", ondelete="CASCADE"), nullable=False, index=True)
     exercise_id = Column(Integer, ForeignKey("exercises.id", ondelete="CASCADE"), nullable=False)
     order_index = Column(Integer, nullable=False)
 
@@ -21,6 +21,7 @@ class ImplementationTemplateModel(Base):
         "SetTemplateModel",
         back_populates="implementation_template",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="SetTemplateModel.order_index",
     )
 
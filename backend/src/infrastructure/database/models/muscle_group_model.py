@@ -21,6 +21,7 @@ class MuscleGroupModel(Base):
         "ExerciseMuscleGroupModel",
         back_populates="muscle_group",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -0,0 +1,14 @@
+from sqlalchemy import Boolean, Column, Float, String
+
+from src.infrastructure.database.base import Base
+
+
+class RateLimitBucketModel(Base):
+    """SQLAlchemy model for shared rate limit token buckets (one row per client and route group)."""
+
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(255), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(Float, nullable=False)  # Unix time in seconds, for refill arithmetic in SQL
+    allowed = Column(Boolean, nullable=False)  # Whether the last request took a token
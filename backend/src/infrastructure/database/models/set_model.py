@@ -10,7 +10,7 @@ class SetModel(Base):
     __tablename__ = "sets"
 
     id = Column(Integer, primary_key=True, index=True)
-    implementation_id = Column(Integer, ForeignKey("implementations.id", ondelete="CASCADE"), nullable=False)
+    implementation_id = Column(Integer, ForeignKey("implementations.id", ondelete="CASCADE"), nullable=False, index=True)
     order_index = Column(Integer, nullable=False)
     weight = Column(Numeric(10, 2), nullable=False)
     reps = Column(Integer, nullable=False)
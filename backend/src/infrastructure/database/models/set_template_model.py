@@ -11,7 +11,7 @@ class SetTemplateModel(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     implementation_template_id = Column(
-        Integer, ForeignKey("implementation_templates.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("implementation_templates.id", ondelete="CASCADE"), nullable=False, index=True
     )
     order_index = Column(Integer, nullable=False)
     weight = Column(Numeric(10, 2), nullable=True)
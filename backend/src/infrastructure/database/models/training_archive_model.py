@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, LargeBinary
+from sqlalchemy.sql import func
+
+from src.infrastructure.database.base import Base
+
+
+class TrainingArchiveModel(Base):
+    """SQLAlchemy model for archived trainings (cold storage, one compressed JSON blob per training)."""
+
+    __tablename__ = "training_archive"
+
+    # Original trainings.id, so archived trainings keep their ids
+    training_id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    date_time = Column(DateTime(timezone=True), nullable=False)
+    payload = Column(LargeBinary, nullable=False)  # zlib-compressed JSON of the training with sets
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Archived trainings of a user by date (history ranges, PR rebuilds)
+    __table_args__ = (
+        Index("ix_training_archive_user_id_date_time", "user_id", "date_time"),
+    )
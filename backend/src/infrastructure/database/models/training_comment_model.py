@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -21,4 +21,7 @@ class TrainingCommentModel(Base):
     training = relationship("TrainingModel", back_populates="comments")
     user = relationship("UserModel", back_populates="training_comments")
 
-
+    # Comments of a training in chronological order, paged by (created_at, id)
+    __table_args__ = (
+        Index("ix_training_comments_training_id_created_at_id", "training_id", "created_at", "id"),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, Enum as SQLEnum
+from sqlalchemy.sql import func
+
+from src.infrastructure.database.base import Base
+from src.domain.entities.training_import import ImportStatus, ImportFormat
+
+
+class TrainingImportModel(Base):
+    """SQLAlchemy model for TrainingImport entity (bulk import job progress)."""
+
+    __tablename__ = "training_imports"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    file_format = Column(SQLEnum(ImportFormat, native_enum=True), nullable=False)
+    status = Column(SQLEnum(ImportStatus, native_enum=True), nullable=False, default=ImportStatus.PENDING)
+    processed_rows = Column(Integer, nullable=False, default=0, server_default="0")
+    imported_trainings = Column(Integer, nullable=False, default=0, server_default="0")
+    skipped_rows = Column(Integer, nullable=False, default=0, server_default="0")
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
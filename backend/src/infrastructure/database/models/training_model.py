@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Numeric, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -19,6 +19,11 @@ class TrainingModel(Base):
     notes = Column(String, nullable=True)
     status = Column(SQLEnum(TrainingStatus, native_enum=True), nullable=False, default=TrainingStatus.PLANNED)
     share_token = Column(String, nullable=True, unique=True, index=True)  # Token for public sharing
+    # Denormalized totals, recomputed by TrainingRepositoryImpl on create/update
+    exercise_count = Column(Integer, nullable=False, default=0, server_default="0")
+    set_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_volume = Column(Numeric(12, 2), nullable=False, default=0, server_default="0")  # Sum of weight * reps
+    top_weight = Column(Numeric(10, 2), nullable=True)  # Heaviest set weight
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -29,9 +34,13 @@ class TrainingModel(Base):
         "ImplementationModel",
         back_populates="training",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="ImplementationModel.order_index",
     )
-    reactions = relationship("TrainingReactionModel", back_populates="training", cascade="all, delete-orphan")
-    comments = relationship("TrainingCommentModel", back_populates="training", cascade="all, delete-orphan", order_by="TrainingCommentModel.created_at")
-
+    reactions = relationship("TrainingReactionModel", back_populates="training", cascade="all, delete-orphan", passive_deletes=True)
+    comments = relationship("TrainingCommentModel", back_populates="training", cascade="all, delete-orphan", passive_deletes=True, order_by="TrainingCommentModel.created_at")
 
+    # User's trainings listed/filtered by date (get_all, get_summaries, analytics)
+    __table_args__ = (
+        Index("ix_trainings_user_id_date_time", "user_id", "date_time"),
+    )
@@ -13,7 +13,7 @@ class TrainingTemplateModel(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -23,9 +23,10 @@ class TrainingTemplateModel(Base):
         "ImplementationTemplateModel",
         back_populates="training_template",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="ImplementationTemplateModel.order_index",
     )
-    trainings = relationship("TrainingModel", back_populates="training_template")
+    trainings = relationship("TrainingModel", back_populates="training_template", passive_deletes=True)
 
 
 
@@ -0,0 +1,62 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool recording how long each checkout waits for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=1000)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._lock:
+                self._checkouts += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+                self._waits.append(waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current pool usage and checkout wait times (recent window for p95)."""
+        with self._lock:
+            waits = sorted(self._waits)
+            checkouts, timeouts = self._checkouts, self._timeouts
+            total_wait, max_wait = self._total_wait, self._max_wait
+        return {
+            "pool_size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            # Connections opened beyond pool_size (negative while the pool is not yet full)
+            "overflow": self.overflow(),
+            "max_overflow": self._max_overflow,
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_ms": {
+                "avg": round(total_wait / checkouts * 1000, 3) if checkouts else None,
+                "p95": round(waits[min(int(len(waits) * 0.95), len(waits) - 1)] * 1000, 3) if waits else None,
+                "max": round(max_wait * 1000, 3) if checkouts else None,
+            },
+        }
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """InstrumentedQueuePool for asyncio engines (waits on an asyncio-compatible queue)."""
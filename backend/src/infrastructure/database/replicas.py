@@ -0,0 +1,66 @@
+import hashlib
+import hmac
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Set
+
+# Users whose writes were committed during the current request (see track_writes)
+_committed_users: ContextVar[Optional[Set[int]]] = ContextVar("committed_users", default=None)
+
+
+@contextmanager
+def track_writes() -> Iterator[Set[int]]:
+    """
+    Collect the users whose writes are committed inside the block.
+
+    The set is shared with the threadpool, which runs sync endpoints in a copy
+    of the request's context.
+    """
+    users: Set[int] = set()
+    token = _committed_users.set(users)
+    try:
+        yield users
+    finally:
+        _committed_users.reset(token)
+
+
+def record_write(user_id: int) -> None:
+    """Note a committed write of the user (no-op outside track_writes)."""
+    users = _committed_users.get()
+    if users is not None:
+        users.add(user_id)
+
+
+class ReadYourWritesCookie:
+    """
+    Signed marker the client carries for a few seconds after its own write, so
+    its reads stay on the primary until replicas have caught up. Nothing is
+    kept server-side, so it holds across workers and hosts.
+
+    The value is "<user_id>.<until, unix ms>.<HMAC-SHA256>".
+    """
+
+    NAME = "read_primary_until"
+
+    def __init__(self, secret: str, window_seconds: float):
+        self.window = window_seconds
+        self._key = secret.encode()
+
+    def issue(self, user_id: int) -> str:
+        """Cookie value pinning the user's reads to the primary for the next window seconds."""
+        payload = f"{user_id}.{int((time.time() + self.window) * 1000)}"
+        return f"{payload}.{self._sign(payload)}"
+
+    def is_recent(self, value: Optional[str], user_id: Optional[int]) -> bool:
+        """Whether the value is a valid, unexpired marker of the user's write."""
+        if not value or user_id is None:
+            return False
+        payload, _, signature = value.rpartition(".")
+        cookie_user, _, until = payload.partition(".")
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            return False
+        return cookie_user == str(user_id) and until.isdigit() and int(until) > time.time() * 1000
+
+    def _sign(self, payload: str) -> str:
+        return hmac.new(self._key, payload.encode(), hashlib.sha256).hexdigest()
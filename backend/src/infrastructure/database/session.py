@@ -1,30 +1,216 @@
-from sqlalchemy import create_engine
+import itertools
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Sequence
 
 from src.infrastructure.database.base import Base
 from src.infrastructure.database.models import *  # noqa: F401, F403
+from src.infrastructure.database.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from src.infrastructure.database.replicas import record_write
 
 
 class Database:
-    def __init__(self, database_url: str):
-        self.engine = create_engine(database_url)
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        statement_timeout_ms: int = 0,
+        replica_urls: Sequence[str] = (),
+    ):
+        engine_options = dict(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            statement_timeout_ms=statement_timeout_ms,
+        )
+        self.engine = self._create_engine(database_url, **engine_options)
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
+        # Sessions record their user's commits so that user's reads can stay on the primary
+        event.listen(self.SessionLocal, "after_commit", self._record_write)
+
+        self.replica_engines = [self._create_engine(url, **engine_options) for url in replica_urls]
+        self._replica_sessions = itertools.cycle(
+            [
+                sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                for engine in self.replica_engines
+            ]
+        )
+
+        # Async engines (asyncpg / aiosqlite) for the read endpoints served on the event loop,
+        # with their own pools of the same size
+        self.async_engine = self._create_async_engine(database_url, **engine_options)
+        self.AsyncSessionLocal = async_sessionmaker(
+            self.async_engine, autoflush=False, expire_on_commit=False
+        )
+        self.async_replica_engines = [
+            self._create_async_engine(url, **engine_options) for url in replica_urls
+        ]
+        self._async_replica_sessions = itertools.cycle(
+            [
+                async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+                for engine in self.async_replica_engines
+            ]
+        )
+
+    @staticmethod
+    def _create_engine(
+        database_url: str,
+        pool_size: int,
+        max_overflow: int,
+        pool_timeout: float,
+        pool_recycle: int,
+        pool_pre_ping: bool,
+        statement_timeout_ms: int,
+    ) -> Engine:
+        url = make_url(database_url)
+        if url.get_backend_name() == "sqlite":
+            # Local development: keep SQLAlchemy's default SQLite pooling
+            return create_engine(database_url, pool_pre_ping=pool_pre_ping)
+
+        connect_args: Dict[str, Any] = {}
+        if statement_timeout_ms and url.get_backend_name() == "postgresql":
+            connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+        return create_engine(
+            database_url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args=connect_args,
+        )
+
+    @staticmethod
+    def _async_url(database_url: str) -> URL:
+        """The same database addressed through its asyncio driver."""
+        url = make_url(database_url)
+        backend = url.get_backend_name()
+        if backend == "postgresql":
+            return url.set(drivername="postgresql+asyncpg")
+        if backend == "sqlite":
+            return url.set(drivername="sqlite+aiosqlite")
+        return url
+
+    @classmethod
+    def _create_async_engine(
+        cls,
+        database_url: str,
+        pool_size: int,
+        max_overflow: int,
+        pool_timeout: float,
+        pool_recycle: int,
+        pool_pre_ping: bool,
+        statement_timeout_ms: int,
+    ) -> AsyncEngine:
+        url = cls._async_url(database_url)
+        if url.get_backend_name() == "sqlite":
+            return create_async_engine(url, pool_pre_ping=pool_pre_ping)
+
+        connect_args: Dict[str, Any] = {}
+        if statement_timeout_ms and url.get_backend_name() == "postgresql":
+            connect_args["server_settings"] = {"statement_timeout": str(statement_timeout_ms)}
+        return create_async_engine(
+            url,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args=connect_args,
+        )
+
+    @classmethod
+    def from_settings(cls, settings) -> "Database":
+        """Create the database with the pool and replicas configured in settings."""
+        return cls(
+            settings.DATABASE_URL,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+            pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+            statement_timeout_ms=settings.DATABASE_STATEMENT_TIMEOUT_MS,
+            replica_urls=[url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()],
+        )
+
+    def pool_status(self) -> Dict[str, Any]:
+        """Connection pool usage and checkout wait times, per replica as well."""
+        status = self._engine_pool_status(self.engine)
+        status["async"] = self._engine_pool_status(self.async_engine.sync_engine)
+        if self.replica_engines:
+            status["replicas"] = [self._engine_pool_status(engine) for engine in self.replica_engines]
+            status["async_replicas"] = [
+                self._engine_pool_status(engine.sync_engine) for engine in self.async_replica_engines
+            ]
+        return status
+
+    @staticmethod
+    def _engine_pool_status(engine: Engine) -> Dict[str, Any]:
+        pool = engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            return pool.stats()
+        return {"status": pool.status()}
 
     def create_tables(self):
         """Create all tables."""
         Base.metadata.create_all(bind=self.engine)
 
     def get_session(self) -> Generator[Session, None, None]:
-        """Get database session."""
-        db = self.SessionLocal()
+        """Get database session (one unit of work, rolled back unless committed)."""
+        yield from self._scoped(self.SessionLocal())
+
+    def get_read_session(self) -> Generator[Session, None, None]:
+        """Get a session for read-only work: on a replica (round robin), on the primary without replicas."""
+        if not self.replica_engines:
+            yield from self.get_session()
+            return
+        yield from self._scoped(next(self._replica_sessions)())
+
+    async def get_async_read_session(self, primary: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """Async counterpart of get_read_session; primary=True skips the replicas."""
+        if primary or not self.async_replica_engines:
+            session_factory = self.AsyncSessionLocal
+        else:
+            session_factory = next(self._async_replica_sessions)
+        async with session_factory() as db:
+            yield db
+
+    async def dispose(self) -> None:
+        """Close the pooled connections of every engine."""
+        for engine in [self.engine, *self.replica_engines]:
+            engine.dispose()
+        for async_engine in [self.async_engine, *self.async_replica_engines]:
+            await async_engine.dispose()
+
+    @staticmethod
+    def _scoped(db: Session) -> Generator[Session, None, None]:
         try:
             yield db
+        except Exception:
+            db.rollback()
+            raise
         finally:
             db.close()
 
+    @staticmethod
+    def _record_write(session: Session) -> None:
+        user_id = session.info.get("user_id")
+        if user_id is not None:
+            record_write(user_id)
+
 
 # Global database instance (will be initialized in main.py)
 database: Database | None = None
@@ -37,8 +223,26 @@ def init_db(db: Database) -> None:
 
 
 def get_db() -> Generator[Session, None, None]:
-    """Dependency for FastAPI to get database session."""
+    """Dependency for FastAPI to get database session.
+
+    Repositories only flush; write endpoints call ``db.commit()`` once after
+    the use case has succeeded, so a request is a single transaction.
+    """
     if database is None:
         raise RuntimeError("Database not initialized. Call init_db() first.")
     yield from database.get_session()
 
+
+
+def get_database() -> Database:
+    """Get the initialized global database instance."""
+    if database is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return database
+
+
+def create_session() -> Session:
+    """Open a session outside of a request (background tasks); the caller closes it."""
+    if database is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return database.SessionLocal()
@@ -0,0 +1,3 @@
+from .training_file_reader import UploadTooLargeError, save_upload, read_training_rows
+
+__all__ = ["UploadTooLargeError", "save_upload", "read_training_rows"]
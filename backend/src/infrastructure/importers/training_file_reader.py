@@ -0,0 +1,71 @@
+import csv
+import json
+import os
+import tempfile
+from typing import Any, AsyncIterator, Dict, Iterator
+
+from anyio import to_thread
+
+from src.domain.entities.training_import import ImportFormat
+
+# Received chunks are buffered up to this size, so each write is one trip to a worker thread
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """The uploaded body exceeds the allowed size."""
+
+
+async def save_upload(chunks: AsyncIterator[bytes], max_bytes: int) -> str:
+    """
+    Stream an uploaded file to a temporary file chunk by chunk and return its path.
+
+    File I/O runs in worker threads to keep the event loop free. Raises
+    UploadTooLargeError (and removes the partial file) once more than
+    max_bytes have been received.
+    """
+    file = await to_thread.run_sync(
+        lambda: tempfile.NamedTemporaryFile(prefix="training-import-", delete=False)
+    )
+    try:
+        received = 0
+        buffer = bytearray()
+        async for chunk in chunks:
+            received += len(chunk)
+            if received > max_bytes:
+                raise UploadTooLargeError(f"Upload exceeds the limit of {max_bytes} bytes")
+            buffer += chunk
+            if len(buffer) >= _WRITE_BUFFER_SIZE:
+                await to_thread.run_sync(file.write, bytes(buffer))
+                buffer.clear()
+        if buffer:
+            await to_thread.run_sync(file.write, bytes(buffer))
+        await to_thread.run_sync(file.close)
+    except BaseException:
+        # Also on client disconnect or cancellation, so no partial file is left behind
+        file.close()
+        os.remove(file.name)
+        raise
+    return file.name
+
+
+def read_training_rows(path: str, file_format: ImportFormat) -> Iterator[Dict[str, Any]]:
+    """
+    Read import rows one at a time, so memory does not grow with file size.
+
+    CSV files need a header row. Malformed NDJSON lines are yielded as empty
+    rows so they are counted as skipped instead of failing the whole import.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        if file_format == ImportFormat.CSV:
+            yield from csv.DictReader(file)
+            return
+
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                row = {}
+            yield row if isinstance(row, dict) else {}
@@ -0,0 +1,57 @@
+"""add_composite_indexes_for_hot_queries
+
+Revision ID: 3c9a1f7e2b44
+Revises: 941750e54664
+Create Date: 2026-10-19 10:12:41.532187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a1f7e2b44'
+down_revision: Union[str, None] = '941750e54664'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY does not block writes on these large tables, but
+    # cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Trainings of a user ordered/filtered by date
+        op.create_index('ix_trainings_user_id_date_time', 'trainings', ['user_id', 'date_time'], unique=False, postgresql_concurrently=True)
+
+        # Foreign keys used for eager loading and cascades
+        op.create_index(op.f('ix_implementations_training_id'), 'implementations', ['training_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_implementations_exercise_id'), 'implementations', ['exercise_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_sets_implementation_id'), 'sets', ['implementation_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_exercises_user_id'), 'exercises', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_exercise_muscle_groups_muscle_group_id'), 'exercise_muscle_groups', ['muscle_group_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_training_templates_user_id'), 'training_templates', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_implementation_templates_training_template_id'), 'implementation_templates', ['training_template_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_set_templates_implementation_template_id'), 'set_templates', ['implementation_template_id'], unique=False, postgresql_concurrently=True)
+
+        # Social lookups (training_reactions.training_id is already covered by uq_training_reaction)
+        op.create_index('ix_follows_following_id_status', 'follows', ['following_id', 'status'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_follows_follower_id_status', 'follows', ['follower_id', 'status'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_training_comments_training_id_created_at', 'training_comments', ['training_id', 'created_at'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_training_comments_training_id_created_at', table_name='training_comments', postgresql_concurrently=True)
+        op.drop_index('ix_follows_follower_id_status', table_name='follows', postgresql_concurrently=True)
+        op.drop_index('ix_follows_following_id_status', table_name='follows', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_set_templates_implementation_template_id'), table_name='set_templates', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_implementation_templates_training_template_id'), table_name='implementation_templates', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_training_templates_user_id'), table_name='training_templates', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_exercise_muscle_groups_muscle_group_id'), table_name='exercise_muscle_groups', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_exercises_user_id'), table_name='exercises', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_sets_implementation_id'), table_name='sets', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_implementations_exercise_id'), table_name='implementations', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_implementations_training_id'), table_name='implementations', postgresql_concurrently=True)
+        op.drop_index('ix_trainings_user_id_date_time', table_name='trainings', postgresql_concurrently=True)
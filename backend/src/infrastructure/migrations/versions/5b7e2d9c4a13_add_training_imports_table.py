@@ -0,0 +1,45 @@
+"""add_training_imports_table
+
+Revision ID: 5b7e2d9c4a13
+Revises: 8d2e5b0c61fa
+Create Date: 2026-10-19 14:22:41.318206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2d9c4a13'
+down_revision: Union[str, None] = '8d2e5b0c61fa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('training_imports',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('file_format', sa.Enum('CSV', 'NDJSON', name='importformat'), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'COMPLETED', 'FAILED', name='importstatus'), nullable=False),
+    sa.Column('processed_rows', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('imported_trainings', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('skipped_rows', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_training_imports_id'), 'training_imports', ['id'], unique=False)
+    op.create_index(op.f('ix_training_imports_user_id'), 'training_imports', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_training_imports_user_id'), table_name='training_imports')
+    op.drop_index(op.f('ix_training_imports_id'), table_name='training_imports')
+    op.drop_table('training_imports')
+    op.execute("DROP TYPE IF EXISTS importstatus")
+    op.execute("DROP TYPE IF EXISTS importformat")
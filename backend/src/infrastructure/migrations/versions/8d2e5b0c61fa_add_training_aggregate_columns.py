@@ -0,0 +1,52 @@
+"""add_training_aggregate_columns
+
+Revision ID: 8d2e5b0c61fa
+Revises: 3c9a1f7e2b44
+Create Date: 2026-10-19 11:03:17.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e5b0c61fa'
+down_revision: Union[str, None] = '3c9a1f7e2b44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('trainings', sa.Column('exercise_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('trainings', sa.Column('set_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('trainings', sa.Column('total_volume', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False))
+    op.add_column('trainings', sa.Column('top_weight', sa.Numeric(precision=10, scale=2), nullable=True))
+
+    # Backfill totals for existing trainings
+    op.execute("""
+        UPDATE trainings t
+        SET exercise_count = agg.exercise_count,
+            set_count = agg.set_count,
+            total_volume = agg.total_volume,
+            top_weight = agg.top_weight
+        FROM (
+            SELECT i.training_id,
+                   COUNT(DISTINCT i.id) AS exercise_count,
+                   COUNT(s.id) AS set_count,
+                   COALESCE(SUM(s.weight * s.reps), 0) AS total_volume,
+                   MAX(s.weight) AS top_weight
+            FROM implementations i
+            LEFT JOIN sets s ON s.implementation_id = i.id
+            GROUP BY i.training_id
+        ) agg
+        WHERE agg.training_id = t.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('trainings', 'top_weight')
+    op.drop_column('trainings', 'total_volume')
+    op.drop_column('trainings', 'set_count')
+    op.drop_column('trainings', 'exercise_count')
@@ -0,0 +1,36 @@
+"""add_training_archive_table
+
+Revision ID: a4c81f3e9d27
+Revises: 5b7e2d9c4a13
+Create Date: 2026-10-19 16:05:12.640381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c81f3e9d27'
+down_revision: Union[str, None] = '5b7e2d9c4a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('training_archive',
+    sa.Column('training_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('date_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('training_id')
+    )
+    op.create_index('ix_training_archive_user_id_date_time', 'training_archive', ['user_id', 'date_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_training_archive_user_id_date_time', table_name='training_archive')
+    op.drop_table('training_archive')
@@ -0,0 +1,28 @@
+"""add_password_version_to_users
+
+Revision ID: a8e2f6c4d1b9
+Revises: f4c7a9e2b6d3
+Create Date: 2026-10-19 22:03:17.482915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e2f6c4d1b9'
+down_revision: Union[str, None] = 'f4c7a9e2b6d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Access tokens carry this counter instead of a fingerprint of the password
+    # hash, so rehashing a password on login keeps the user's other sessions
+    op.add_column('users', sa.Column('password_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'password_version')
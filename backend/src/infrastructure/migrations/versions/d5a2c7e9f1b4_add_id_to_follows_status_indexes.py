@@ -0,0 +1,37 @@
+"""add_id_to_follows_status_indexes
+
+Revision ID: d5a2c7e9f1b4
+Revises: c3e8f5a1d7b2
+Create Date: 2026-10-19 19:48:12.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a2c7e9f1b4'
+down_revision: Union[str, None] = 'c3e8f5a1d7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Follower/following pages are walked by id within a user (and status), so
+    # the status indexes get id as a trailing column. New ones are built before
+    # the old ones are dropped, without blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index('ix_follows_following_id_status_id', 'follows', ['following_id', 'status', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_follows_follower_id_status_id', 'follows', ['follower_id', 'status', 'id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_follows_follower_id_status', table_name='follows', postgresql_concurrently=True)
+        op.drop_index('ix_follows_following_id_status', table_name='follows', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_follows_following_id_status', 'follows', ['following_id', 'status'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_follows_follower_id_status', 'follows', ['follower_id', 'status'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_follows_follower_id_status_id', table_name='follows', postgresql_concurrently=True)
+        op.drop_index('ix_follows_following_id_status_id', table_name='follows', postgresql_concurrently=True)
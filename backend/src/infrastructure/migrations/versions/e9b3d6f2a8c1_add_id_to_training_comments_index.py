@@ -0,0 +1,32 @@
+"""add_id_to_training_comments_index
+
+Revision ID: e9b3d6f2a8c1
+Revises: d5a2c7e9f1b4
+Create Date: 2026-10-19 20:21:37.310954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b3d6f2a8c1'
+down_revision: Union[str, None] = 'd5a2c7e9f1b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Comment pages are keyed by (created_at, id), so id joins the index to
+    # break created_at ties within the range scan
+    with op.get_context().autocommit_block():
+        op.create_index('ix_training_comments_training_id_created_at_id', 'training_comments', ['training_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_training_comments_training_id_created_at', table_name='training_comments', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_training_comments_training_id_created_at', 'training_comments', ['training_id', 'created_at'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_training_comments_training_id_created_at_id', table_name='training_comments', postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""add_feed_entries_table
+
+Revision ID: f4c7a9e2b6d3
+Revises: e9b3d6f2a8c1
+Create Date: 2026-10-19 21:12:08.914627
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c7a9e2b6d3'
+down_revision: Union[str, None] = 'e9b3d6f2a8c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('feed_entries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('author_id', sa.Integer(), nullable=False),
+    sa.Column('training_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['author_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['training_id'], ['trainings.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_feed_entries_training_id'), 'feed_entries', ['training_id'], unique=False)
+    op.create_index('ix_feed_entries_user_id_id', 'feed_entries', ['user_id', 'id'], unique=False)
+    # Shared entries of authors above the fan-out cap, read by their followers' feeds
+    op.create_index('ix_feed_entries_author_id_id_shared', 'feed_entries', ['author_id', 'id'], unique=False, postgresql_where=sa.text('user_id IS NULL'), sqlite_where=sa.text('user_id IS NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_feed_entries_author_id_id_shared', table_name='feed_entries')
+    op.drop_index('ix_feed_entries_user_id_id', table_name='feed_entries')
+    op.drop_index(op.f('ix_feed_entries_training_id'), table_name='feed_entries')
+    op.drop_table('feed_entries')
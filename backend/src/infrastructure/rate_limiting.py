@@ -0,0 +1,102 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+
+from sqlalchemy import bindparam, case, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.database.models.rate_limit_bucket_model import RateLimitBucketModel
+
+
+class TokenBucketStore(ABC):
+    """Token buckets by key: capacity tokens at most, refilled continuously."""
+
+    @abstractmethod
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        """Take one token from the key's bucket.
+
+        Returns 0 when a token was taken, otherwise the seconds until one is available.
+        """
+        pass
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    """
+    Per-process buckets, least recently used first. Beyond max_keys the least
+    recently used bucket is dropped in O(1), which only ever refills it early.
+    Only used from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> (tokens, updated at)
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return 0.0 if allowed else (1 - tokens) / refill_per_second
+
+
+def _take_statement(dialect_name: str):
+    """Atomic refill-and-take UPSERT on rate_limit_buckets, returning the new tokens and outcome."""
+    insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    table = RateLimitBucketModel.__table__
+    now, capacity, rate = bindparam("now"), bindparam("capacity"), bindparam("rate")
+    refill = table.c.tokens + (now - table.c.updated_at) * rate
+    refilled = case((refill > capacity, capacity), else_=refill)
+    statement = insert(table).values(key=bindparam("key"), tokens=capacity - 1, updated_at=now, allowed=True)
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.key],
+        set_={
+            "tokens": case((refilled >= 1, refilled - 1), else_=refilled),
+            "updated_at": now,
+            "allowed": refilled >= 1,
+        },
+    ).returning(table.c.tokens, table.c.allowed)
+
+
+class DatabaseTokenBucketStore(TokenBucketStore):
+    """
+    Buckets in the rate_limit_buckets table, shared by every worker and host.
+    One UPSERT per limited request on the async engine; rows idle for an hour
+    are pruned every few minutes.
+    """
+
+    PRUNE_INTERVAL_SECONDS = 600
+    IDLE_SECONDS = 3600
+
+    def __init__(self, engine: Callable[[], AsyncEngine]):
+        # Resolved per call: the database is only initialized on startup
+        self._engine = engine
+        self._statements: Dict[str, object] = {}
+        self._pruned_at = 0.0
+
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        engine = self._engine()
+        dialect_name = engine.dialect.name
+        if dialect_name not in self._statements:
+            self._statements[dialect_name] = _take_statement(dialect_name)
+        now = time.time()
+        async with engine.begin() as connection:
+            row = (
+                await connection.execute(
+                    self._statements[dialect_name],
+                    {"key": key, "now": now, "capacity": float(capacity), "rate": refill_per_second},
+                )
+            ).one()
+            if now - self._pruned_at > self.PRUNE_INTERVAL_SECONDS:
+                self._pruned_at = now
+                await connection.execute(
+                    delete(RateLimitBucketModel).where(RateLimitBucketModel.updated_at < now - self.IDLE_SECONDS)
+                )
+        return 0.0 if row.allowed else (1 - row.tokens) / refill_per_second
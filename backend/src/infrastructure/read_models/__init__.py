@@ -0,0 +1,3 @@
+from .training_read_model import AsyncTrainingReadModel, TrainingReadModel
+
+__all__ = ["TrainingReadModel", "AsyncTrainingReadModel"]
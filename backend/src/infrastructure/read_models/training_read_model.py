@@ -0,0 +1,244 @@
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+from collections import defaultdict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.models.training_model import TrainingModel
+from src.infrastructure.database.models.implementation_model import ImplementationModel
+from src.infrastructure.database.models.set_model import SetModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.training_archive_model import TrainingArchiveModel
+from src.infrastructure.archive import decode_training
+
+trainings = TrainingModel.__table__
+implementations = ImplementationModel.__table__
+sets = SetModel.__table__
+training_archive = TrainingArchiveModel.__table__
+
+TRAINING_COLUMNS = (
+    trainings.c.id,
+    trainings.c.user_id,
+    trainings.c.training_template_id,
+    trainings.c.date_time,
+    trainings.c.duration,
+    trainings.c.notes,
+    trainings.c.status,
+    trainings.c.created_at,
+    trainings.c.share_token,
+    trainings.c.exercise_count,
+    trainings.c.set_count,
+    trainings.c.total_volume,
+    trainings.c.top_weight,
+)
+
+
+def _list_queries(
+    user_id: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    """Training rows, implementation filter and archive payloads of a user's trainings in a date range."""
+    conditions = [trainings.c.user_id == user_id]
+    archive_conditions = [training_archive.c.user_id == user_id]
+    if start_date:
+        conditions.append(trainings.c.date_time >= start_date)
+        archive_conditions.append(training_archive.c.date_time >= start_date)
+    if end_date:
+        conditions.append(trainings.c.date_time <= end_date)
+        archive_conditions.append(training_archive.c.date_time <= end_date)
+
+    training_query = select(*TRAINING_COLUMNS).where(*conditions).order_by(trainings.c.date_time.desc())
+    training_ids = select(trainings.c.id).where(*conditions).scalar_subquery()
+    archive_query = (
+        select(training_archive.c.payload)
+        .where(*archive_conditions)
+        .order_by(training_archive.c.date_time.desc())
+    )
+    return training_query, implementations.c.training_id.in_(training_ids), archive_query
+
+
+def _implementations_query(implementation_filter):
+    """Implementations joined with their sets, in training and display order."""
+    return (
+        select(
+            implementations.c.id,
+            implementations.c.training_id,
+            implementations.c.exercise_id,
+            implementations.c.order_index,
+            sets.c.order_index.label("set_order_index"),
+            sets.c.weight,
+            sets.c.reps,
+            sets.c.rest_time,
+            sets.c.duration,
+            sets.c.rpe,
+        )
+        .select_from(implementations.outerjoin(sets, sets.c.implementation_id == implementations.c.id))
+        .where(implementation_filter)
+        .order_by(
+            implementations.c.training_id,
+            implementations.c.order_index,
+            implementations.c.id,
+            sets.c.order_index,
+        )
+    )
+
+
+class TrainingReadModel:
+    """Read-only training queries that build response dicts straight from Core rows.
+
+    Bypasses the ORM identity map and the entity/DTO conversions; dicts have the
+    shape of TrainingResponse.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def list_for_user(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get all trainings of a user with implementations and sets, newest first."""
+        training_query, implementation_filter, archive_query = _list_queries(user_id, start_date, end_date)
+        rows = self.db.execute(training_query).all()
+        result = self._assemble(rows, implementation_filter)
+        # Old trainings moved to cold storage
+        return self._with_archived(result, self.db.scalars(archive_query).all())
+
+    def get_by_share_token(self, share_token: str) -> Optional[Dict[str, Any]]:
+        """Get a shared training with the owner's username."""
+        row = self.db.execute(
+            select(*TRAINING_COLUMNS, UserModel.__table__.c.username)
+            .join(UserModel.__table__, UserModel.__table__.c.id == trainings.c.user_id)
+            .where(trainings.c.share_token == share_token)
+        ).first()
+        if row is None:
+            return None
+        return self._assemble([row], implementations.c.training_id == row.id)[0]
+
+    @staticmethod
+    def _archived_to_dict(training) -> Dict[str, Any]:
+        """Response dict for an archived training entity."""
+        return {
+            "id": training.id,
+            "user_id": training.user_id,
+            "training_template_id": training.training_template_id,
+            "date_time": training.date_time,
+            "duration": training.duration,
+            "notes": training.notes,
+            "status": training.status,
+            "created_at": training.created_at,
+            "share_token": None,
+            "username": None,
+            "implementations": [
+                {
+                    "exercise_id": impl.exercise_id,
+                    "order_index": impl.order_index,
+                    "sets": [
+                        {
+                            "order_index": s.order_index,
+                            "weight": float(s.weight.value),
+                            "reps": int(s.reps.value),
+                            "rest_time": int(s.rest_time.value) if s.rest_time else None,
+                            "duration": int(s.duration.value) if s.duration else None,
+                            "rpe": int(s.rpe.value) if s.rpe else None,
+                        }
+                        for s in impl.sets
+                    ],
+                }
+                for impl in training.implementations
+            ],
+            "exercise_count": training.exercise_count,
+            "set_count": training.set_count,
+            "total_volume": training.total_volume,
+            "top_weight": training.top_weight,
+        }
+
+    @classmethod
+    def _with_archived(cls, result: List[Dict[str, Any]], payloads) -> List[Dict[str, Any]]:
+        """Merge archived training payloads into a newest-first list of response dicts."""
+        if not payloads:
+            return result
+        return sorted(
+            result + [cls._archived_to_dict(decode_training(p)) for p in payloads],
+            key=lambda t: t["date_time"],
+            reverse=True,
+        )
+
+    def _assemble(self, training_rows, implementation_filter) -> List[Dict[str, Any]]:
+        """Attach implementations and sets (one query) to training rows."""
+        if not training_rows:
+            return []
+        impl_rows = self.db.execute(_implementations_query(implementation_filter)).all()
+        return self._assemble_rows(training_rows, impl_rows)
+
+    @staticmethod
+    def _assemble_rows(training_rows, impl_rows) -> List[Dict[str, Any]]:
+        """Response dicts from training rows and their implementation/set rows."""
+        impls_by_training: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        current_id = None
+        current: Dict[str, Any] = {}
+        for r in impl_rows:
+            if r.id != current_id:
+                current_id = r.id
+                current = {"exercise_id": r.exercise_id, "order_index": r.order_index, "sets": []}
+                impls_by_training[r.training_id].append(current)
+            if r.set_order_index is not None:
+                current["sets"].append(
+                    {
+                        "order_index": r.set_order_index,
+                        "weight": float(r.weight),
+                        "reps": r.reps,
+                        "rest_time": r.rest_time,
+                        "duration": r.duration,
+                        "rpe": r.rpe,
+                    }
+                )
+
+        return [
+            {
+                "id": t.id,
+                "user_id": t.user_id,
+                "training_template_id": t.training_template_id,
+                "date_time": t.date_time,
+                "duration": t.duration,
+                "notes": t.notes,
+                "status": t.status,
+                "created_at": t.created_at,
+                "share_token": t.share_token,
+                "username": getattr(t, "username", None),
+                "implementations": impls_by_training.get(t.id, []),
+                "exercise_count": t.exercise_count,
+                "set_count": t.set_count,
+                "total_volume": float(t.total_volume),
+                "top_weight": float(t.top_weight) if t.top_weight is not None else None,
+            }
+            for t in training_rows
+        ]
+
+
+class AsyncTrainingReadModel:
+    """TrainingReadModel queries on an AsyncSession, for endpoints served on the event loop."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_for_user(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get all trainings of a user with implementations and sets, newest first."""
+        training_query, implementation_filter, archive_query = _list_queries(user_id, start_date, end_date)
+        rows = (await self.db.execute(training_query)).all()
+        result = []
+        if rows:
+            impl_rows = (await self.db.execute(_implementations_query(implementation_filter))).all()
+            result = TrainingReadModel._assemble_rows(rows, impl_rows)
+        payloads = (await self.db.scalars(archive_query)).all()
+        return TrainingReadModel._with_archived(result, payloads)
@@ -1,12 +1,15 @@
-from .user_repository_impl import UserRepositoryImpl
+from .user_repository_impl import UserRepositoryImpl, AsyncUserRepositoryImpl
 from .user_body_metric_repository_impl import UserBodyMetricRepositoryImpl
 from .exercise_repository_impl import ExerciseRepositoryImpl
 from .muscle_group_repository_impl import MuscleGroupRepositoryImpl
 from .training_template_repository_impl import TrainingTemplateRepositoryImpl
-from .training_repository_impl import TrainingRepositoryImpl
-from .follow_repository_impl import FollowRepositoryImpl
+from .training_repository_impl import TrainingRepositoryImpl, AsyncTrainingRepositoryImpl
+from .follow_repository_impl import FollowRepositoryImpl, AsyncFollowRepositoryImpl
 from .training_reaction_repository_impl import TrainingReactionRepositoryImpl
 from .training_comment_repository_impl import TrainingCommentRepositoryImpl
+from .training_import_repository_impl import TrainingImportRepositoryImpl
+from .refresh_token_repository_impl import RefreshTokenRepositoryImpl
+from .feed_repository_impl import FeedRepositoryImpl
 
 __all__ = [
     "UserRepositoryImpl",
@@ -18,5 +21,11 @@ __all__ = [
     "FollowRepositoryImpl",
     "TrainingReactionRepositoryImpl",
     "TrainingCommentRepositoryImpl",
+    "TrainingImportRepositoryImpl",
+    "RefreshTokenRepositoryImpl",
+    "FeedRepositoryImpl",
+    "AsyncUserRepositoryImpl",
+    "AsyncTrainingRepositoryImpl",
+    "AsyncFollowRepositoryImpl",
 ]
 
@@ -1,5 +1,7 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
+from collections import defaultdict
 
+from sqlalchemy import bindparam, delete, func, select, update
 from sqlalchemy.orm import Session
 
 from src.domain.entities.exercise import Exercise
@@ -7,6 +9,16 @@ from src.domain.repositories.exercise_repository import IExerciseRepository
 from src.domain.value_objects.exercise_name import ExerciseName
 from src.infrastructure.database.models.exercise_model import ExerciseModel
 from src.infrastructure.database.models.exercise_muscle_group_model import ExerciseMuscleGroupModel
+from src.infrastructure.database.models.implementation_model import ImplementationModel
+from src.infrastructure.database.models.set_model import SetModel
+from src.infrastructure.database.models.training_model import TrainingModel
+
+# Built once so every request reuses its cache key and compiled SQL:
+# the user's own exercises plus system exercises (is_custom=False and user_id=None)
+_EXERCISES_VISIBLE_TO_USER = select(ExerciseModel).where(
+    (ExerciseModel.user_id == bindparam("user_id"))
+    | ((ExerciseModel.is_custom == False) & (ExerciseModel.user_id.is_(None)))  # noqa: E712
+)
 
 
 class ExerciseRepositoryImpl(IExerciseRepository):
@@ -14,6 +26,8 @@ class ExerciseRepositoryImpl(IExerciseRepository):
 
     def __init__(self, db: Session):
         self.db = db
+        # Per-request identity cache for get_many (repositories live for one request)
+        self._cache: Dict[int, Exercise] = {}
 
     def create(self, exercise: Exercise) -> Exercise:
         """Create a new exercise."""
@@ -35,35 +49,67 @@ class ExerciseRepositoryImpl(IExerciseRepository):
             )
             self.db.add(association)
 
-        self.db.commit()
-        self.db.refresh(db_exercise)
-        return self._to_entity(db_exercise)
+        self.db.flush()
+        return self._to_entity(db_exercise, list(exercise.muscle_group_ids))
 
     def get_by_id(self, exercise_id: int) -> Optional[Exercise]:
         """Get exercise by ID."""
         db_exercise = self.db.query(ExerciseModel).filter(ExerciseModel.id == exercise_id).first()
         return self._to_entity(db_exercise) if db_exercise else None
 
+    def get_many(self, exercise_ids: Iterable[int]) -> Dict[int, Exercise]:
+        """Get exercises by IDs in one query, mapped by ID (missing IDs are omitted)."""
+        ids = set(exercise_ids)
+        missing = ids - self._cache.keys()
+        if missing:
+            db_exercises = self.db.query(ExerciseModel).filter(ExerciseModel.id.in_(missing)).all()
+            muscle_group_ids = self._muscle_group_ids(missing)
+            for db_exercise in db_exercises:
+                self._cache[db_exercise.id] = self._to_entity(
+                    db_exercise, muscle_group_ids[db_exercise.id]
+                )
+        return {ex_id: self._cache[ex_id] for ex_id in ids if ex_id in self._cache}
+
+    def get_by_names(self, names: Iterable[str], user_id: int) -> Dict[str, Exercise]:
+        """Get exercises visible to a user by name in one query, mapped by lowercased name."""
+        lowered = {name.strip().lower() for name in names}
+        if not lowered:
+            return {}
+        db_exercises = (
+            self.db.query(ExerciseModel)
+            .filter(
+                func.lower(ExerciseModel.name).in_(lowered),
+                (ExerciseModel.user_id == user_id)
+                | ((ExerciseModel.is_custom == False) & (ExerciseModel.user_id.is_(None))),  # noqa: E712
+            )
+            # System exercises first so the user's own exercise wins on a name clash
+            .order_by(ExerciseModel.user_id.is_not(None), ExerciseModel.id)
+            .all()
+        )
+        muscle_group_ids = self._muscle_group_ids(ex.id for ex in db_exercises)
+        return {
+            db_exercise.name.strip().lower(): self._to_entity(db_exercise, muscle_group_ids[db_exercise.id])
+            for db_exercise in db_exercises
+        }
+
     def get_all(self, user_id: Optional[int] = None, include_system: bool = True) -> List[Exercise]:
         """Get all exercises, optionally filtered by user."""
-        query = self.db.query(ExerciseModel)
-
-        if user_id is not None:
-            # Return user's own exercises or system exercises (is_custom=False and user_id=None)
-            if include_system:
-                query = query.filter(
-                    (ExerciseModel.user_id == user_id) | 
-                    ((ExerciseModel.is_custom == False) & (ExerciseModel.user_id.is_(None)))  # noqa: E712
-                )
-            else:
+        if user_id is not None and include_system:
+            # Return user's own exercises or system exercises
+            db_exercises = self.db.scalars(_EXERCISES_VISIBLE_TO_USER, {"user_id": user_id}).all()
+        else:
+            query = self.db.query(ExerciseModel)
+            if user_id is not None:
                 # Only user's own exercises
                 query = query.filter(ExerciseModel.user_id == user_id)
-        elif not include_system:
-            # If no user_id specified and exclude system, return only custom exercises
-            query = query.filter(ExerciseModel.is_custom == True)  # noqa: E712
+            elif not include_system:
+                # If no user_id specified and exclude system, return only custom exercises
+                query = query.filter(ExerciseModel.is_custom == True)  # noqa: E712
+            db_exercises = query.all()
 
-        db_exercises = query.all()
-        return [self._to_entity(ex) for ex in db_exercises]
+        # Muscle groups for the whole list in one query instead of one per exercise
+        muscle_group_ids = self._muscle_group_ids(ex.id for ex in db_exercises)
+        return [self._to_entity(ex, muscle_group_ids[ex.id]) for ex in db_exercises]
 
     def update(self, exercise: Exercise) -> Exercise:
         """Update exercise."""
@@ -89,16 +135,54 @@ class ExerciseRepositoryImpl(IExerciseRepository):
             )
             self.db.add(association)
 
-        self.db.commit()
-        self.db.refresh(db_exercise)
-        return self._to_entity(db_exercise)
+        self.db.flush()
+        self._cache.pop(db_exercise.id, None)
+        return self._to_entity(db_exercise, list(exercise.muscle_group_ids))
 
     def delete(self, exercise_id: int) -> None:
-        """Delete exercise."""
-        db_exercise = self.db.query(ExerciseModel).filter(ExerciseModel.id == exercise_id).first()
-        if db_exercise:
-            self.db.delete(db_exercise)
-            self.db.commit()
+        """Delete exercise (muscle group links and implementations go via ON DELETE CASCADE).
+
+        Totals of the trainings that used the exercise are recomputed in the same transaction.
+        """
+        training_ids = self.db.scalars(
+            select(ImplementationModel.training_id)
+            .where(ImplementationModel.exercise_id == exercise_id)
+            .distinct()
+        ).all()
+        self.db.execute(delete(ExerciseModel).where(ExerciseModel.id == exercise_id))
+        self._cache.pop(exercise_id, None)
+        if training_ids:
+            self._recompute_training_totals(training_ids)
+
+    def _recompute_training_totals(self, training_ids: List[int]) -> None:
+        """Recompute denormalized totals of the given trainings from their remaining sets."""
+        # Outer joins keep trainings that lost all their implementations (totals drop to zero)
+        totals = (
+            select(
+                TrainingModel.id.label("training_id"),
+                func.count(func.distinct(ImplementationModel.id)).label("exercise_count"),
+                func.count(SetModel.id).label("set_count"),
+                func.coalesce(func.sum(SetModel.weight * SetModel.reps), 0).label("total_volume"),
+                func.max(SetModel.weight).label("top_weight"),
+            )
+            .select_from(TrainingModel)
+            .outerjoin(ImplementationModel, ImplementationModel.training_id == TrainingModel.id)
+            .outerjoin(SetModel, SetModel.implementation_id == ImplementationModel.id)
+            .where(TrainingModel.id.in_(training_ids))
+            .group_by(TrainingModel.id)
+            .subquery()
+        )
+        self.db.execute(
+            update(TrainingModel)
+            .where(TrainingModel.id == totals.c.training_id)
+            .values(
+                exercise_count=totals.c.exercise_count,
+                set_count=totals.c.set_count,
+                total_volume=totals.c.total_volume,
+                top_weight=totals.c.top_weight,
+            )
+            .execution_options(synchronize_session=False)
+        )
 
     def get_by_muscle_group(self, muscle_group_id: int) -> List[Exercise]:
         """Get exercises by muscle group."""
@@ -111,15 +195,33 @@ class ExerciseRepositoryImpl(IExerciseRepository):
         db_exercises = self.db.query(ExerciseModel).filter(ExerciseModel.id.in_(exercise_ids)).all()
         return [self._to_entity(ex) for ex in db_exercises]
 
-    def _to_entity(self, db_exercise: ExerciseModel) -> Exercise:
-        """Convert SQLAlchemy model to domain entity."""
-        # Get muscle group IDs
+    def _muscle_group_ids(self, exercise_ids: Iterable[int]) -> Dict[int, List[int]]:
+        """Muscle group IDs for a batch of exercises in one query."""
+        muscle_group_ids: Dict[int, List[int]] = defaultdict(list)
+        ids = set(exercise_ids)
+        if not ids:
+            return muscle_group_ids
         associations = (
             self.db.query(ExerciseMuscleGroupModel)
-            .filter(ExerciseMuscleGroupModel.exercise_id == db_exercise.id)
+            .filter(ExerciseMuscleGroupModel.exercise_id.in_(ids))
             .all()
         )
-        muscle_group_ids = [assoc.muscle_group_id for assoc in associations]
+        for assoc in associations:
+            muscle_group_ids[assoc.exercise_id].append(assoc.muscle_group_id)
+        return muscle_group_ids
+
+    def _to_entity(
+        self, db_exercise: ExerciseModel, muscle_group_ids: Optional[List[int]] = None
+    ) -> Exercise:
+        """Convert SQLAlchemy model to domain entity."""
+        if muscle_group_ids is None:
+            # Get muscle group IDs
+            associations = (
+                self.db.query(ExerciseMuscleGroupModel)
+                .filter(ExerciseMuscleGroupModel.exercise_id == db_exercise.id)
+                .all()
+            )
+            muscle_group_ids = [assoc.muscle_group_id for assoc in associations]
 
         return Exercise(
             id=db_exercise.id,
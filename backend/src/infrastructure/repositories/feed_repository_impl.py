@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import DateTime, Integer, delete, func, insert, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from src.domain.repositories.feed_repository import IFeedRepository
+from src.domain.entities.feed_entry import FeedEntry
+from src.domain.entities.follow import FollowStatus
+from src.domain.entities.training import TrainingSummary
+from src.infrastructure.database.models.feed_entry_model import FeedEntryModel
+from src.infrastructure.database.models.follow_model import FollowModel
+from src.infrastructure.database.models.training_model import TrainingModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.repositories.training_repository_impl import SUMMARY_COLUMNS, TrainingRepositoryImpl
+
+
+def _approved_followers(author_id: int):
+    """Follower IDs of the author's approved follows."""
+    return select(FollowModel.follower_id).where(
+        FollowModel.following_id == author_id,
+        FollowModel.status == FollowStatus.APPROVED,
+    )
+
+
+def _page_ids(user_id: int, before_id: Optional[int], limit: int):
+    """
+    IDs of the user's page: the user's own entries merged with the shared
+    entries of approved followed authors. Each side is a range scan of its
+    own index stopping after limit rows.
+    """
+    followed = select(FollowModel.following_id).where(
+        FollowModel.follower_id == user_id,
+        FollowModel.status == FollowStatus.APPROVED,
+    )
+    own = select(FeedEntryModel.id).where(FeedEntryModel.user_id == user_id)
+    shared = select(FeedEntryModel.id).where(
+        FeedEntryModel.user_id.is_(None),
+        FeedEntryModel.author_id.in_(followed),
+    )
+    if before_id is not None:
+        own = own.where(FeedEntryModel.id < before_id)
+        shared = shared.where(FeedEntryModel.id < before_id)
+    own = own.order_by(FeedEntryModel.id.desc()).limit(limit).subquery()
+    shared = shared.order_by(FeedEntryModel.id.desc()).limit(limit).subquery()
+    return union_all(select(own.c.id), select(shared.c.id)).subquery()
+
+
+class FeedRepositoryImpl(IFeedRepository):
+    """SQLAlchemy implementation of activity feed repository (Adapter).
+
+    Entries are deleted with their training, so trainings moved to the archive
+    leave the feed as well.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def count_followers(self, author_id: int, up_to: int) -> int:
+        """Count the author's approved followers, stopping at up_to."""
+        limited = _approved_followers(author_id).limit(up_to).subquery()
+        return self.db.scalar(select(func.count()).select_from(limited))
+
+    def fan_out(self, author_id: int, training_id: int, created_at: datetime) -> int:
+        """Write an entry for the training into every approved follower's feed (one INSERT ... SELECT)."""
+        followers = _approved_followers(author_id).subquery()
+        result = self.db.execute(
+            insert(FeedEntryModel).from_select(
+                ["user_id", "author_id", "training_id", "created_at"],
+                select(
+                    followers.c.follower_id,
+                    literal(author_id, Integer),
+                    literal(training_id, Integer),
+                    literal(created_at, DateTime),
+                ),
+            )
+        )
+        return result.rowcount
+
+    def add_shared(self, author_id: int, training_id: int, created_at: datetime) -> None:
+        """Write one entry for the training that every approved follower's feed reads."""
+        self.db.add(
+            FeedEntryModel(user_id=None, author_id=author_id, training_id=training_id, created_at=created_at)
+        )
+        self.db.flush()
+
+    def delete_for_training(self, training_id: int) -> None:
+        """Delete every feed entry of a training."""
+        self.db.execute(delete(FeedEntryModel).where(FeedEntryModel.training_id == training_id))
+
+    def delete_for_follower(self, user_id: int, author_id: int) -> None:
+        """Delete the author's entries from a user's feed."""
+        self.db.execute(
+            delete(FeedEntryModel).where(
+                FeedEntryModel.user_id == user_id,
+                FeedEntryModel.author_id == author_id,
+            )
+        )
+
+    def get_page(
+        self, user_id: int, before_id: Optional[int], limit: int
+    ) -> List[Tuple[FeedEntry, str, TrainingSummary]]:
+        """One query: the page's entries joined with author usernames and training summaries, keyset by id."""
+        ids = _page_ids(user_id, before_id, limit)
+        rows = self.db.execute(
+            select(FeedEntryModel, UserModel.username, *SUMMARY_COLUMNS)
+            .join(ids, ids.c.id == FeedEntryModel.id)
+            .join(UserModel, UserModel.id == FeedEntryModel.author_id)
+            .join(TrainingModel, TrainingModel.id == FeedEntryModel.training_id)
+            .order_by(FeedEntryModel.id.desc())
+            .limit(limit)
+        )
+        return [
+            (self._to_entity(row.FeedEntryModel), row.username, TrainingRepositoryImpl._row_to_summary(row))
+            for row in rows
+        ]
+
+    @staticmethod
+    def _to_entity(db_entry: FeedEntryModel) -> FeedEntry:
+        """Convert SQLAlchemy model to domain entity."""
+        return FeedEntry(
+            id=db_entry.id,
+            user_id=db_entry.user_id,
+            author_id=db_entry.author_id,
+            training_id=db_entry.training_id,
+            created_at=db_entry.created_at,
+        )
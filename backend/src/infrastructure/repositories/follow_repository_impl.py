@@ -1,9 +1,19 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.domain.repositories.follow_repository import IFollowRepository
+from src.domain.repositories.async_follow_repository import IAsyncFollowRepository
 from src.domain.entities.follow import Follow, FollowStatus
 from src.infrastructure.database.models.follow_model import FollowModel
+from src.infrastructure.database.models.user_model import UserModel
+
+# Built once so every request reuses its cache key and compiled SQL (checked on every social read)
+_FOLLOW_BY_PAIR = select(FollowModel).where(
+    FollowModel.follower_id == bindparam("follower_id"),
+    FollowModel.following_id == bindparam("following_id"),
+)
 
 
 class FollowRepositoryImpl(IFollowRepository):
@@ -20,8 +30,7 @@ class FollowRepositoryImpl(IFollowRepository):
             status=follow.status,
         )
         self.db.add(db_follow)
-        self.db.commit()
-        self.db.refresh(db_follow)
+        self.db.flush()
         return self._to_entity(db_follow)
 
     def delete(self, follower_id: int, following_id: int) -> None:
@@ -36,37 +45,46 @@ class FollowRepositoryImpl(IFollowRepository):
         )
         if db_follow:
             self.db.delete(db_follow)
-            self.db.commit()
+            self.db.flush()
 
     def get_by_ids(self, follower_id: int, following_id: int) -> Optional[Follow]:
         """Get follow relationship by follower and following IDs."""
-        db_follow = (
-            self.db.query(FollowModel)
-            .filter(
-                FollowModel.follower_id == follower_id,
-                FollowModel.following_id == following_id,
-            )
-            .first()
-        )
+        db_follow = self.db.scalars(
+            _FOLLOW_BY_PAIR, {"follower_id": follower_id, "following_id": following_id}
+        ).first()
         return self._to_entity(db_follow) if db_follow else None
 
-    def get_followers(self, user_id: int) -> List[Follow]:
-        """Get all users following a user."""
-        db_follows = (
-            self.db.query(FollowModel)
-            .filter(FollowModel.following_id == user_id)
-            .all()
+    def get_followers_with_usernames(
+        self, user_id: int, status: Optional[FollowStatus], before_id: Optional[int], limit: int
+    ) -> List[Tuple[Follow, str]]:
+        """Get a page of a user's followers with their usernames, newest first, below the before_id cursor."""
+        return self._page_with_usernames(
+            FollowModel.following_id, FollowModel.follower_id, user_id, status, before_id, limit
         )
-        return [self._to_entity(f) for f in db_follows]
 
-    def get_following(self, user_id: int) -> List[Follow]:
-        """Get all users a user is following."""
-        db_follows = (
-            self.db.query(FollowModel)
-            .filter(FollowModel.follower_id == user_id)
-            .all()
+    def get_following_with_usernames(
+        self, user_id: int, status: Optional[FollowStatus], before_id: Optional[int], limit: int
+    ) -> List[Tuple[Follow, str]]:
+        """Get a page of the users a user follows with their usernames, newest first, below the before_id cursor."""
+        return self._page_with_usernames(
+            FollowModel.follower_id, FollowModel.following_id, user_id, status, before_id, limit
         )
-        return [self._to_entity(f) for f in db_follows]
+
+    def _page_with_usernames(
+        self, user_column, other_column, user_id: int, status: Optional[FollowStatus], before_id: Optional[int], limit: int
+    ) -> List[Tuple[Follow, str]]:
+        """One query: follows of user_id joined with the other side's username, keyset by id."""
+        query = (
+            select(FollowModel, UserModel.username)
+            .join(UserModel, UserModel.id == other_column)
+            .where(user_column == user_id)
+        )
+        if status is not None:
+            query = query.where(FollowModel.status == status)
+        if before_id is not None:
+            query = query.where(FollowModel.id < before_id)
+        rows = self.db.execute(query.order_by(FollowModel.id.desc()).limit(limit))
+        return [(self._to_entity(db_follow), username) for db_follow, username in rows]
 
     def update_status(self, follower_id: int, following_id: int, status: FollowStatus) -> Optional[Follow]:
         """Update follow request status."""
@@ -82,8 +100,7 @@ class FollowRepositoryImpl(IFollowRepository):
             return None
         
         db_follow.status = status
-        self.db.commit()
-        self.db.refresh(db_follow)
+        self.db.flush()
         return self._to_entity(db_follow)
 
     def get_following_approved(self, user_id: int) -> List[Follow]:
@@ -98,7 +115,8 @@ class FollowRepositoryImpl(IFollowRepository):
         )
         return [self._to_entity(f) for f in db_follows]
 
-    def _to_entity(self, db_follow: FollowModel) -> Follow:
+    @staticmethod
+    def _to_entity(db_follow: FollowModel) -> Follow:
         """Convert SQLAlchemy model to domain entity."""
         return Follow(
             id=db_follow.id,
@@ -109,3 +127,16 @@ class FollowRepositoryImpl(IFollowRepository):
         )
 
 
+class AsyncFollowRepositoryImpl(IAsyncFollowRepository):
+    """Async SQLAlchemy implementation of the Follow read repository (Adapter)."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_ids(self, follower_id: int, following_id: int) -> Optional[Follow]:
+        """Get follow relationship by follower and following IDs."""
+        result = await self.db.scalars(
+            _FOLLOW_BY_PAIR, {"follower_id": follower_id, "following_id": following_id}
+        )
+        db_follow = result.first()
+        return FollowRepositoryImpl._to_entity(db_follow) if db_follow else None
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from datetime import datetime
 
 from sqlalchemy.orm import Session
@@ -13,6 +13,8 @@ class MuscleGroupRepositoryImpl(IMuscleGroupRepository):
 
     def __init__(self, db: Session):
         self.db = db
+        # Per-request identity cache for get_many (repositories live for one request)
+        self._cache: Dict[int, MuscleGroup] = {}
 
     def create(self, muscle_group: MuscleGroup) -> MuscleGroup:
         """Create a new muscle group."""
@@ -23,8 +25,7 @@ class MuscleGroupRepositoryImpl(IMuscleGroupRepository):
             updated_at=muscle_group.updated_at,
         )
         self.db.add(db_muscle_group)
-        self.db.commit()
-        self.db.refresh(db_muscle_group)
+        self.db.flush()
         return self._to_entity(db_muscle_group)
 
     def get_by_id(self, muscle_group_id: int) -> Optional[MuscleGroup]:
@@ -34,6 +35,18 @@ class MuscleGroupRepositoryImpl(IMuscleGroupRepository):
         )
         return self._to_entity(db_muscle_group) if db_muscle_group else None
 
+    def get_many(self, muscle_group_ids: Iterable[int]) -> Dict[int, MuscleGroup]:
+        """Get muscle groups by IDs in one query, mapped by ID (missing IDs are omitted)."""
+        ids = set(muscle_group_ids)
+        missing = ids - self._cache.keys()
+        if missing:
+            db_muscle_groups = (
+                self.db.query(MuscleGroupModel).filter(MuscleGroupModel.id.in_(missing)).all()
+            )
+            for db_muscle_group in db_muscle_groups:
+                self._cache[db_muscle_group.id] = self._to_entity(db_muscle_group)
+        return {mg_id: self._cache[mg_id] for mg_id in ids if mg_id in self._cache}
+
     def get_all(self, include_system: bool = True) -> List[MuscleGroup]:
         """Get all muscle groups."""
         query = self.db.query(MuscleGroupModel)
@@ -56,8 +69,8 @@ class MuscleGroupRepositoryImpl(IMuscleGroupRepository):
         db_muscle_group.is_system = muscle_group.is_system
         db_muscle_group.updated_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(db_muscle_group)
+        self.db.flush()
+        self._cache.pop(db_muscle_group.id, None)
         return self._to_entity(db_muscle_group)
 
     def delete(self, muscle_group_id: int) -> None:
@@ -67,7 +80,8 @@ class MuscleGroupRepositoryImpl(IMuscleGroupRepository):
         )
         if db_muscle_group:
             self.db.delete(db_muscle_group)
-            self.db.commit()
+            self.db.flush()
+        self._cache.pop(muscle_group_id, None)
 
     @staticmethod
     def _to_entity(db_muscle_group: MuscleGroupModel) -> MuscleGroup:
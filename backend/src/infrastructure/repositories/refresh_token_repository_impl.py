@@ -0,0 +1,91 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from src.domain.entities.refresh_token import RefreshToken
+from src.domain.repositories.refresh_token_repository import IRefreshTokenRepository
+from src.infrastructure.auth.revocation_filter import revocation_filter
+from src.infrastructure.database.models.refresh_token_model import RefreshTokenModel
+
+
+class RefreshTokenRepositoryImpl(IRefreshTokenRepository):
+    """SQLAlchemy implementation of RefreshToken repository (Adapter)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, refresh_token: RefreshToken) -> RefreshToken:
+        """Store a new refresh token."""
+        db_token = RefreshTokenModel(
+            user_id=refresh_token.user_id,
+            session_id=refresh_token.session_id,
+            token_hash=refresh_token.token_hash,
+            expires_at=refresh_token.expires_at,
+        )
+        self.db.add(db_token)
+        self.db.flush()
+        return self._to_entity(db_token)
+
+    def get_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """Get refresh token by the hash of its value."""
+        db_token = self.db.scalars(
+            select(RefreshTokenModel).where(RefreshTokenModel.token_hash == token_hash)
+        ).first()
+        return self._to_entity(db_token) if db_token else None
+
+    def rotate(self, token_id: int, rotated_at: datetime) -> bool:
+        """Mark a token as exchanged; False if it was already rotated or revoked.
+
+        Conditional so that of two concurrent refreshes with one token only one wins.
+        """
+        result = self.db.execute(
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.id == token_id,
+                RefreshTokenModel.rotated_at.is_(None),
+                RefreshTokenModel.revoked_at.is_(None),
+            )
+            .values(rotated_at=rotated_at)
+        )
+        return result.rowcount == 1
+
+    def revoke_session(self, session_id: str, revoked_at: datetime) -> None:
+        """Revoke every token of a login session."""
+        self.db.execute(
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.session_id == session_id, RefreshTokenModel.revoked_at.is_(None))
+            .values(revoked_at=revoked_at)
+        )
+        # This worker rejects the session's access tokens right away, others after their next sync
+        revocation_filter.add(session_id, revoked_at)
+
+    def delete_expired(self, user_id: int, now: datetime) -> None:
+        """Delete a user's expired tokens."""
+        self.db.execute(
+            delete(RefreshTokenModel).where(
+                RefreshTokenModel.user_id == user_id, RefreshTokenModel.expires_at <= now
+            )
+        )
+
+    def get_revoked_sessions(self, since: datetime) -> List[Tuple[str, datetime]]:
+        """Session IDs revoked since the given time, with their revocation time."""
+        rows = self.db.execute(
+            select(RefreshTokenModel.session_id, func.max(RefreshTokenModel.revoked_at))
+            .where(RefreshTokenModel.revoked_at >= since)
+            .group_by(RefreshTokenModel.session_id)
+        )
+        return [(session_id, revoked_at) for session_id, revoked_at in rows]
+
+    def _to_entity(self, db_token: RefreshTokenModel) -> RefreshToken:
+        """Convert SQLAlchemy model to domain entity."""
+        return RefreshToken(
+            id=db_token.id,
+            user_id=db_token.user_id,
+            session_id=db_token.session_id,
+            token_hash=db_token.token_hash,
+            expires_at=db_token.expires_at,
+            rotated_at=db_token.rotated_at,
+            revoked_at=db_token.revoked_at,
+        )
@@ -1,9 +1,12 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Optional, List, Sequence, Tuple
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
 
 from src.domain.repositories.training_comment_repository import ITrainingCommentRepository
 from src.domain.entities.training_comment import TrainingComment
 from src.infrastructure.database.models.training_comment_model import TrainingCommentModel
+from src.infrastructure.database.models.user_model import UserModel
 
 
 class TrainingCommentRepositoryImpl(ITrainingCommentRepository):
@@ -18,10 +21,11 @@ class TrainingCommentRepositoryImpl(ITrainingCommentRepository):
             training_id=comment.training_id,
             user_id=comment.user_id,
             text=comment.text,
+            created_at=comment.created_at,
+            updated_at=comment.updated_at,
         )
         self.db.add(db_comment)
-        self.db.commit()
-        self.db.refresh(db_comment)
+        self.db.flush()
         return self._to_entity(db_comment)
 
     def update(self, comment: TrainingComment) -> TrainingComment:
@@ -35,8 +39,7 @@ class TrainingCommentRepositoryImpl(ITrainingCommentRepository):
             raise ValueError(f"Comment with id {comment.id} not found")
 
         db_comment.text = comment.text
-        self.db.commit()
-        self.db.refresh(db_comment)
+        self.db.flush()
         return self._to_entity(db_comment)
 
     def delete(self, comment_id: int) -> None:
@@ -44,22 +47,40 @@ class TrainingCommentRepositoryImpl(ITrainingCommentRepository):
         db_comment = self.db.query(TrainingCommentModel).filter(TrainingCommentModel.id == comment_id).first()
         if db_comment:
             self.db.delete(db_comment)
-            self.db.commit()
+            self.db.flush()
 
     def get_by_id(self, comment_id: int) -> Optional[TrainingComment]:
         """Get comment by ID."""
         db_comment = self.db.query(TrainingCommentModel).filter(TrainingCommentModel.id == comment_id).first()
         return self._to_entity(db_comment) if db_comment else None
 
-    def get_by_training(self, training_id: int) -> List[TrainingComment]:
-        """Get all comments for a training."""
-        db_comments = (
-            self.db.query(TrainingCommentModel)
-            .filter(TrainingCommentModel.training_id == training_id)
-            .order_by(TrainingCommentModel.created_at)
-            .all()
+    def get_by_training_with_usernames(
+        self, training_id: int, after: Optional[Tuple[datetime, int]], limit: int
+    ) -> List[Tuple[TrainingComment, str]]:
+        """Get a page of a training's comments with their authors' usernames, oldest first, after the (created_at, id) cursor."""
+        query = (
+            select(TrainingCommentModel, UserModel.username)
+            .join(UserModel, UserModel.id == TrainingCommentModel.user_id)
+            .where(TrainingCommentModel.training_id == training_id)
         )
-        return [self._to_entity(c) for c in db_comments]
+        if after is not None:
+            # Row comparison, so the page is one range scan of (training_id, created_at, id)
+            query = query.where(tuple_(TrainingCommentModel.created_at, TrainingCommentModel.id) > tuple_(*after))
+        rows = self.db.execute(
+            query.order_by(TrainingCommentModel.created_at, TrainingCommentModel.id).limit(limit)
+        )
+        return [(self._to_entity(db_comment), username) for db_comment, username in rows]
+
+    def count_by_trainings(self, training_ids: Sequence[int]) -> Dict[int, int]:
+        """Get the comment count per training, for trainings with comments (one grouped query)."""
+        if not training_ids:
+            return {}
+        rows = self.db.execute(
+            select(TrainingCommentModel.training_id, func.count())
+            .where(TrainingCommentModel.training_id.in_(training_ids))
+            .group_by(TrainingCommentModel.training_id)
+        )
+        return {training_id: count for training_id, count in rows}
 
     def _to_entity(self, db_comment: TrainingCommentModel) -> TrainingComment:
         """Convert SQLAlchemy model to domain entity."""
@@ -0,0 +1,59 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from src.domain.repositories.training_import_repository import ITrainingImportRepository
+from src.domain.entities.training_import import TrainingImport
+from src.infrastructure.database.models.training_import_model import TrainingImportModel
+
+
+class TrainingImportRepositoryImpl(ITrainingImportRepository):
+    """SQLAlchemy implementation of TrainingImport repository (Adapter)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, training_import: TrainingImport) -> TrainingImport:
+        """Create a new import job."""
+        db_import = TrainingImportModel(
+            user_id=training_import.user_id,
+            file_format=training_import.file_format,
+            status=training_import.status,
+        )
+        self.db.add(db_import)
+        self.db.flush()
+        return self._to_entity(db_import)
+
+    def get_by_id(self, import_id: int) -> Optional[TrainingImport]:
+        """Get import job by ID."""
+        db_import = self.db.get(TrainingImportModel, import_id)
+        return self._to_entity(db_import) if db_import else None
+
+    def update(self, training_import: TrainingImport) -> TrainingImport:
+        """Update import job status and progress."""
+        db_import = self.db.get(TrainingImportModel, training_import.id)
+        if not db_import:
+            raise ValueError(f"Training import with id {training_import.id} not found")
+
+        db_import.status = training_import.status
+        db_import.processed_rows = training_import.processed_rows
+        db_import.imported_trainings = training_import.imported_trainings
+        db_import.skipped_rows = training_import.skipped_rows
+        db_import.error = training_import.error
+        db_import.finished_at = training_import.finished_at
+        self.db.flush()
+        return self._to_entity(db_import)
+
+    def _to_entity(self, db_import: TrainingImportModel) -> TrainingImport:
+        """Convert SQLAlchemy model to domain entity."""
+        return TrainingImport(
+            id=db_import.id,
+            user_id=db_import.user_id,
+            file_format=db_import.file_format,
+            created_at=db_import.created_at,
+            status=db_import.status,
+            processed_rows=db_import.processed_rows,
+            imported_trainings=db_import.imported_trainings,
+            skipped_rows=db_import.skipped_rows,
+            error=db_import.error,
+            finished_at=db_import.finished_at,
+        )
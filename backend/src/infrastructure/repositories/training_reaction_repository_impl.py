@@ -1,8 +1,9 @@
-from typing import Optional, List
+from typing import Dict, Optional, List, Sequence
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
 from src.domain.repositories.training_reaction_repository import ITrainingReactionRepository
-from src.domain.entities.training_reaction import TrainingReaction, ReactionType
+from src.domain.entities.training_reaction import ReactionSummary, TrainingReaction, ReactionType
 from src.infrastructure.database.models.training_reaction_model import TrainingReactionModel
 
 
@@ -20,8 +21,7 @@ class TrainingReactionRepositoryImpl(ITrainingReactionRepository):
             reaction_type=reaction.reaction_type.value,
         )
         self.db.add(db_reaction)
-        self.db.commit()
-        self.db.refresh(db_reaction)
+        self.db.flush()
         return self._to_entity(db_reaction)
 
     def delete(self, reaction_id: int) -> None:
@@ -29,7 +29,7 @@ class TrainingReactionRepositoryImpl(ITrainingReactionRepository):
         db_reaction = self.db.query(TrainingReactionModel).filter(TrainingReactionModel.id == reaction_id).first()
         if db_reaction:
             self.db.delete(db_reaction)
-            self.db.commit()
+            self.db.flush()
 
     def get_by_training_and_user(self, training_id: int, user_id: int) -> Optional[TrainingReaction]:
         """Get reaction by training and user IDs."""
@@ -52,6 +52,32 @@ class TrainingReactionRepositoryImpl(ITrainingReactionRepository):
         )
         return [self._to_entity(r) for r in db_reactions]
 
+    def get_summaries(self, training_ids: Sequence[int], user_id: int) -> Dict[int, ReactionSummary]:
+        """Get reaction counts by type and the user's reaction per training, for trainings with reactions.
+
+        One grouped query; a user has at most one reaction per training, so the
+        type group holding it is the user's reaction.
+        """
+        if not training_ids:
+            return {}
+        rows = self.db.execute(
+            select(
+                TrainingReactionModel.training_id,
+                TrainingReactionModel.reaction_type,
+                func.count(),
+                func.max(case((TrainingReactionModel.user_id == user_id, 1), else_=0)),
+            )
+            .where(TrainingReactionModel.training_id.in_(training_ids))
+            .group_by(TrainingReactionModel.training_id, TrainingReactionModel.reaction_type)
+        )
+        summaries: Dict[int, ReactionSummary] = {}
+        for training_id, reaction_type, count, reacted in rows:
+            summary = summaries.setdefault(training_id, ReactionSummary())
+            summary.counts[ReactionType(reaction_type)] = count
+            if reacted:
+                summary.user_reaction = ReactionType(reaction_type)
+        return summaries
+
     def _to_entity(self, db_reaction: TrainingReactionModel) -> TrainingReaction:
         """Convert SQLAlchemy model to domain entity."""
         return TrainingReaction(
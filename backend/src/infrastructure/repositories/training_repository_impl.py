@@ -1,9 +1,12 @@
 from typing import Optional, List
 from datetime import datetime
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import bindparam, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.domain.entities.training import Training, TrainingStatus
+from src.domain.entities.training import Training, TrainingStatus, TrainingSummary
 from src.domain.entities.implementation import Implementation
 from src.domain.entities.set import Set
 from src.domain.value_objects.weight import Weight
@@ -12,16 +15,110 @@ from src.domain.value_objects.rest_time import RestTime
 from src.domain.value_objects.duration import Duration
 from src.domain.value_objects.rpe import RPE
 from src.domain.repositories.training_repository import ITrainingRepository
+from src.domain.repositories.async_training_repository import IAsyncTrainingRepository
+from src.domain.services.analytics_service import AnalyticsService
+from src.infrastructure.database.models.exercise_model import ExerciseModel
 from src.infrastructure.database.models.training_model import TrainingModel
 from src.infrastructure.database.models.implementation_model import ImplementationModel
 from src.infrastructure.database.models.set_model import SetModel
+from src.infrastructure.database.models.training_archive_model import TrainingArchiveModel
+from src.infrastructure.database.models.training_template_model import TrainingTemplateModel
+from src.infrastructure.archive import encode_training, decode_training
+from src.infrastructure.settings import settings
+
+
+def _implementations_load_option(load_strategy: str):
+    """Eager-load option for training implementations and their sets."""
+    if load_strategy == "joined":
+        return joinedload(TrainingModel.implementations).joinedload(ImplementationModel.sets)
+    return selectinload(TrainingModel.implementations).selectinload(ImplementationModel.sets)
+
+
+# Built once per load strategy so every request reuses its cache key and compiled SQL
+_TRAINING_BY_ID = {
+    load_strategy: select(TrainingModel)
+    .options(_implementations_load_option(load_strategy))
+    .where(TrainingModel.id == bindparam("training_id"))
+    for load_strategy in ("selectin", "joined")
+}
+
+
+# Columns of a TrainingSummary, read by TrainingRepositoryImpl._row_to_summary
+SUMMARY_COLUMNS = (
+    TrainingModel.id,
+    TrainingModel.user_id,
+    TrainingModel.training_template_id,
+    TrainingModel.date_time,
+    TrainingModel.duration,
+    TrainingModel.notes,
+    TrainingModel.status,
+    TrainingModel.created_at,
+    TrainingModel.share_token,
+    TrainingModel.exercise_count,
+    TrainingModel.set_count,
+    TrainingModel.total_volume,
+    TrainingModel.top_weight,
+)
+
+
+def _summaries_query(
+    user_id: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    """Summary columns of a user's hot trainings, optionally filtered by date range, newest first."""
+    query = select(*SUMMARY_COLUMNS).where(TrainingModel.user_id == user_id)
+    if start_date:
+        query = query.where(TrainingModel.date_time >= start_date)
+    if end_date:
+        query = query.where(TrainingModel.date_time <= end_date)
+    return query.order_by(TrainingModel.date_time.desc())
+
+
+def _archived_range_query(
+    user_id: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    """Archive payloads of a user, optionally filtered by date range, newest first."""
+    query = select(TrainingArchiveModel.payload).where(TrainingArchiveModel.user_id == user_id)
+    if start_date:
+        query = query.where(TrainingArchiveModel.date_time >= start_date)
+    if end_date:
+        query = query.where(TrainingArchiveModel.date_time <= end_date)
+    return query.order_by(TrainingArchiveModel.date_time.desc())
+
+
+def _merge_summaries(rows, archived: List[Training]) -> List[TrainingSummary]:
+    """Summaries from _summaries_query rows plus archived trainings, newest first."""
+    summaries = [TrainingRepositoryImpl._row_to_summary(row) for row in rows]
+    if archived:
+        summaries = sorted(
+            summaries + [TrainingRepositoryImpl._to_summary(t) for t in archived],
+            key=lambda s: s.date_time,
+            reverse=True,
+        )
+    return summaries
 
 
 class TrainingRepositoryImpl(ITrainingRepository):
-    """SQLAlchemy implementation of Training repository (Adapter)."""
+    """SQLAlchemy implementation of Training repository (Adapter).
+
+    Old completed trainings live in training_archive (see archive_completed_before);
+    reads fall back to it transparently, and updating an archived training restores it.
+    """
 
-    def __init__(self, db: Session):
+    LOAD_STRATEGIES = ("selectin", "joined")
+
+    def __init__(self, db: Session, load_strategy: Optional[str] = None):
         self.db = db
+        self.load_strategy = load_strategy or settings.TRAINING_LOAD_STRATEGY
+        if self.load_strategy not in self.LOAD_STRATEGIES:
+            raise ValueError(f"Unknown training load strategy: {self.load_strategy}")
+
+    def _implementations_option(self):
+        """Eager-load option for training implementations and their sets."""
+        return _implementations_load_option(self.load_strategy)
 
     def create(self, training: Training) -> Training:
         """Create a new training."""
@@ -34,47 +131,81 @@ class TrainingRepositoryImpl(ITrainingRepository):
             status=training.status,
             share_token=training.share_token,
         )
+        self._apply_totals(db_training, training.implementations)
+
+        # Create implementations and sets (inserted together on flush)
+        db_training.implementations = [self._to_model(impl) for impl in training.implementations]
         self.db.add(db_training)
         self.db.flush()
+        return self._to_entity(db_training)
 
-        # Create implementations
-        for impl in training.implementations:
-            db_impl = ImplementationModel(
-                training_id=db_training.id,
-                exercise_id=impl.exercise_id,
-                order_index=impl.order_index,
-            )
-            self.db.add(db_impl)
-            self.db.flush()
+    def bulk_create(self, trainings: List[Training]) -> int:
+        """Insert many trainings with their implementations and sets, return the number inserted.
 
-            # Create sets
-            for set_entity in impl.sets:
-                db_set = SetModel(
-                    implementation_id=db_impl.id,
-                    order_index=set_entity.order_index,
-                    weight=float(set_entity.weight.value),
-                    reps=int(set_entity.reps.value),
-                    rest_time=int(set_entity.rest_time.value) if set_entity.rest_time else None,
-                    duration=int(set_entity.duration.value) if set_entity.duration else None,
-                    rpe=int(set_entity.rpe.value) if set_entity.rpe else None,
-                )
-                self.db.add(db_set)
+        Uses one multi-row INSERT per table (ids come back via RETURNING in
+        parameter order) instead of the per-object unit of work used by create.
+        """
+        if not trainings:
+            return 0
 
-        self.db.commit()
-        self.db.refresh(db_training)
-        return self._to_entity(db_training)
+        training_ids = self.db.scalars(
+            insert(TrainingModel).returning(TrainingModel.id, sort_by_parameter_order=True),
+            [
+                {
+                    "user_id": training.user_id,
+                    "training_template_id": training.training_template_id,
+                    "date_time": training.date_time,
+                    "duration": training.duration,
+                    "notes": training.notes,
+                    "status": training.status,
+                    **self._totals(training.implementations),
+                }
+                for training in trainings
+            ],
+        ).all()
+
+        implementations = [
+            (training_id, impl)
+            for training_id, training in zip(training_ids, trainings)
+            for impl in training.implementations
+        ]
+        if not implementations:
+            return len(training_ids)
+        implementation_ids = self.db.scalars(
+            insert(ImplementationModel).returning(ImplementationModel.id, sort_by_parameter_order=True),
+            [
+                {"training_id": training_id, "exercise_id": impl.exercise_id, "order_index": impl.order_index}
+                for training_id, impl in implementations
+            ],
+        ).all()
+
+        set_rows = [
+            {
+                "implementation_id": implementation_id,
+                "order_index": set_entity.order_index,
+                "weight": float(set_entity.weight.value),
+                "reps": int(set_entity.reps.value),
+                "rest_time": int(set_entity.rest_time.value) if set_entity.rest_time else None,
+                "duration": int(set_entity.duration.value) if set_entity.duration else None,
+                "rpe": int(set_entity.rpe.value) if set_entity.rpe else None,
+            }
+            for implementation_id, (_, impl) in zip(implementation_ids, implementations)
+            for set_entity in impl.sets
+        ]
+        if set_rows:
+            self.db.execute(insert(SetModel), set_rows)
+        return len(training_ids)
 
     def get_by_id(self, training_id: int) -> Optional[Training]:
         """Get training by ID."""
         db_training = (
-            self.db.query(TrainingModel)
-            .options(
-                joinedload(TrainingModel.implementations).joinedload(ImplementationModel.sets)
-            )
-            .filter(TrainingModel.id == training_id)
+            self.db.scalars(_TRAINING_BY_ID[self.load_strategy], {"training_id": training_id})
+            .unique()
             .first()
         )
-        return self._to_entity(db_training) if db_training else None
+        if db_training:
+            return self._to_entity(db_training)
+        return self._get_archived(training_id)
 
     def get_all(
         self,
@@ -85,7 +216,7 @@ class TrainingRepositoryImpl(ITrainingRepository):
         """Get all trainings for a user, optionally filtered by date range."""
         query = (
             self.db.query(TrainingModel)
-            .options(joinedload(TrainingModel.implementations).joinedload(ImplementationModel.sets))
+            .options(self._implementations_option())
             .filter(TrainingModel.user_id == user_id)
         )
 
@@ -96,8 +227,22 @@ class TrainingRepositoryImpl(ITrainingRepository):
 
         query = query.order_by(TrainingModel.date_time.desc())
 
-        db_trainings = query.all()
-        return [self._to_entity(t) for t in db_trainings]
+        trainings = [self._to_entity(t) for t in query.all()]
+        archived = self._get_archived_range(user_id, start_date, end_date)
+        if archived:
+            trainings = sorted(trainings + archived, key=lambda t: t.date_time, reverse=True)
+        return trainings
+
+    def get_summaries(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[TrainingSummary]:
+        """Get per-training totals for a user without loading implementations and sets."""
+        rows = self.db.execute(_summaries_query(user_id, start_date, end_date)).all()
+        archived = self._get_archived_range(user_id, start_date, end_date)
+        return _merge_summaries(rows, archived)
 
     def update(self, training: Training) -> Training:
         """Update training."""
@@ -106,6 +251,8 @@ class TrainingRepositoryImpl(ITrainingRepository):
         db_training = (
             self.db.query(TrainingModel).filter(TrainingModel.id == training.id).first()
         )
+        if not db_training:
+            db_training = self._restore(training.id)
         if not db_training:
             raise ValueError(f"Training with id {training.id} not found")
 
@@ -114,58 +261,35 @@ class TrainingRepositoryImpl(ITrainingRepository):
         db_training.notes = training.notes
         db_training.status = training.status
         db_training.share_token = training.share_token
+        self._apply_totals(db_training, training.implementations)
 
-        # Delete old implementations
+        # Delete old implementations (sets go with them via ON DELETE CASCADE)
         self.db.query(ImplementationModel).filter(
             ImplementationModel.training_id == training.id
         ).delete()
+        set_committed_value(db_training, "implementations", [])
 
         # Create new implementations
         for impl in training.implementations:
-            db_impl = ImplementationModel(
-                training_id=db_training.id,
-                exercise_id=impl.exercise_id,
-                order_index=impl.order_index,
-            )
-            self.db.add(db_impl)
-            self.db.flush()
-
-            for set_entity in impl.sets:
-                db_set = SetModel(
-                    implementation_id=db_impl.id,
-                    order_index=set_entity.order_index,
-                    weight=float(set_entity.weight.value),
-                    reps=int(set_entity.reps.value),
-                    rest_time=int(set_entity.rest_time.value) if set_entity.rest_time else None,
-                    duration=int(set_entity.duration.value) if set_entity.duration else None,
-                    rpe=int(set_entity.rpe.value) if set_entity.rpe else None,
-                )
-                self.db.add(db_set)
+            db_training.implementations.append(self._to_model(impl))
 
-        self.db.commit()
-        self.db.refresh(db_training)
+        self.db.flush()
         return self._to_entity(db_training)
 
     def delete(self, training_id: int) -> None:
-        """Delete training."""
-        db_training = (
-            self.db.query(TrainingModel).filter(TrainingModel.id == training_id).first()
-        )
-        if db_training:
-            self.db.delete(db_training)
-            self.db.commit()
+        """Delete training (implementations, sets, reactions and comments go via ON DELETE CASCADE)."""
+        self.db.execute(delete(TrainingModel).where(TrainingModel.id == training_id))
+        self.db.execute(delete(TrainingArchiveModel).where(TrainingArchiveModel.training_id == training_id))
 
-    def get_by_share_token(self, share_token: str) -> Optional[Training]:
-        """Get training by share token."""
-        db_training = (
-            self.db.query(TrainingModel)
-            .options(
-                joinedload(TrainingModel.implementations).joinedload(ImplementationModel.sets)
-            )
-            .filter(TrainingModel.share_token == share_token)
-            .first()
-        )
-        return self._to_entity(db_training) if db_training else None
+    def restore_if_archived(self, training_id: int) -> bool:
+        """Make sure the training is in the hot table, moving it back from the archive with its sets.
+
+        Returns False if the training does not exist. Rows referencing
+        trainings.id (reactions, comments) can be inserted afterwards.
+        """
+        if self.db.scalar(select(TrainingModel.id).where(TrainingModel.id == training_id)) is not None:
+            return True
+        return self._restore(training_id, with_implementations=True) is not None
 
     def get_last_exercise_implementation(
         self, user_id: int, exercise_id: int
@@ -180,13 +304,13 @@ class TrainingRepositoryImpl(ITrainingRepository):
                 TrainingModel.status == TrainingStatus.COMPLETED.value,
                 ImplementationModel.exercise_id == exercise_id,
             )
-            .options(joinedload(TrainingModel.implementations).joinedload(ImplementationModel.sets))
+            .options(self._implementations_option())
             .order_by(TrainingModel.date_time.desc())
             .first()
         )
 
         if not db_training:
-            return None
+            return self._get_last_archived_implementation(user_id, exercise_id)
 
         # Find the implementation for this exercise
         for db_impl in db_training.implementations:
@@ -215,7 +339,177 @@ class TrainingRepositoryImpl(ITrainingRepository):
 
         return None
 
-    def _to_entity(self, db_training: TrainingModel) -> Training:
+    def archive_completed_before(self, cutoff: datetime, limit: int) -> int:
+        """Move up to `limit` completed trainings older than cutoff to cold storage, return the number moved.
+
+        Shared trainings and trainings with reactions or comments stay hot, since
+        those rows reference trainings.id.
+        """
+        db_trainings = (
+            self.db.query(TrainingModel)
+            .options(self._implementations_option())
+            .filter(
+                TrainingModel.status == TrainingStatus.COMPLETED.value,
+                TrainingModel.date_time < cutoff,
+                TrainingModel.share_token.is_(None),
+                ~TrainingModel.reactions.any(),
+                ~TrainingModel.comments.any(),
+            )
+            .limit(limit)
+            .all()
+        )
+        if not db_trainings:
+            return 0
+
+        self.db.execute(
+            insert(TrainingArchiveModel),
+            [
+                {
+                    "training_id": db_training.id,
+                    "user_id": db_training.user_id,
+                    "date_time": db_training.date_time,
+                    "payload": encode_training(self._to_entity(db_training)),
+                }
+                for db_training in db_trainings
+            ],
+        )
+        # Implementations and sets go via ON DELETE CASCADE
+        self.db.execute(
+            delete(TrainingModel).where(TrainingModel.id.in_([t.id for t in db_trainings]))
+        )
+        return len(db_trainings)
+
+    def _get_archived(self, training_id: int) -> Optional[Training]:
+        """Get an archived training by its original ID."""
+        payload = self.db.scalar(
+            select(TrainingArchiveModel.payload).where(TrainingArchiveModel.training_id == training_id)
+        )
+        return decode_training(payload) if payload is not None else None
+
+    def _get_archived_range(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Training]:
+        """Get archived trainings of a user, optionally filtered by date range, newest first."""
+        payloads = self.db.scalars(_archived_range_query(user_id, start_date, end_date))
+        return [decode_training(payload) for payload in payloads]
+
+    def _get_last_archived_implementation(
+        self, user_id: int, exercise_id: int
+    ) -> Optional[Implementation]:
+        """Scan a user's archive from newest to oldest for the last implementation of an exercise."""
+        payloads = self.db.scalars(
+            select(TrainingArchiveModel.payload)
+            .where(TrainingArchiveModel.user_id == user_id)
+            .order_by(TrainingArchiveModel.date_time.desc())
+            .execution_options(yield_per=100)
+        )
+        for payload in payloads:
+            training = decode_training(payload)
+            for impl in training.implementations:
+                if impl.exercise_id == exercise_id:
+                    payloads.close()
+                    return impl
+        return None
+
+    def _restore(self, training_id: int, with_implementations: bool = False) -> Optional[TrainingModel]:
+        """Move an archived training back to the hot table.
+
+        Implementations are left out unless with_implementations is set (update
+        replaces them anyway); those of exercises deleted since archiving are dropped.
+        """
+        archived = self.db.get(TrainingArchiveModel, training_id)
+        if archived is None:
+            return None
+        training = decode_training(archived.payload)
+
+        template_id = training.training_template_id
+        if template_id is not None and self.db.get(TrainingTemplateModel, template_id) is None:
+            template_id = None  # Template was deleted while the training was archived
+        db_training = TrainingModel(
+            id=training.id,
+            user_id=training.user_id,
+            training_template_id=template_id,
+            date_time=training.date_time,
+            duration=training.duration,
+            notes=training.notes,
+            status=training.status,
+            created_at=training.created_at,
+        )
+        if with_implementations:
+            exercise_ids = {impl.exercise_id for impl in training.implementations}
+            existing = set(
+                self.db.scalars(select(ExerciseModel.id).where(ExerciseModel.id.in_(exercise_ids)))
+            ) if exercise_ids else set()
+            implementations = [impl for impl in training.implementations if impl.exercise_id in existing]
+            self._apply_totals(db_training, implementations)
+            db_training.implementations = [self._to_model(impl) for impl in implementations]
+        self.db.delete(archived)
+        self.db.add(db_training)
+        self.db.flush()
+        return db_training
+
+    @staticmethod
+    def _row_to_summary(row) -> TrainingSummary:
+        """Summary from a row of SUMMARY_COLUMNS."""
+        return TrainingSummary(
+            id=row.id,
+            user_id=row.user_id,
+            training_template_id=row.training_template_id,
+            date_time=row.date_time,
+            duration=row.duration,
+            notes=row.notes,
+            status=TrainingStatus(row.status.value),
+            created_at=row.created_at,
+            share_token=row.share_token,
+            exercise_count=row.exercise_count,
+            set_count=row.set_count,
+            total_volume=float(row.total_volume),
+            top_weight=float(row.top_weight) if row.top_weight is not None else None,
+        )
+
+    @staticmethod
+    def _to_summary(training: Training) -> TrainingSummary:
+        """Project a training entity to a summary row."""
+        return TrainingSummary(
+            id=training.id,
+            user_id=training.user_id,
+            training_template_id=training.training_template_id,
+            date_time=training.date_time,
+            duration=training.duration,
+            notes=training.notes,
+            status=training.status,
+            created_at=training.created_at,
+            share_token=training.share_token,
+            exercise_count=training.exercise_count,
+            set_count=training.set_count,
+            total_volume=training.total_volume,
+            top_weight=training.top_weight,
+        )
+
+    @staticmethod
+    def _to_model(impl: Implementation) -> ImplementationModel:
+        """Convert implementation entity (with sets) to SQLAlchemy models."""
+        return ImplementationModel(
+            exercise_id=impl.exercise_id,
+            order_index=impl.order_index,
+            sets=[
+                SetModel(
+                    order_index=set_entity.order_index,
+                    weight=float(set_entity.weight.value),
+                    reps=int(set_entity.reps.value),
+                    rest_time=int(set_entity.rest_time.value) if set_entity.rest_time else None,
+                    duration=int(set_entity.duration.value) if set_entity.duration else None,
+                    rpe=int(set_entity.rpe.value) if set_entity.rpe else None,
+                )
+                for set_entity in impl.sets
+            ],
+        )
+
+    @staticmethod
+    def _to_entity(db_training: TrainingModel) -> Training:
         """Convert SQLAlchemy model to domain entity."""
         implementations = []
         for db_impl in db_training.implementations:
@@ -255,7 +549,60 @@ class TrainingRepositoryImpl(ITrainingRepository):
             implementations=implementations,
             created_at=db_training.created_at,
             updated_at=db_training.updated_at,
+            exercise_count=db_training.exercise_count,
+            set_count=db_training.set_count,
+            total_volume=float(db_training.total_volume),
+            top_weight=float(db_training.top_weight) if db_training.top_weight is not None else None,
         )
 
+    @staticmethod
+    def _totals(implementations: List[Implementation]) -> dict:
+        """Compute denormalized per-training totals from the implementations being written."""
+        sets = [s for impl in implementations for s in impl.sets]
+        return {
+            "exercise_count": len(implementations),
+            "set_count": len(sets),
+            "total_volume": AnalyticsService.calculate_volume(sets),
+            "top_weight": max((float(s.weight.value) for s in sets), default=None),
+        }
+
+    def _apply_totals(self, db_training: TrainingModel, implementations: List[Implementation]) -> None:
+        """Recompute denormalized per-training totals from the implementations being written."""
+        for column, value in self._totals(implementations).items():
+            setattr(db_training, column, value)
+
+
+class AsyncTrainingRepositoryImpl(IAsyncTrainingRepository):
+    """Async SQLAlchemy implementation of the Training read repository (Adapter).
+
+    Runs the same statements as TrainingRepositoryImpl on an AsyncSession,
+    with the same archive fallback.
+    """
+
+    def __init__(self, db: AsyncSession, load_strategy: Optional[str] = None):
+        self.db = db
+        self.load_strategy = load_strategy or settings.TRAINING_LOAD_STRATEGY
+        if self.load_strategy not in TrainingRepositoryImpl.LOAD_STRATEGIES:
+            raise ValueError(f"Unknown training load strategy: {self.load_strategy}")
 
+    async def get_by_id(self, training_id: int) -> Optional[Training]:
+        """Get training by ID."""
+        result = await self.db.scalars(_TRAINING_BY_ID[self.load_strategy], {"training_id": training_id})
+        db_training = result.unique().first()
+        if db_training:
+            return TrainingRepositoryImpl._to_entity(db_training)
+        payload = await self.db.scalar(
+            select(TrainingArchiveModel.payload).where(TrainingArchiveModel.training_id == training_id)
+        )
+        return decode_training(payload) if payload is not None else None
 
+    async def get_summaries(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[TrainingSummary]:
+        """Get per-training totals for a user without loading implementations and sets."""
+        rows = (await self.db.execute(_summaries_query(user_id, start_date, end_date))).all()
+        payloads = await self.db.scalars(_archived_range_query(user_id, start_date, end_date))
+        return _merge_summaries(rows, [decode_training(payload) for payload in payloads])
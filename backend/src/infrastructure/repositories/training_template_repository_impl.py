@@ -1,6 +1,8 @@
 from typing import Optional, List
 
+from sqlalchemy import delete
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.domain.entities.training_template import TrainingTemplate
 from src.domain.entities.implementation_template import ImplementationTemplate
@@ -24,31 +26,13 @@ class TrainingTemplateRepositoryImpl(ITrainingTemplateRepository):
             description=template.description,
             user_id=template.user_id,
         )
+
+        # Create implementation templates and set templates (inserted together on flush)
+        db_template.implementation_templates = [
+            self._to_model(impl_template) for impl_template in template.implementation_templates
+        ]
         self.db.add(db_template)
         self.db.flush()
-
-        # Create implementation templates
-        for impl_template in template.implementation_templates:
-            db_impl_template = ImplementationTemplateModel(
-                training_template_id=db_template.id,
-                exercise_id=impl_template.exercise_id,
-                order_index=impl_template.order_index,
-            )
-            self.db.add(db_impl_template)
-            self.db.flush()
-
-            # Create set templates
-            for set_template in impl_template.set_templates:
-                db_set_template = SetTemplateModel(
-                    implementation_template_id=db_impl_template.id,
-                    order_index=set_template.order_index,
-                    weight=set_template.weight,
-                    reps=set_template.reps,
-                )
-                self.db.add(db_set_template)
-
-        self.db.commit()
-        self.db.refresh(db_template)
         return self._to_entity(db_template)
 
     def get_by_id(self, template_id: int) -> Optional[TrainingTemplate]:
@@ -99,42 +83,38 @@ class TrainingTemplateRepositoryImpl(ITrainingTemplateRepository):
         db_template.name = template.name
         db_template.description = template.description
 
-        # Delete old implementation templates
+        # Delete old implementation templates (set templates go with them via ON DELETE CASCADE)
         self.db.query(ImplementationTemplateModel).filter(
             ImplementationTemplateModel.training_template_id == template.id
         ).delete()
+        set_committed_value(db_template, "implementation_templates", [])
 
         # Create new implementation templates
         for impl_template in template.implementation_templates:
-            db_impl_template = ImplementationTemplateModel(
-                training_template_id=db_template.id,
-                exercise_id=impl_template.exercise_id,
-                order_index=impl_template.order_index,
-            )
-            self.db.add(db_impl_template)
-            self.db.flush()
+            db_template.implementation_templates.append(self._to_model(impl_template))
 
-            for set_template in impl_template.set_templates:
-                db_set_template = SetTemplateModel(
-                    implementation_template_id=db_impl_template.id,
+        self.db.flush()
+        return self._to_entity(db_template)
+
+    def delete(self, template_id: int) -> None:
+        """Delete training template (implementation templates cascade, trainings keep a NULL template_id)."""
+        self.db.execute(delete(TrainingTemplateModel).where(TrainingTemplateModel.id == template_id))
+
+    @staticmethod
+    def _to_model(impl_template: ImplementationTemplate) -> ImplementationTemplateModel:
+        """Convert implementation template entity (with set templates) to SQLAlchemy models."""
+        return ImplementationTemplateModel(
+            exercise_id=impl_template.exercise_id,
+            order_index=impl_template.order_index,
+            set_templates=[
+                SetTemplateModel(
                     order_index=set_template.order_index,
                     weight=set_template.weight,
                     reps=set_template.reps,
                 )
-                self.db.add(db_set_template)
-
-        self.db.commit()
-        self.db.refresh(db_template)
-        return self._to_entity(db_template)
-
-    def delete(self, template_id: int) -> None:
-        """Delete training template."""
-        db_template = (
-            self.db.query(TrainingTemplateModel).filter(TrainingTemplateModel.id == template_id).first()
+                for set_template in impl_template.set_templates
+            ],
         )
-        if db_template:
-            self.db.delete(db_template)
-            self.db.commit()
 
     def _to_entity(self, db_template: TrainingTemplateModel) -> TrainingTemplate:
         """Convert SQLAlchemy model to domain entity."""
@@ -26,8 +26,7 @@ class UserBodyMetricRepositoryImpl(IUserBodyMetricRepository):
             updated_at=body_metric.updated_at,
         )
         self.db.add(db_metric)
-        self.db.commit()
-        self.db.refresh(db_metric)
+        self.db.flush()
         return self._to_entity(db_metric)
 
     def get_by_id(self, metric_id: int) -> Optional[UserBodyMetric]:
@@ -76,8 +75,7 @@ class UserBodyMetricRepositoryImpl(IUserBodyMetricRepository):
         db_metric.date = body_metric.date
         db_metric.updated_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(db_metric)
+        self.db.flush()
         return self._to_entity(db_metric)
 
     def delete(self, metric_id: int) -> None:
@@ -85,7 +83,7 @@ class UserBodyMetricRepositoryImpl(IUserBodyMetricRepository):
         db_metric = self.db.query(UserBodyMetricModel).filter(UserBodyMetricModel.id == metric_id).first()
         if db_metric:
             self.db.delete(db_metric)
-            self.db.commit()
+            self.db.flush()
 
     @staticmethod
     def _to_entity(db_metric: UserBodyMetricModel) -> UserBodyMetric:
@@ -1,19 +1,27 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from datetime import datetime
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import bindparam, or_, select, update
 
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import IUserRepository
+from src.domain.repositories.async_user_repository import IAsyncUserRepository
+from src.infrastructure.auth.principal_cache import principal_cache
 from src.infrastructure.database.models.user_model import UserModel
 
+# Built once so every request reuses its cache key and compiled SQL (checked on each authenticated request)
+_USER_BY_ID = select(UserModel).where(UserModel.id == bindparam("user_id"))
+
 
 class UserRepositoryImpl(IUserRepository):
     """SQLAlchemy implementation of User repository (Adapter)."""
 
     def __init__(self, db: Session):
         self.db = db
+        # Per-request identity cache for get_many (repositories live for one request)
+        self._cache: Dict[int, User] = {}
 
     def create(self, user: User) -> User:
         """Create a new user."""
@@ -21,21 +29,31 @@ class UserRepositoryImpl(IUserRepository):
             email=user.email,
             username=user.username,
             hashed_password=user.hashed_password,
+            password_version=user.password_version,
             weight=user.weight,
             height=user.height,
             created_at=user.created_at,
             updated_at=user.updated_at,
         )
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        self.db.flush()
         return self._to_entity(db_user)
 
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID."""
-        db_user = self.db.query(UserModel).filter(UserModel.id == user_id).first()
+        db_user = self.db.scalars(_USER_BY_ID, {"user_id": user_id}).first()
         return self._to_entity(db_user) if db_user else None
 
+    def get_many(self, user_ids: Iterable[int]) -> Dict[int, User]:
+        """Get users by IDs in one query, mapped by ID (missing IDs are omitted)."""
+        ids = set(user_ids)
+        missing = ids - self._cache.keys()
+        if missing:
+            db_users = self.db.query(UserModel).filter(UserModel.id.in_(missing)).all()
+            for db_user in db_users:
+                self._cache[db_user.id] = self._to_entity(db_user)
+        return {user_id: self._cache[user_id] for user_id in ids if user_id in self._cache}
+
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         db_user = self.db.query(UserModel).filter(UserModel.email == email).first()
@@ -52,20 +70,37 @@ class UserRepositoryImpl(IUserRepository):
         db_user.email = user.email
         db_user.username = user.username
         db_user.hashed_password = user.hashed_password
+        db_user.password_version = user.password_version
         db_user.weight = user.weight
         db_user.height = user.height
         db_user.updated_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(db_user)
+        self.db.flush()
+        self._cache.pop(db_user.id, None)
+        principal_cache.invalidate(db_user.id)
         return self._to_entity(db_user)
 
+    def update_measurements(
+        self, user_id: int, weight: Optional[float] = None, height: Optional[float] = None
+    ) -> None:
+        """Set the user's current weight and/or height (None leaves a value unchanged)."""
+        values = {"updated_at": datetime.utcnow()}
+        if weight is not None:
+            values["weight"] = weight
+        if height is not None:
+            values["height"] = height
+        # One UPDATE by primary key instead of loading the row first
+        self.db.execute(update(UserModel).where(UserModel.id == user_id).values(**values))
+        self._cache.pop(user_id, None)
+
     def delete(self, user_id: int) -> None:
         """Delete user."""
         db_user = self.db.query(UserModel).filter(UserModel.id == user_id).first()
         if db_user:
             self.db.delete(db_user)
-            self.db.commit()
+            self.db.flush()
+        self._cache.pop(user_id, None)
+        principal_cache.invalidate(user_id)
 
     def search_by_username(self, username_query: str, limit: int = 20) -> List[User]:
         """Search users by username (case-insensitive partial match)."""
@@ -83,6 +118,7 @@ class UserRepositoryImpl(IUserRepository):
             email=db_user.email,
             username=db_user.username,
             hashed_password=db_user.hashed_password,
+            password_version=db_user.password_version,
             weight=float(db_user.weight) if db_user.weight is not None else None,
             height=float(db_user.height) if db_user.height is not None else None,
             created_at=db_user.created_at,
@@ -90,3 +126,13 @@ class UserRepositoryImpl(IUserRepository):
         )
 
 
+class AsyncUserRepositoryImpl(IAsyncUserRepository):
+    """Async SQLAlchemy implementation of the User read repository (Adapter)."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        db_user = (await self.db.scalars(_USER_BY_ID, {"user_id": user_id})).first()
+        return UserRepositoryImpl._to_entity(db_user) if db_user else None
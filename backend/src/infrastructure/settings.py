@@ -10,8 +10,75 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Refresh tokens (POST /auth/refresh) stay valid this long after their last use
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # How often each worker reloads sessions revoked by other workers
+    REVOCATION_SYNC_INTERVAL_SECONDS: float = 30
+    # bcrypt cost factor for new hashes; older hashes are rehashed on login
+    PASSWORD_HASH_ROUNDS: int = 12
+    # Register/login handlers hashing at once per worker, and how many may wait
+    # for a thread before further ones get 503
+    PASSWORD_HASH_MAX_THREADS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    # Authenticated users confirmed to exist are cached per worker for this many
+    # seconds (0 disables), so most requests skip the user lookup
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+    # Verified access token payloads cached per worker until the token expires (0 disables)
+    JWT_CACHE_MAX_SIZE: int = 10_000
     ENVIRONMENT: str = "development"
     BACKEND_PORT: int = 8000
+    # Open pool connections, load catalogs and build the OpenAPI schema before serving
+    WARM_UP_ON_STARTUP: bool = True
+    # Connection pool, per worker process: the database sees up to
+    # workers * (DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW) connections
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 10
+    # Seconds to wait for a free connection before failing the request
+    DATABASE_POOL_TIMEOUT: float = 30
+    # Seconds after which connections are replaced (-1 disables)
+    DATABASE_POOL_RECYCLE: int = 1800
+    # Test connections on checkout so a database restart does not surface stale connections
+    DATABASE_POOL_PRE_PING: bool = True
+    # PostgreSQL statement_timeout in milliseconds (0 disables)
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 0
+    # Comma-separated read replica URLs; read-only endpoints are served from them
+    DATABASE_REPLICA_URLS: str = ""
+    # Seconds a user's reads stay on the primary after their own write
+    REPLICA_READ_YOUR_WRITES_SECONDS: float = 5
+    # How training implementations/sets are eager-loaded: "selectin" (one extra
+    # query per level) or "joined" (single LEFT OUTER JOIN, rows multiply per set)
+    TRAINING_LOAD_STRATEGY: str = "selectin"
+    # Trainings inserted (and progress committed) per batch by the bulk import
+    TRAINING_IMPORT_BATCH_SIZE: int = 500
+    # Largest accepted import upload in bytes (larger bodies get 413)
+    TRAINING_IMPORT_MAX_BYTES: int = 50 * 1024 * 1024
+    # Completed trainings older than this many days are moved to training_archive
+    TRAINING_ARCHIVE_AFTER_DAYS: int = 365
+    TRAINING_ARCHIVE_BATCH_SIZE: int = 500
+    # Completed trainings get a feed entry per approved follower of the author;
+    # authors with more followers get one shared entry, merged into feeds on read
+    FEED_FANOUT_MAX_FOLLOWERS: int = 1000
+    # Requests holding the event loop longer than this are logged with their route
+    EVENT_LOOP_BLOCK_THRESHOLD_MS: float = 100
+    # How often the event loop lag is sampled
+    EVENT_LOOP_LAG_SAMPLE_INTERVAL_MS: float = 100
+    # Internal metrics endpoints require this value in the X-Metrics-Token
+    # header; they are disabled (404) while it is empty
+    METRICS_TOKEN: str = ""
+    # Analytics handlers running at once in the threadpool
+    ANALYTICS_MAX_THREADS: int = 4
+    # Token bucket rate limits: login/register per client IP, analytics and
+    # training imports per user. "memory" keeps buckets per worker, "database"
+    # shares them between workers through the rate_limit_buckets table
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_AUTH_PER_MINUTE: float = 10
+    RATE_LIMIT_AUTH_BURST: int = 10
+    RATE_LIMIT_ANALYTICS_PER_MINUTE: float = 60
+    RATE_LIMIT_ANALYTICS_BURST: int = 30
+    RATE_LIMIT_IMPORT_PER_MINUTE: float = 2
+    RATE_LIMIT_IMPORT_BURST: int = 3
 
     class Config:
         # .env file is in the project root (parent of backend directory)
@@ -1,15 +1,25 @@
-from fastapi import Depends, HTTPException, status
+import secrets
+
+from fastapi import Cookie, Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import AsyncGenerator, Generator, Optional
 
-from src.infrastructure.database.session import get_db
-from src.infrastructure.repositories import UserRepositoryImpl
+from src.infrastructure.database.replicas import ReadYourWritesCookie
+from src.infrastructure.database.session import get_db, get_database
+from src.infrastructure.repositories import AsyncUserRepositoryImpl, UserRepositoryImpl
 from src.infrastructure.auth.jwt_service import JWTService
+from src.infrastructure.auth.principal_cache import principal_cache
+from src.infrastructure.auth.revocation_filter import revocation_filter
+from src.infrastructure.settings import settings
+from src.domain.entities.user import User
 from src.domain.repositories.user_repository import IUserRepository
 
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
+# Set by ReadYourWritesMiddleware after a user's commit, checked by the read session dependencies
+read_your_writes_cookie = ReadYourWritesCookie(settings.SECRET_KEY, settings.REPLICA_READ_YOUR_WRITES_SECONDS)
 
 
 def get_user_repository(db: Session = Depends(get_db)) -> UserRepositoryImpl:
@@ -17,15 +27,58 @@ def get_user_repository(db: Session = Depends(get_db)) -> UserRepositoryImpl:
     return UserRepositoryImpl(db)
 
 
+def _token_payload(credentials: Optional[HTTPAuthorizationCredentials]) -> Optional[dict]:
+    """Payload of a valid, unrevoked bearer token with a numeric subject, None otherwise (no database lookup)."""
+    if credentials is None:
+        return None
+    payload = JWTService.verify_token(credentials.credentials)
+    subject = payload.get("sub") if payload else None
+    if subject is None or not str(subject).isdigit():
+        return None
+    # Tokens of logged-out sessions (checked in memory, see RevocationFilter)
+    session_id = payload.get("sid")
+    if session_id is not None and revocation_filter.is_revoked(session_id):
+        return None
+    return payload
+
+
+def _token_user_id(credentials: Optional[HTTPAuthorizationCredentials]) -> Optional[int]:
+    """User ID from a valid bearer token, None otherwise (no database lookup)."""
+    payload = _token_payload(credentials)
+    return int(payload["sub"]) if payload else None
+
+
+def _principal_cached(user_id: int, payload: dict) -> bool:
+    """Whether the principal cache vouches for the token's user, so the lookup can be skipped."""
+    version = principal_cache.get(user_id)
+    # Tokens issued before the password version claim only need the user to exist
+    return version is not None and payload.get("pwv") in (None, version)
+
+
+def _check_principal(user: Optional[User], payload: dict) -> None:
+    """Raise 401 unless the looked-up user exists and the token postdates its password; caches the user."""
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
+    version = user.password_version
+    principal_cache.put(user.id, version)
+    if payload.get("pwv") not in (None, version):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
 def get_current_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     user_repository: IUserRepository = Depends(get_user_repository),
+    db: Session = Depends(get_db),
 ) -> int:
     """Get current user ID from JWT token."""
-    jwt_service = JWTService()
-    token = credentials.credentials
-    payload = jwt_service.verify_token(token)
-
+    payload = _token_payload(credentials)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -33,22 +86,78 @@ def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-        )
+    # Verify user exists (no query while the principal cache vouches for it)
+    user_id = int(payload["sub"])
+    if not _principal_cached(user_id, payload):
+        _check_principal(user_repository.get_by_id(user_id), payload)
 
-    # Verify user exists
-    user = user_repository.get_by_id(int(user_id))
-    if user is None:
+    # Commits on this request's session pin the user's reads to the primary
+    db.info["user_id"] = user_id
+    return user_id
+
+
+def _wrote_recently(
+    credentials: Optional[HTTPAuthorizationCredentials],
+    read_primary_until: Optional[str],
+) -> bool:
+    """Whether the caller's read-your-writes cookie is still valid for the token's user."""
+    return read_your_writes_cookie.is_recent(read_primary_until, _token_user_id(credentials))
+
+
+def get_read_db(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    read_primary_until: Optional[str] = Cookie(None, alias=ReadYourWritesCookie.NAME),
+    db: Session = Depends(get_db),
+) -> Generator[Session, None, None]:
+    """Dependency for read-only endpoints: a replica session unless the caller has just written.
+
+    On the primary it is the request's get_db session (the one get_current_user_id
+    uses), so a request never holds two primary connections.
+    """
+    database = get_database()
+    if not database.replica_engines or _wrote_recently(credentials, read_primary_until):
+        yield db
+        return
+    yield from database.get_read_session()
+
+
+async def get_async_read_db(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    read_primary_until: Optional[str] = Cookie(None, alias=ReadYourWritesCookie.NAME),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Async counterpart of get_read_db, for read endpoints served on the event loop."""
+    primary = _wrote_recently(credentials, read_primary_until)
+    async for db in get_database().get_async_read_session(primary):
+        yield db
+
+
+async def get_current_user_id_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> int:
+    """Async counterpart of get_current_user_id, for endpoints served on the event loop."""
+    payload = _token_payload(credentials)
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-
-    return int(user_id)
+    user_id = int(payload["sub"])
+    if _principal_cached(user_id, payload):
+        return user_id
+
+    # Checked on the primary (a new user may not have reached the replicas yet):
+    # on the request's read session when it is a primary one, so a request
+    # holds a single connection
+    database = get_database()
+    if db.bind is database.async_engine:
+        user = await AsyncUserRepositoryImpl(db).get_by_id(user_id)
+    else:
+        async with database.AsyncSessionLocal() as primary:
+            user = await AsyncUserRepositoryImpl(primary).get_by_id(user_id)
+    _check_principal(user, payload)
+    return user_id
 
 
 def get_optional_user_id(
@@ -56,27 +165,27 @@ def get_optional_user_id(
     user_repository: IUserRepository = Depends(get_user_repository),
 ) -> Optional[int]:
     """Get current user ID from JWT token (optional - returns None if not authenticated)."""
-    if credentials is None:
+    payload = _token_payload(credentials)
+    if payload is None:
         return None
-    
-    try:
-        jwt_service = JWTService()
-        token = credentials.credentials
-        payload = jwt_service.verify_token(token)
 
-        if payload is None:
+    user_id = int(payload["sub"])
+    if not _principal_cached(user_id, payload):
+        try:
+            _check_principal(user_repository.get_by_id(user_id), payload)
+        except HTTPException:
             return None
+    return user_id
 
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
 
-        # Verify user exists
-        user = user_repository.get_by_id(int(user_id))
-        if user is None:
-            return None
+def require_metrics_token(x_metrics_token: Optional[str] = Header(None)) -> None:
+    """Guard for internal metrics endpoints: the X-Metrics-Token header must match METRICS_TOKEN.
 
-        return int(user_id)
-    except Exception:
-        # If any error occurs (missing token, invalid token, etc.), return None
-        return None
+    Without a configured token the endpoints do not exist (404).
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_metrics_token is None or not secrets.compare_digest(
+        x_metrics_token.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid metrics token")
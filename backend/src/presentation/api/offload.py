@@ -0,0 +1,45 @@
+import functools
+from typing import Any, Callable, Optional
+
+from anyio import CapacityLimiter, to_thread
+from fastapi import HTTPException, status
+
+
+def offload(
+    max_threads: int, max_queue: Optional[int] = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator running a blocking handler body in the threadpool, at most
+    max_threads at a time across every handler decorated by the same decorator.
+
+    Plain `def` handlers already run in the shared threadpool; this bounds a
+    group of expensive handlers so they cannot take every thread from the rest.
+    With max_queue, calls arriving while that many are already waiting for a
+    thread are shed with 503 instead of queueing without bound.
+    """
+    limiter: Optional[CapacityLimiter] = None
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal limiter
+            if limiter is None:
+                # Created lazily so it binds to the running event loop
+                limiter = CapacityLimiter(max_threads)
+            if (
+                max_queue is not None
+                and limiter.available_tokens == 0
+                and limiter.statistics().tasks_waiting >= max_queue
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Server is busy, retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            return await to_thread.run_sync(
+                functools.partial(func, *args, **kwargs), limiter=limiter
+            )
+
+        return wrapper
+
+    return decorator
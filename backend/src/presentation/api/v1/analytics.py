@@ -13,10 +13,16 @@ from src.infrastructure.repositories import (
 from src.domain.services.analytics_service import AnalyticsService
 from src.domain.entities.training import Training
 from src.domain.entities.set import Set
-from src.presentation.api.dependencies import get_current_user_id
+from src.presentation.api.dependencies import get_current_user_id, get_read_db
+from src.presentation.api.offload import offload
+from src.infrastructure.settings import settings
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+# Analytics aggregate whole training histories in Python; bound them so they
+# cannot occupy every threadpool thread
+analytics_offload = offload(settings.ANALYTICS_MAX_THREADS)
+
 
 def get_training_repository(db: Session = Depends(get_db)) -> TrainingRepositoryImpl:
     """Dependency to get training repository."""
@@ -53,11 +59,12 @@ def adjust_date_range(start_date: Optional[datetime], end_date: Optional[datetim
 
 
 @router.get("/weight-progress")
-async def get_weight_progress(
+@analytics_offload
+def get_weight_progress(
     exercise_id: int,
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get weight progress for a specific exercise."""
@@ -86,11 +93,12 @@ async def get_weight_progress(
 
 
 @router.get("/volume-progress")
-async def get_volume_progress(
+@analytics_offload
+def get_volume_progress(
     exercise_id: int,
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get volume progress for a specific exercise."""
@@ -119,7 +127,8 @@ async def get_volume_progress(
 
 
 @router.get("/one-rep-max")
-async def calculate_one_rep_max(
+@analytics_offload
+def calculate_one_rep_max(
     weight: float = Query(..., description="Weight used"),
     reps: int = Query(..., description="Number of repetitions"),
     formula: str = Query("brzycki", description="Formula to use (brzycki, epley, lombardi)"),
@@ -138,10 +147,11 @@ async def calculate_one_rep_max(
 
 
 @router.get("/training-frequency")
-async def get_training_frequency(
+@analytics_offload
+def get_training_frequency(
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get training frequency over time (number of trainings per date)."""
@@ -160,10 +170,11 @@ async def get_training_frequency(
 
 
 @router.get("/total-volume")
-async def get_total_volume(
+@analytics_offload
+def get_total_volume(
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get total volume over time (all exercises combined)."""
@@ -182,8 +193,9 @@ async def get_total_volume(
 
 
 @router.get("/summary")
-async def get_analytics_summary(
-    db: Session = Depends(get_db),
+@analytics_offload
+def get_analytics_summary(
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get summary analytics (total trainings, total volume, etc.)."""
@@ -206,10 +218,11 @@ async def get_analytics_summary(
 
 
 @router.get("/user-weight-progress")
-async def get_user_weight_progress(
+@analytics_offload
+def get_user_weight_progress(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get user weight progress over time."""
@@ -228,10 +241,11 @@ async def get_user_weight_progress(
 
 
 @router.get("/user-bmi-progress")
-async def get_user_bmi_progress(
+@analytics_offload
+def get_user_bmi_progress(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get user BMI progress over time."""
@@ -250,8 +264,9 @@ async def get_user_bmi_progress(
 
 
 @router.get("/streak")
-async def get_training_streak(
-    db: Session = Depends(get_db),
+@analytics_offload
+def get_training_streak(
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get current training streak (consecutive days with at least one completed training)."""
@@ -266,8 +281,9 @@ async def get_training_streak(
 
 
 @router.get("/prs")
-async def get_all_prs(
-    db: Session = Depends(get_db),
+@analytics_offload
+def get_all_prs(
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
     limit: Optional[int] = Query(10, description="Maximum number of PRs to return"),
 ):
@@ -279,9 +295,11 @@ async def get_all_prs(
     prs = AnalyticsService.get_all_prs(trainings)
 
     # Enrich with exercise names
+    top_prs = prs[:limit]
+    exercises = exercise_repository.get_many(pr['exercise_id'] for pr in top_prs)
     enriched_prs = []
-    for pr in prs[:limit]:
-        exercise = exercise_repository.get_by_id(pr['exercise_id'])
+    for pr in top_prs:
+        exercise = exercises.get(pr['exercise_id'])
         if exercise:
             enriched_prs.append({
                 'exercise_id': pr['exercise_id'],
@@ -298,9 +316,10 @@ async def get_all_prs(
 
 
 @router.get("/exercise/{exercise_id}/pr")
-async def get_exercise_pr(
+@analytics_offload
+def get_exercise_pr(
     exercise_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get personal record (PR) for a specific exercise."""
@@ -333,12 +352,13 @@ async def get_exercise_pr(
 
 
 @router.get("/exercise/{exercise_id}/1rm-progress")
-async def get_exercise_1rm_progress(
+@analytics_offload
+def get_exercise_1rm_progress(
     exercise_id: int,
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     formula: str = Query("brzycki", description="Formula to use (brzycki, epley, lombardi)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get 1RM progress for a specific exercise."""
@@ -368,10 +388,11 @@ async def get_exercise_1rm_progress(
 
 
 @router.get("/muscle-groups/volume")
-async def get_muscle_group_volume(
+@analytics_offload
+def get_muscle_group_volume(
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get total volume by muscle group."""
@@ -388,9 +409,10 @@ async def get_muscle_group_volume(
     volume_by_group = AnalyticsService.get_muscle_group_volume(trainings, exercise_repository)
 
     # Enrich with muscle group names
+    muscle_groups = muscle_group_repository.get_many(volume_by_group.keys())
     result = []
     for muscle_group_id, volume in volume_by_group.items():
-        muscle_group = muscle_group_repository.get_by_id(muscle_group_id)
+        muscle_group = muscle_groups.get(muscle_group_id)
         if muscle_group:
             result.append({
                 "muscle_group_id": muscle_group_id,
@@ -407,10 +429,11 @@ async def get_muscle_group_volume(
 
 
 @router.get("/muscle-groups/frequency")
-async def get_muscle_group_frequency(
+@analytics_offload
+def get_muscle_group_frequency(
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get training frequency by muscle group."""
@@ -427,9 +450,10 @@ async def get_muscle_group_frequency(
     frequency_by_group = AnalyticsService.get_muscle_group_frequency(trainings, exercise_repository)
 
     # Enrich with muscle group names
+    muscle_groups = muscle_group_repository.get_many(frequency_by_group.keys())
     result = []
     for muscle_group_id, frequency in frequency_by_group.items():
-        muscle_group = muscle_group_repository.get_by_id(muscle_group_id)
+        muscle_group = muscle_groups.get(muscle_group_id)
         if muscle_group:
             result.append({
                 "muscle_group_id": muscle_group_id,
@@ -446,8 +470,9 @@ async def get_muscle_group_frequency(
 
 
 @router.get("/new-records")
-async def get_new_records(
-    db: Session = Depends(get_db),
+@analytics_offload
+def get_new_records(
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get new records: first-time exercises and new PRs from the latest training."""
@@ -458,9 +483,10 @@ async def get_new_records(
     new_records = AnalyticsService.get_new_records(trainings)
 
     # Enrich with exercise names
+    exercises = exercise_repository.get_many(record['exercise_id'] for record in new_records)
     enriched_records = []
     for record in new_records:
-        exercise = exercise_repository.get_by_id(record['exercise_id'])
+        exercise = exercises.get(record['exercise_id'])
         if exercise:
             enriched_records.append({
                 'type': record['type'],
@@ -2,27 +2,45 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.session import get_db
-from src.infrastructure.repositories import UserRepositoryImpl
+from src.infrastructure.settings import settings
+from src.infrastructure.repositories import RefreshTokenRepositoryImpl, UserRepositoryImpl
 from src.application.use_cases.auth.register_user import RegisterUserUseCase
 from src.application.use_cases.auth.authenticate_user import AuthenticateUserUseCase
-from src.application.dto.auth_dto import RegisterUserDTO, LoginUserDTO
+from src.application.use_cases.auth.refresh_access_token import RefreshAccessTokenUseCase
+from src.application.use_cases.auth.logout_user import LogoutUserUseCase
+from src.application.dto.auth_dto import RegisterUserDTO, LoginUserDTO, RefreshTokenDTO
+from src.presentation.api.offload import offload
 from src.presentation.schemas.auth_schemas import (
     RegisterRequest,
     LoginRequest,
+    RefreshTokenRequest,
     TokenResponse,
     UserResponse,
 )
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# bcrypt takes ~250 ms of CPU per hash; register and login get their own bounded
+# threads so a burst of logins cannot take the threadpool from other requests,
+# and they are shed with 503 once too many are waiting
+password_hashing_offload = offload(
+    settings.PASSWORD_HASH_MAX_THREADS, max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
+
 
 def get_user_repository(db: Session = Depends(get_db)) -> UserRepositoryImpl:
     """Dependency to get user repository."""
     return UserRepositoryImpl(db)
 
 
+def get_refresh_token_repository(db: Session = Depends(get_db)) -> RefreshTokenRepositoryImpl:
+    """Dependency to get refresh token repository."""
+    return RefreshTokenRepositoryImpl(db)
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(
+@password_hashing_offload
+def register(
     request: RegisterRequest,
     db: Session = Depends(get_db),
 ):
@@ -37,23 +55,26 @@ async def register(
             password=request.password,
         )
         result = use_case.execute(dto)
+        db.commit()
         return UserResponse(**result.__dict__)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(
+@password_hashing_offload
+def login(
     request: LoginRequest,
     db: Session = Depends(get_db),
 ):
-    """Login user and get access token."""
+    """Login user and get access and refresh tokens."""
     user_repository = get_user_repository(db)
-    use_case = AuthenticateUserUseCase(user_repository)
+    use_case = AuthenticateUserUseCase(user_repository, get_refresh_token_repository(db))
 
     try:
         dto = LoginUserDTO(email=request.email, password=request.password)
         result = use_case.execute(dto)
+        db.commit()  # Persists the refresh token and a rehashed password
         return TokenResponse(**result.__dict__)
     except ValueError as e:
         raise HTTPException(
@@ -61,6 +82,32 @@ async def login(
         )
 
 
+@router.post("/refresh", response_model=TokenResponse)
+def refresh(
+    request: RefreshTokenRequest,
+    db: Session = Depends(get_db),
+):
+    """Exchange a refresh token for a new access token and refresh token."""
+    use_case = RefreshAccessTokenUseCase(get_user_repository(db), get_refresh_token_repository(db))
 
+    try:
+        result = use_case.execute(RefreshTokenDTO(refresh_token=request.refresh_token))
+        db.commit()
+        return TokenResponse(**result.__dict__)
+    except ValueError:
+        db.commit()  # Keeps the session revocation of a reused token
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
+        )
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    request: RefreshTokenRequest,
+    db: Session = Depends(get_db),
+):
+    """End the refresh token's login session, including its access tokens."""
+    LogoutUserUseCase(get_refresh_token_repository(db)).execute(
+        RefreshTokenDTO(refresh_token=request.refresh_token)
+    )
+    db.commit()
@@ -11,7 +11,7 @@ from src.application.use_cases.exercises.update_exercise import UpdateExerciseUs
 from src.application.use_cases.exercises.delete_exercise import DeleteExerciseUseCase
 from src.application.dto.exercise_dto import CreateExerciseDTO, UpdateExerciseDTO
 from src.presentation.schemas.exercise_schemas import ExerciseCreate, ExerciseUpdate, ExerciseResponse
-from src.presentation.api.dependencies import get_current_user_id, get_optional_user_id
+from src.presentation.api.dependencies import get_current_user_id, get_optional_user_id, get_read_db
 
 router = APIRouter(prefix="/exercises", tags=["exercises"])
 
@@ -22,7 +22,7 @@ def get_exercise_repository(db: Session = Depends(get_db)) -> ExerciseRepository
 
 
 @router.post("", response_model=ExerciseResponse, status_code=status.HTTP_201_CREATED)
-async def create_exercise(
+def create_exercise(
     request: ExerciseCreate,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -39,15 +39,16 @@ async def create_exercise(
             image_path=request.image_path,
         )
         result = use_case.execute(dto, user_id=current_user_id)
+        db.commit()
         return ExerciseResponse(**result.__dict__)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("", response_model=List[ExerciseResponse])
-async def get_exercises(
+def get_exercises(
     include_system: bool = True,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: Optional[int] = Depends(get_optional_user_id),
 ):
     """Get all exercises (public endpoint - authentication optional)."""
@@ -59,9 +60,9 @@ async def get_exercises(
 
 
 @router.get("/{exercise_id}", response_model=ExerciseResponse)
-async def get_exercise(
+def get_exercise(
     exercise_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get exercise by ID."""
@@ -75,7 +76,7 @@ async def get_exercise(
 
 
 @router.put("/{exercise_id}", response_model=ExerciseResponse)
-async def update_exercise(
+def update_exercise(
     exercise_id: int,
     request: ExerciseUpdate,
     db: Session = Depends(get_db),
@@ -93,13 +94,14 @@ async def update_exercise(
             image_path=request.image_path,
         )
         result = use_case.execute(exercise_id, dto, current_user_id)
+        db.commit()
         return ExerciseResponse(**result.__dict__)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.delete("/{exercise_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_exercise(
+def delete_exercise(
     exercise_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -110,6 +112,7 @@ async def delete_exercise(
 
     try:
         use_case.execute(exercise_id, current_user_id)
+        db.commit()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from src.infrastructure.database.session import get_db
+from src.presentation.api.dependencies import get_read_db
 from src.infrastructure.repositories import MuscleGroupRepositoryImpl
 from src.application.use_cases.muscle_groups.create_muscle_group import CreateMuscleGroupUseCase
 from src.application.use_cases.muscle_groups.get_muscle_groups import GetMuscleGroupsUseCase
@@ -18,7 +19,7 @@ def get_muscle_group_repository(db: Session = Depends(get_db)) -> MuscleGroupRep
 
 
 @router.post("", response_model=MuscleGroupResponse, status_code=status.HTTP_201_CREATED)
-async def create_muscle_group(
+def create_muscle_group(
     request: MuscleGroupCreate,
     db: Session = Depends(get_db),
 ):
@@ -29,15 +30,16 @@ async def create_muscle_group(
     try:
         dto = CreateMuscleGroupDTO(name=request.name)
         result = use_case.execute(dto)
+        db.commit()
         return MuscleGroupResponse(**result.__dict__)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("", response_model=List[MuscleGroupResponse])
-async def get_muscle_groups(
+def get_muscle_groups(
     include_system: bool = True,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get all muscle groups."""
     muscle_group_repository = get_muscle_group_repository(db)
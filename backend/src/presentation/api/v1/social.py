@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 
 from src.infrastructure.database.session import get_db
+from src.infrastructure.read_models import TrainingReadModel
 from src.infrastructure.repositories import (
+    FeedRepositoryImpl,
     FollowRepositoryImpl,
     TrainingReactionRepositoryImpl,
     TrainingCommentRepositoryImpl,
@@ -26,17 +28,23 @@ from src.application.use_cases.social.get_training_reactions import GetTrainingR
 from src.application.use_cases.social.add_comment import AddCommentUseCase
 from src.application.use_cases.social.delete_comment import DeleteCommentUseCase
 from src.application.use_cases.social.get_training_comments import GetTrainingCommentsUseCase
+from src.application.use_cases.social.get_social_summaries import GetSocialSummariesUseCase
+from src.application.use_cases.social.get_feed import GetFeedUseCase
+from src.domain.entities.follow import FollowStatus
 from src.domain.entities.training_reaction import ReactionType
-from src.presentation.api.dependencies import get_current_user_id
+from src.presentation.api.dependencies import get_current_user_id, get_read_db
+from src.presentation.api.pagination import decode_cursor, paginate
 from src.presentation.schemas.social_schemas import (
     FollowResponse,
     ReactionRequest,
     ReactionResponse,
     CommentRequest,
     CommentResponse,
+    FeedItemResponse,
+    TrainingSocialSummaryResponse,
 )
 from src.presentation.schemas.auth_schemas import UserResponse
-from src.presentation.schemas.training_schemas import TrainingResponse
+from src.presentation.schemas.training_schemas import TrainingResponse, TrainingSummaryResponse
 
 router = APIRouter(prefix="/social", tags=["social"])
 
@@ -66,8 +74,13 @@ def get_training_repository(db: Session = Depends(get_db)) -> TrainingRepository
     return TrainingRepositoryImpl(db)
 
 
+def get_feed_repository(db: Session = Depends(get_db)) -> FeedRepositoryImpl:
+    """Dependency to get activity feed repository."""
+    return FeedRepositoryImpl(db)
+
+
 @router.post("/follow/{user_id}", response_model=FollowResponse, status_code=status.HTTP_201_CREATED)
-async def follow_user(
+def follow_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -78,6 +91,7 @@ async def follow_user(
 
     try:
         result = use_case.execute(current_user_id, user_id)
+        db.commit()
         return FollowResponse(
             id=result.id,
             follower_id=result.follower_id,
@@ -90,83 +104,103 @@ async def follow_user(
 
 
 @router.delete("/follow/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def unfollow_user(
+def unfollow_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Unfollow a user."""
     follow_repository = get_follow_repository(db)
-    use_case = UnfollowUserUseCase(follow_repository)
+    use_case = UnfollowUserUseCase(follow_repository, get_feed_repository(db))
 
     try:
         use_case.execute(current_user_id, user_id)
+        db.commit()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/followers", response_model=List[FollowResponse])
-async def get_followers(
-    db: Session = Depends(get_db),
+def get_followers(
+    response: Response,
+    status_filter: Optional[FollowStatus] = Query(None, alias="status", description="Only follows with this status"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
-    """Get followers of current user."""
-    follow_repository = get_follow_repository(db)
-    user_repository = get_user_repository(db)
-    use_case = GetFollowersUseCase(follow_repository)
+    """Get followers of current user, newest first."""
+    before = decode_cursor(cursor, int)
+    use_case = GetFollowersUseCase(get_follow_repository(db))
 
-    results = use_case.execute(current_user_id)
-    response_list = []
-    for r in results:
-        # Get follower username
-        follower_user = user_repository.get_by_id(r.follower_id)
-        follower_username = follower_user.username if follower_user else None
-        
-        response_list.append(
-            FollowResponse(
-                id=r.id,
-                follower_id=r.follower_id,
-                following_id=r.following_id,
-                status=r.status.value,
-                created_at=r.created_at,
-                follower_username=follower_username,
-            )
+    results = use_case.execute(current_user_id, status_filter, before[0] if before else None, limit + 1)
+    return [
+        FollowResponse(
+            id=r.id,
+            follower_id=r.follower_id,
+            following_id=r.following_id,
+            status=r.status.value,
+            created_at=r.created_at,
+            follower_username=follower_username,
         )
-    return response_list
+        for r, follower_username in paginate(response, results, limit, lambda row: (row[0].id,))
+    ]
 
 
 @router.get("/following", response_model=List[FollowResponse])
-async def get_following(
-    db: Session = Depends(get_db),
+def get_following(
+    response: Response,
+    status_filter: Optional[FollowStatus] = Query(None, alias="status", description="Only follows with this status"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
-    """Get users that current user is following."""
-    follow_repository = get_follow_repository(db)
-    user_repository = get_user_repository(db)
-    use_case = GetFollowingUseCase(follow_repository)
-
-    results = use_case.execute(current_user_id)
-    response_list = []
-    for r in results:
-        # Get following username
-        following_user = user_repository.get_by_id(r.following_id)
-        following_username = following_user.username if following_user else None
-        
-        response_list.append(
-            FollowResponse(
-                id=r.id,
-                follower_id=r.follower_id,
-                following_id=r.following_id,
-                status=r.status.value,
-                created_at=r.created_at,
-                following_username=following_username,
-            )
+    """Get users that current user is following, newest first."""
+    before = decode_cursor(cursor, int)
+    use_case = GetFollowingUseCase(get_follow_repository(db))
+
+    results = use_case.execute(current_user_id, status_filter, before[0] if before else None, limit + 1)
+    return [
+        FollowResponse(
+            id=r.id,
+            follower_id=r.follower_id,
+            following_id=r.following_id,
+            status=r.status.value,
+            created_at=r.created_at,
+            following_username=following_username,
+        )
+        for r, following_username in paginate(response, results, limit, lambda row: (row[0].id,))
+    ]
+
+
+@router.get("/feed", response_model=List[FeedItemResponse])
+def get_feed(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_read_db),
+    current_user_id: int = Depends(get_current_user_id),
+):
+    """Get completed trainings of followed users, newest first."""
+    before = decode_cursor(cursor, int)
+    use_case = GetFeedUseCase(get_feed_repository(db))
+
+    results = use_case.execute(current_user_id, before[0] if before else None, limit + 1)
+    return [
+        FeedItemResponse(
+            id=r.id,
+            author_id=r.author_id,
+            author_username=r.author_username,
+            created_at=r.created_at,
+            training=TrainingSummaryResponse(**r.training.__dict__),
         )
-    return response_list
+        for r in paginate(response, results, limit, lambda item: (item.id,))
+    ]
 
 
 @router.post("/follow/{user_id}/approve", response_model=FollowResponse)
-async def approve_follow_request(
+def approve_follow_request(
     user_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -178,6 +212,7 @@ async def approve_follow_request(
 
     try:
         result = use_case.execute(user_id, current_user_id)
+        db.commit()
         # Get follower username
         follower_user = user_repository.get_by_id(result.follower_id)
         follower_username = follower_user.username if follower_user else None
@@ -195,7 +230,7 @@ async def approve_follow_request(
 
 
 @router.post("/follow/{user_id}/reject", response_model=FollowResponse)
-async def reject_follow_request(
+def reject_follow_request(
     user_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -207,6 +242,7 @@ async def reject_follow_request(
 
     try:
         result = use_case.execute(user_id, current_user_id)
+        db.commit()
         # Get follower username
         follower_user = user_repository.get_by_id(result.follower_id)
         follower_username = follower_user.username if follower_user else None
@@ -224,9 +260,9 @@ async def reject_follow_request(
 
 
 @router.get("/users/{user_id}/profile", response_model=UserResponse)
-async def get_user_profile(
+def get_user_profile(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get user profile (requires approved follow relationship)."""
@@ -242,32 +278,29 @@ async def get_user_profile(
 
 
 @router.get("/users/{user_id}/trainings", response_model=List[TrainingResponse])
-async def get_user_trainings(
+def get_user_trainings(
     user_id: int,
     start_date: Optional[datetime] = Query(None, description="Start date filter"),
     end_date: Optional[datetime] = Query(None, description="End date filter"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get user trainings (requires approved follow relationship)."""
-    from src.presentation.api.v1.trainings import dto_to_response
-    
-    training_repository = get_training_repository(db)
     follow_repository = get_follow_repository(db)
-    use_case = GetUserTrainingsUseCase(training_repository, follow_repository)
+    use_case = GetUserTrainingsUseCase(follow_repository)
 
     try:
-        results = use_case.execute(user_id, current_user_id, start_date, end_date)
-        return [dto_to_response(dto) for dto in results]
+        use_case.check_access(user_id, current_user_id)
+        return TrainingReadModel(db).list_for_user(user_id, start_date, end_date)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
 
 
 @router.get("/users/search", response_model=List[UserResponse])
-async def search_users(
+def search_users(
     q: str = Query(..., min_length=1, description="Search query for username"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Search users by username."""
@@ -279,7 +312,7 @@ async def search_users(
 
 
 @router.post("/trainings/{training_id}/reactions", response_model=ReactionResponse, status_code=status.HTTP_201_CREATED)
-async def add_reaction(
+def add_reaction(
     training_id: int,
     request: ReactionRequest,
     db: Session = Depends(get_db),
@@ -287,11 +320,12 @@ async def add_reaction(
 ):
     """Add a reaction to a training."""
     reaction_repository = get_reaction_repository(db)
-    use_case = AddReactionUseCase(reaction_repository)
+    use_case = AddReactionUseCase(reaction_repository, get_training_repository(db))
 
     try:
         reaction_type = ReactionType(request.reaction_type)
         result = use_case.execute(training_id, current_user_id, reaction_type)
+        db.commit()
         return ReactionResponse(
             id=result.id,
             training_id=result.training_id,
@@ -304,7 +338,7 @@ async def add_reaction(
 
 
 @router.delete("/trainings/{training_id}/reactions", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_reaction(
+def remove_reaction(
     training_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -315,14 +349,15 @@ async def remove_reaction(
 
     try:
         use_case.execute(training_id, current_user_id)
+        db.commit()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/trainings/{training_id}/reactions", response_model=List[ReactionResponse])
-async def get_training_reactions(
+def get_training_reactions(
     training_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get all reactions for a training."""
     reaction_repository = get_reaction_repository(db)
@@ -341,8 +376,30 @@ async def get_training_reactions(
     ]
 
 
+@router.get("/trainings/summaries", response_model=List[TrainingSocialSummaryResponse])
+def get_training_social_summaries(
+    training_ids: List[int] = Query(..., description="Training IDs (repeat the parameter, at most 100)"),
+    db: Session = Depends(get_read_db),
+    current_user_id: int = Depends(get_current_user_id),
+):
+    """Get reaction counts by type, the current user's reaction and comment count of many trainings."""
+    if len(training_ids) > 100:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At most 100 training IDs")
+    use_case = GetSocialSummariesUseCase(get_reaction_repository(db), get_comment_repository(db))
+
+    return [
+        TrainingSocialSummaryResponse(
+            training_id=r.training_id,
+            reaction_counts={reaction_type.value: count for reaction_type, count in r.reaction_counts.items()},
+            my_reaction=r.my_reaction.value if r.my_reaction else None,
+            comment_count=r.comment_count,
+        )
+        for r in use_case.execute(training_ids, current_user_id)
+    ]
+
+
 @router.post("/trainings/{training_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
-async def add_comment(
+def add_comment(
     training_id: int,
     request: CommentRequest,
     db: Session = Depends(get_db),
@@ -351,10 +408,11 @@ async def add_comment(
     """Add a comment to a training."""
     comment_repository = get_comment_repository(db)
     user_repository = get_user_repository(db)
-    use_case = AddCommentUseCase(comment_repository)
+    use_case = AddCommentUseCase(comment_repository, get_training_repository(db))
 
     try:
         result = use_case.execute(training_id, current_user_id, request.text)
+        db.commit()
         # Get username
         user = user_repository.get_by_id(current_user_id)
         username = user.username if user else None
@@ -373,7 +431,7 @@ async def add_comment(
 
 
 @router.delete("/trainings/{training_id}/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_comment(
+def delete_comment(
     training_id: int,
     comment_id: int,
     db: Session = Depends(get_db),
@@ -385,36 +443,35 @@ async def delete_comment(
 
     try:
         use_case.execute(comment_id, current_user_id)
+        db.commit()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/trainings/{training_id}/comments", response_model=List[CommentResponse])
-async def get_training_comments(
+def get_training_comments(
     training_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_read_db),
 ):
-    """Get all comments for a training."""
-    comment_repository = get_comment_repository(db)
-    user_repository = get_user_repository(db)
-    use_case = GetTrainingCommentsUseCase(comment_repository)
+    """Get comments for a training, oldest first."""
+    after = decode_cursor(cursor, datetime.fromisoformat, int)
+    use_case = GetTrainingCommentsUseCase(get_comment_repository(db))
 
-    results = use_case.execute(training_id)
-    comments = []
-    for r in results:
-        user = user_repository.get_by_id(r.user_id)
-        username = user.username if user else None
-        comments.append(
-            CommentResponse(
-                id=r.id,
-                training_id=r.training_id,
-                user_id=r.user_id,
-                username=username,
-                text=r.text,
-                created_at=r.created_at,
-                updated_at=r.updated_at,
-            )
+    results = use_case.execute(training_id, tuple(after) if after else None, limit + 1)
+    return [
+        CommentResponse(
+            id=r.id,
+            training_id=r.training_id,
+            user_id=r.user_id,
+            username=username,
+            text=r.text,
+            created_at=r.created_at,
+            updated_at=r.updated_at,
         )
-    return comments
-
-
+        for r, username in paginate(
+            response, results, limit, lambda row: (row[0].created_at.isoformat(), row[0].id)
+        )
+    ]
@@ -22,7 +22,7 @@ from src.presentation.schemas.training_template_schemas import (
     ImplementationTemplateBase,
     SetTemplateBase,
 )
-from src.presentation.api.dependencies import get_current_user_id
+from src.presentation.api.dependencies import get_current_user_id, get_read_db
 
 router = APIRouter(prefix="/training-templates", tags=["training-templates"])
 
@@ -62,7 +62,7 @@ def dto_to_response(dto) -> TemplateResponse:
 
 
 @router.post("", response_model=TemplateResponse, status_code=status.HTTP_201_CREATED)
-async def create_template(
+def create_template(
     request: TemplateCreate,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -118,15 +118,16 @@ async def create_template(
         )
 
         result = use_case.execute(dto, current_user_id)
+        db.commit()
         return dto_to_response(result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("", response_model=List[TemplateResponse])
-async def get_templates(
+def get_templates(
     include_system: bool = True,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get all training templates."""
@@ -138,9 +139,9 @@ async def get_templates(
 
 
 @router.get("/{template_id}", response_model=TemplateResponse)
-async def get_template(
+def get_template(
     template_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get training template by ID."""
     template_repository = get_template_repository(db)
@@ -153,7 +154,7 @@ async def get_template(
 
 
 @router.put("/{template_id}", response_model=TemplateResponse)
-async def update_template(
+def update_template(
     template_id: int,
     request: TemplateUpdate,
     db: Session = Depends(get_db),
@@ -187,13 +188,14 @@ async def update_template(
         )
 
         result = use_case.execute(template_id, dto, current_user_id)
+        db.commit()
         return dto_to_response(result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.delete("/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_template(
+def delete_template(
     template_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -204,6 +206,7 @@ async def delete_template(
 
     try:
         use_case.execute(template_id, current_user_id)
+        db.commit()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
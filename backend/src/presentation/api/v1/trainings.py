@@ -1,12 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import os
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional, Union
 from datetime import datetime
 
-from src.infrastructure.database.session import get_db
-from src.infrastructure.repositories import TrainingRepositoryImpl, TrainingTemplateRepositoryImpl, FollowRepositoryImpl
+from src.domain.entities.training_import import ImportFormat
+from src.infrastructure.database.session import get_db, create_session
+from src.infrastructure.importers import UploadTooLargeError, save_upload, read_training_rows
+from src.infrastructure.read_models import AsyncTrainingReadModel, TrainingReadModel
+from src.infrastructure.repositories import (
+    AsyncFollowRepositoryImpl,
+    AsyncTrainingRepositoryImpl,
+    FeedRepositoryImpl,
+    TrainingRepositoryImpl,
+    TrainingTemplateRepositoryImpl,
+    ExerciseRepositoryImpl,
+    TrainingImportRepositoryImpl,
+)
+from src.infrastructure.settings import settings
 from src.application.use_cases.trainings.create_training import CreateTrainingUseCase
-from src.application.use_cases.trainings.get_training_by_id import GetTrainingByIdUseCase
 from src.application.use_cases.trainings.get_training_by_id_with_follow_check import GetTrainingByIdWithFollowCheckUseCase
 from src.application.use_cases.trainings.update_training import UpdateTrainingUseCase
 from src.application.use_cases.trainings.delete_training import DeleteTrainingUseCase
@@ -17,17 +32,27 @@ from src.application.use_cases.trainings.get_last_exercise_implementation import
     GetLastExerciseImplementationUseCase,
 )
 from src.application.use_cases.trainings.generate_share_token import GenerateShareTokenUseCase
-from src.application.use_cases.trainings.get_shared_training import GetSharedTrainingUseCase
+from src.application.use_cases.trainings.get_training_summaries import GetTrainingSummariesUseCase
 from src.application.use_cases.trainings.remove_share_token import RemoveShareTokenUseCase
+from src.application.use_cases.trainings.start_training_import import StartTrainingImportUseCase
+from src.application.use_cases.trainings.import_trainings import ImportTrainingsUseCase
+from src.application.use_cases.trainings.get_training_import import GetTrainingImportUseCase
 from src.application.dto.training_dto import CreateTrainingDTO, UpdateTrainingDTO, ImplementationDTO, SetDTO
 from src.presentation.schemas.training_schemas import (
     TrainingCreate,
     TrainingUpdate,
     TrainingResponse,
+    TrainingSummaryResponse,
+    TrainingImportResponse,
     ImplementationBase,
     SetBase,
 )
-from src.presentation.api.dependencies import get_current_user_id
+from src.presentation.api.dependencies import (
+    get_async_read_db,
+    get_current_user_id,
+    get_current_user_id_async,
+    get_read_db,
+)
 
 router = APIRouter(prefix="/trainings", tags=["trainings"])
 
@@ -66,6 +91,10 @@ def dto_to_response(dto) -> TrainingResponse:
         created_at=dto.created_at,
         share_token=dto.share_token,
         implementations=impl_schemas,
+        exercise_count=dto.exercise_count,
+        set_count=dto.set_count,
+        total_volume=dto.total_volume,
+        top_weight=dto.top_weight,
     )
 
 
@@ -74,20 +103,56 @@ def get_training_repository(db: Session = Depends(get_db)) -> TrainingRepository
     return TrainingRepositoryImpl(db)
 
 
-def get_follow_repository(db: Session = Depends(get_db)) -> FollowRepositoryImpl:
-    """Dependency to get follow repository."""
-    return FollowRepositoryImpl(db)
+def get_feed_repository(db: Session = Depends(get_db)) -> FeedRepositoryImpl:
+    """Dependency to get activity feed repository."""
+    return FeedRepositoryImpl(db)
+
+
+def get_training_import_repository(db: Session = Depends(get_db)) -> TrainingImportRepositoryImpl:
+    """Dependency to get training import repository."""
+    return TrainingImportRepositoryImpl(db)
+
+
+def get_async_training_repository(db: AsyncSession = Depends(get_async_read_db)) -> AsyncTrainingRepositoryImpl:
+    """Dependency to get async training repository."""
+    return AsyncTrainingRepositoryImpl(db)
+
+
+def get_async_follow_repository(db: AsyncSession = Depends(get_async_read_db)) -> AsyncFollowRepositoryImpl:
+    """Dependency to get async follow repository."""
+    return AsyncFollowRepositoryImpl(db)
+
+
+def run_training_import(import_id: int, path: str, file_format: ImportFormat) -> None:
+    """Background task: import an uploaded file in its own session, committing after every batch."""
+    db = create_session()
+    use_case = ImportTrainingsUseCase(
+        TrainingRepositoryImpl(db),
+        ExerciseRepositoryImpl(db),
+        TrainingImportRepositoryImpl(db),
+        batch_size=settings.TRAINING_IMPORT_BATCH_SIZE,
+    )
+    try:
+        for _ in use_case.execute(import_id, read_training_rows(path, file_format)):
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        use_case.mark_failed(import_id, str(e))
+        db.commit()
+    finally:
+        db.close()
+        os.remove(path)
 
 
 @router.post("", response_model=TrainingResponse, status_code=status.HTTP_201_CREATED)
-async def create_training(
+def create_training(
     request: TrainingCreate,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Create a new training."""
     training_repository = get_training_repository(db)
-    use_case = CreateTrainingUseCase(training_repository)
+    use_case = CreateTrainingUseCase(training_repository, get_feed_repository(db))
 
     try:
         # Convert schemas to DTOs
@@ -123,54 +188,56 @@ async def create_training(
         )
 
         result = use_case.execute(dto, current_user_id)
+        db.commit()
         return dto_to_response(result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("", response_model=List[TrainingResponse])
+@router.get("", response_model=Union[List[TrainingResponse], List[TrainingSummaryResponse]])
 async def get_trainings(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db),
-    current_user_id: int = Depends(get_current_user_id),
+    view: str = Query(
+        "full",
+        pattern="^(full|summary)$",
+        description="full - with implementations and sets, summary - only per-training totals",
+    ),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user_id: int = Depends(get_current_user_id_async),
 ):
     """Get all trainings for current user."""
-    training_repository = get_training_repository(db)
-    trainings = training_repository.get_all(
+    # Hot read path: served on the event loop through the async engine
+    if view == "summary":
+        use_case = GetTrainingSummariesUseCase(get_async_training_repository(db))
+        summaries = await use_case.execute(current_user_id, start_date, end_date)
+        return [TrainingSummaryResponse(**summary.__dict__) for summary in summaries]
+
+    # Read path straight from Core rows (no ORM entities / DTOs)
+    return await AsyncTrainingReadModel(db).list_for_user(
         user_id=current_user_id, start_date=start_date, end_date=end_date
     )
 
-    # Convert to DTOs
-    from src.application.use_cases.trainings.get_training_by_id import GetTrainingByIdUseCase
-
-    results = []
-    for training in trainings:
-        dto = GetTrainingByIdUseCase._to_dto(training)
-        results.append(dto)
-
-    return [dto_to_response(result) for result in results]
-
 
 @router.get("/{training_id}", response_model=TrainingResponse)
 async def get_training(
     training_id: int,
-    db: Session = Depends(get_db),
-    current_user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user_id: int = Depends(get_current_user_id_async),
 ):
     """Get training by ID. Allows access if user owns the training or has approved follow relationship."""
-    training_repository = get_training_repository(db)
-    follow_repository = get_follow_repository(db)
-    use_case = GetTrainingByIdWithFollowCheckUseCase(training_repository, follow_repository)
+    use_case = GetTrainingByIdWithFollowCheckUseCase(
+        get_async_training_repository(db), get_async_follow_repository(db)
+    )
 
-    result = use_case.execute(training_id, current_user_id)
+    result = await use_case.execute(training_id, current_user_id)
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Training not found")
     return dto_to_response(result)
 
 
 @router.put("/{training_id}", response_model=TrainingResponse)
-async def update_training(
+def update_training(
     training_id: int,
     request: TrainingUpdate,
     db: Session = Depends(get_db),
@@ -178,7 +245,7 @@ async def update_training(
 ):
     """Update a training."""
     training_repository = get_training_repository(db)
-    use_case = UpdateTrainingUseCase(training_repository)
+    use_case = UpdateTrainingUseCase(training_repository, get_feed_repository(db))
 
     try:
         # Convert schemas to DTOs
@@ -214,13 +281,14 @@ async def update_training(
         )
 
         result = use_case.execute(training_id, dto, current_user_id)
+        db.commit()
         return dto_to_response(result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.delete("/{training_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_training(
+def delete_training(
     training_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -231,12 +299,13 @@ async def delete_training(
 
     try:
         use_case.execute(training_id, current_user_id)
+        db.commit()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.post("/from-template/{template_id}", response_model=TrainingResponse, status_code=status.HTTP_201_CREATED)
-async def create_training_from_template(
+def create_training_from_template(
     template_id: int,
     date_time: datetime,
     db: Session = Depends(get_db),
@@ -249,15 +318,16 @@ async def create_training_from_template(
 
     try:
         result = use_case.execute(template_id, current_user_id, date_time)
+        db.commit()
         return dto_to_response(result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/last-exercise/{exercise_id}", response_model=Optional[ImplementationBase])
-async def get_last_exercise_implementation(
+def get_last_exercise_implementation(
     exercise_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get last implementation of an exercise from completed training."""
@@ -288,7 +358,7 @@ async def get_last_exercise_implementation(
 
 
 @router.post("/{training_id}/share", response_model=TrainingResponse)
-async def share_training(
+def share_training(
     training_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -299,13 +369,14 @@ async def share_training(
 
     try:
         result = use_case.execute(training_id, current_user_id)
+        db.commit()
         return dto_to_response(result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.delete("/{training_id}/share", response_model=TrainingResponse)
-async def unshare_training(
+def unshare_training(
     training_id: int,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -316,31 +387,83 @@ async def unshare_training(
 
     try:
         result = use_case.execute(training_id, current_user_id)
+        db.commit()
         return dto_to_response(result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/shared/{share_token}", response_model=TrainingResponse)
-async def get_shared_training(
+def get_shared_training(
     share_token: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get a shared training by token (no authentication required)."""
-    from src.infrastructure.repositories import UserRepositoryImpl
-    
-    training_repository = get_training_repository(db)
-    user_repository = UserRepositoryImpl(db)
-    use_case = GetSharedTrainingUseCase(training_repository)
+    # Training with owner's username, read straight from Core rows
+    result = TrainingReadModel(db).get_by_share_token(share_token)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Training with share token {share_token} not found",
+        )
+    return result
 
-    try:
-        result = use_case.execute(share_token)
-        response = dto_to_response(result)
-        # Get username for shared training
-        user = user_repository.get_by_id(result.user_id)
-        if user:
-            response.username = user.username
-        return response
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
+@router.post("/import", response_model=TrainingImportResponse, status_code=status.HTTP_202_ACCEPTED)
+async def import_trainings(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file_format: ImportFormat = Query(ImportFormat.CSV, alias="format"),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_current_user_id),
+):
+    """
+    Import historical trainings from a CSV or NDJSON request body in the background.
+
+    One row per set: date_time, exercise (name), weight, reps, and optional
+    rest_time, duration, rpe, notes, training_duration. Rows of one training
+    must be consecutive. Bodies over TRAINING_IMPORT_MAX_BYTES are rejected with 413.
+    Poll GET /trainings/import/{import_id} for progress.
+    """
+    max_bytes = settings.TRAINING_IMPORT_MAX_BYTES
+    content_length = request.headers.get("content-length")
+    try:
+        # Reject a declared oversized body before reading it; chunked bodies are counted while streaming
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+            raise UploadTooLargeError(f"Upload exceeds the limit of {max_bytes} bytes")
+        path = await save_upload(request.stream(), max_bytes)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+
+    def start_import():
+        use_case = StartTrainingImportUseCase(get_training_import_repository(db))
+        result = use_case.execute(current_user_id, file_format)
+        db.commit()
+        return result
+
+    # The handler is async to stream the body; keep blocking DB calls off the event loop
+    try:
+        result = await run_in_threadpool(start_import)
+    except BaseException:
+        # The background task that would remove the upload is never scheduled
+        os.remove(path)
+        raise
+    background_tasks.add_task(run_training_import, result.id, path, file_format)
+    return TrainingImportResponse(**result.__dict__)
+
+
+@router.get("/import/{import_id}", response_model=TrainingImportResponse)
+def get_training_import(
+    import_id: int,
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_current_user_id),
+):
+    """Get bulk import status and progress."""
+    use_case = GetTrainingImportUseCase(get_training_import_repository(db))
+    result = use_case.execute(import_id, current_user_id)
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Training import with id {import_id} not found",
+        )
+    return TrainingImportResponse(**result.__dict__)
@@ -16,7 +16,7 @@ from src.presentation.schemas.user_profile_schemas import (
     UpdateUserProfileRequest,
 )
 from src.presentation.schemas.auth_schemas import UserResponse
-from src.presentation.api.dependencies import get_current_user_id
+from src.presentation.api.dependencies import get_current_user_id, get_read_db
 
 router = APIRouter(prefix="/user/profile", tags=["user-profile"])
 
@@ -32,8 +32,8 @@ def get_body_metric_repository(db: Session = Depends(get_db)) -> UserBodyMetricR
 
 
 @router.get("", response_model=UserResponse)
-async def get_profile(
-    db: Session = Depends(get_db),
+def get_profile(
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get current user profile."""
@@ -48,7 +48,7 @@ async def get_profile(
 
 
 @router.put("", response_model=UserResponse)
-async def update_profile(
+def update_profile(
     request: UpdateUserProfileRequest,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -60,13 +60,14 @@ async def update_profile(
     try:
         dto = UpdateUserProfileDTO(weight=request.weight, height=request.height)
         result = use_case.execute(dto, current_user_id)
+        db.commit()
         return UserResponse(**result.__dict__)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.post("/body-metrics", response_model=BodyMetricResponse, status_code=status.HTTP_201_CREATED)
-async def create_body_metric(
+def create_body_metric(
     request: CreateBodyMetricRequest,
     db: Session = Depends(get_db),
     current_user_id: int = Depends(get_current_user_id),
@@ -83,16 +84,17 @@ async def create_body_metric(
             date=request.date,
         )
         result = use_case.execute(dto, current_user_id)
+        db.commit()
         return BodyMetricResponse(**result.__dict__)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/body-metrics", response_model=List[BodyMetricResponse])
-async def get_body_metrics(
+def get_body_metrics(
     start_date: Optional[date] = Query(None, description="Start date filter"),
     end_date: Optional[date] = Query(None, description="End date filter"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user_id: int = Depends(get_current_user_id),
 ):
     """Get body metrics history for current user."""
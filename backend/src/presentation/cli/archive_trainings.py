@@ -0,0 +1,37 @@
+"""Move old completed trainings to training_archive.
+
+Usage: python -m src.presentation.cli.archive_trainings [--older-than-days N] [--batch-size N]
+Run periodically (e.g. nightly cron); each batch is committed separately.
+"""
+import argparse
+
+from src.infrastructure.database.session import Database, init_db, create_session
+from src.infrastructure.repositories import TrainingRepositoryImpl
+from src.infrastructure.settings import settings
+from src.application.use_cases.trainings.archive_old_trainings import ArchiveOldTrainingsUseCase
+
+
+def main() -> None:
+    """Archive old trainings."""
+    parser = argparse.ArgumentParser(description="Move old completed trainings to training_archive.")
+    parser.add_argument("--older-than-days", type=int, default=settings.TRAINING_ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--batch-size", type=int, default=settings.TRAINING_ARCHIVE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    init_db(Database.from_settings(settings))
+    db = create_session()
+    try:
+        use_case = ArchiveOldTrainingsUseCase(TrainingRepositoryImpl(db))
+        total = 0
+        for archived in use_case.execute(args.older_than_days, args.batch_size):
+            db.commit()
+            db.expunge_all()
+            total += archived
+            print(f"Archived {total} trainings")
+        print(f"Done: {total} trainings archived")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
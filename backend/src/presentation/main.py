@@ -1,9 +1,18 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.infrastructure.database.session import Database, init_db
+from src.infrastructure.auth.revocation_filter import revocation_filter
+from src.infrastructure.database.session import Database, init_db, get_database
+from src.infrastructure.rate_limiting import DatabaseTokenBucketStore, InMemoryTokenBucketStore
+from src.infrastructure.repositories import RefreshTokenRepositoryImpl
 from src.infrastructure.settings import settings
+from src.presentation.api.dependencies import read_your_writes_cookie, require_metrics_token
+from src.presentation.api.pagination import NEXT_CURSOR_HEADER
 from src.presentation.api.v1 import api_router
+from src.presentation.monitoring import EventLoopMonitor, EventLoopMonitorMiddleware
+from src.presentation.rate_limiting import RateLimiter, RateLimitMiddleware, RateLimitRule
+from src.presentation.read_your_writes import ReadYourWritesMiddleware
+from src.presentation.warmup import warm_up, warm_up_async
 
 
 app = FastAPI(
@@ -12,6 +21,40 @@ app = FastAPI(
     version="0.1.0",
 )
 
+rate_limiter = RateLimiter(
+    rules=[
+        RateLimitRule(
+            "auth",
+            ("/api/v1/auth/login", "/api/v1/auth/register"),
+            per_minute=settings.RATE_LIMIT_AUTH_PER_MINUTE,
+            burst=settings.RATE_LIMIT_AUTH_BURST,
+        ),
+        RateLimitRule(
+            "analytics",
+            ("/api/v1/analytics/",),
+            per_minute=settings.RATE_LIMIT_ANALYTICS_PER_MINUTE,
+            burst=settings.RATE_LIMIT_ANALYTICS_BURST,
+            per_user=True,
+        ),
+        RateLimitRule(
+            "training_import",
+            ("/api/v1/trainings/import",),
+            per_minute=settings.RATE_LIMIT_IMPORT_PER_MINUTE,
+            burst=settings.RATE_LIMIT_IMPORT_BURST,
+            per_user=True,
+            methods=frozenset({"POST"}),
+        ),
+    ],
+    store=(
+        DatabaseTokenBucketStore(lambda: get_database().async_engine)
+        if settings.RATE_LIMIT_BACKEND == "database"
+        else InMemoryTokenBucketStore()
+    ),
+)
+if settings.RATE_LIMIT_ENABLED:
+    # Added before CORS so it runs inside it and rejections carry CORS headers
+    app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -19,14 +62,48 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],  # Paginated lists
 )
 
+# After a write the client carries a short-lived cookie keeping its reads on the primary
+if settings.DATABASE_REPLICA_URLS.strip():
+    app.add_middleware(ReadYourWritesMiddleware, cookie=read_your_writes_cookie)
+
+event_loop_monitor = EventLoopMonitor(
+    threshold_ms=settings.EVENT_LOOP_BLOCK_THRESHOLD_MS,
+    sample_interval_ms=settings.EVENT_LOOP_LAG_SAMPLE_INTERVAL_MS,
+)
+# Added last so it wraps the whole stack, CORS included
+app.add_middleware(EventLoopMonitorMiddleware, monitor=event_loop_monitor)
+
+
+def load_revoked_sessions(since):
+    """Sessions revoked by any worker since the given time (for the revocation filter)."""
+    db = get_database().SessionLocal()
+    try:
+        return RefreshTokenRepositoryImpl(db).get_revoked_sessions(since)
+    finally:
+        db.close()
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize database on startup."""
-    database = Database(settings.DATABASE_URL)
+    database = Database.from_settings(settings)
     init_db(database)
+    if settings.WARM_UP_ON_STARTUP:
+        warm_up(app, database, connections=settings.DATABASE_POOL_SIZE)
+        await warm_up_async(database, connections=settings.DATABASE_POOL_SIZE)
+    event_loop_monitor.start()
+    revocation_filter.start(load_revoked_sessions)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background monitoring and close database connections."""
+    await event_loop_monitor.stop()
+    await revocation_filter.stop()
+    await get_database().dispose()
 
 
 # Include API routers
@@ -44,3 +121,20 @@ async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
 
+
+@app.get("/metrics/event-loop", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def event_loop_metrics():
+    """Event loop lag percentiles and the routes that block the loop."""
+    return event_loop_monitor.snapshot()
+
+
+@app.get("/metrics/database-pool", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+def database_pool_metrics():
+    """Connection pool usage: checked-out and overflow connections, checkout wait times."""
+    return get_database().pool_status()
+
+
+@app.get("/metrics/rate-limits", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def rate_limit_metrics():
+    """Rate limit rules with the requests each one allowed and rejected."""
+    return rate_limiter.snapshot()
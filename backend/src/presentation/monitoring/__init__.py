@@ -0,0 +1,3 @@
+from .event_loop import EventLoopMonitor, EventLoopMonitorMiddleware
+
+__all__ = ["EventLoopMonitor", "EventLoopMonitorMiddleware"]
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Deque, Dict, Generator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Route key of requests that matched no route
+UNMATCHED_ROUTE = "<unmatched>"
+_HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+@dataclass
+class _RouteStats:
+    """Event loop time spent by one route."""
+
+    requests: int = 0
+    blocking_requests: int = 0
+    max_block_ms: float = 0.0
+    total_block_ms: float = 0.0
+
+
+class _StepTimer:
+    """
+    Drive a coroutine and time each step it runs on the event loop.
+
+    A step is the synchronous stretch between two awaits, i.e. the time the
+    coroutine holds the loop. Time spent waiting (on I/O or on the threadpool)
+    falls between steps and is not counted. Steps are wall time, so while
+    threadpool work holds the GIL every route's steps get longer too.
+    """
+
+    def __init__(self, coro: Awaitable[Any]):
+        self._coro = coro.__await__()
+        self.longest = 0.0
+        self.total = 0.0
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            started = time.perf_counter()
+            try:
+                if error is not None:
+                    future = self._coro.throw(error)
+                else:
+                    future = self._coro.send(value)
+            except StopIteration as stop:
+                self._record(started)
+                return stop.value
+            except BaseException:
+                self._record(started)
+                raise
+            self._record(started)
+
+            value, error = None, None
+            try:
+                value = yield future
+            except GeneratorExit:
+                self._coro.close()
+                raise
+            except BaseException as exc:
+                error = exc
+
+    def _record(self, started: float) -> None:
+        step = time.perf_counter() - started
+        self.total += step
+        self.longest = max(self.longest, step)
+
+
+class EventLoopMonitor:
+    """
+    Measure how long the event loop is blocked and by which routes.
+
+    A sampler task sleeps for a fixed interval and records how late it wakes
+    up (loop lag). The ASGI middleware times every request's steps on the loop
+    and logs routes that hold it longer than the threshold.
+    """
+
+    def __init__(self, threshold_ms: float, sample_interval_ms: float, window: int = 1200):
+        self.threshold = threshold_ms / 1000
+        self.sample_interval = sample_interval_ms / 1000
+        self._lags: Deque[float] = deque(maxlen=window)
+        self._routes: Dict[str, _RouteStats] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the lag sampler on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._sample())
+
+    async def stop(self) -> None:
+        """Stop the lag sampler."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.sample_interval)
+            self._lags.append(max(loop.time() - started - self.sample_interval, 0.0))
+
+    def record_request(self, method: str, route: str, longest: float, total: float) -> None:
+        """Record the loop time of one finished request."""
+        key = f"{method} {route}"
+        stats = self._routes.setdefault(key, _RouteStats())
+        stats.requests += 1
+        stats.total_block_ms += total * 1000
+        stats.max_block_ms = max(stats.max_block_ms, longest * 1000)
+        if longest >= self.threshold:
+            stats.blocking_requests += 1
+            logger.warning("Event loop blocked for %.1f ms by %s", longest * 1000, key)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Lag percentiles over the sample window and per-route blocking statistics."""
+        lags = sorted(self._lags)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not lags:
+                return None
+            return round(lags[min(int(len(lags) * fraction), len(lags) - 1)] * 1000, 2)
+
+        requests = sum(stats.requests for stats in self._routes.values())
+        blocking = sum(stats.blocking_requests for stats in self._routes.values())
+        routes: List[Dict[str, Any]] = [
+            {
+                "route": key,
+                "requests": stats.requests,
+                "blocking_requests": stats.blocking_requests,
+                "max_block_ms": round(stats.max_block_ms, 2),
+                "avg_block_ms": round(stats.total_block_ms / stats.requests, 2),
+            }
+            for key, stats in sorted(
+                self._routes.items(), key=lambda item: item[1].max_block_ms, reverse=True
+            )
+        ]
+        return {
+            "lag_ms": {
+                "samples": len(lags),
+                "p50": percentile(0.50),
+                "p90": percentile(0.90),
+                "p99": percentile(0.99),
+                "max": round(lags[-1] * 1000, 2) if lags else None,
+            },
+            "threshold_ms": self.threshold * 1000,
+            "requests": requests,
+            "blocking_requests": blocking,
+            # Share of requests that never held the loop past the threshold
+            "offload_coverage": round(1 - blocking / requests, 4) if requests else None,
+            "routes": routes,
+        }
+
+
+class EventLoopMonitorMiddleware:
+    """ASGI middleware reporting which routes block the event loop and for how long."""
+
+    def __init__(self, app, monitor: EventLoopMonitor):
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timer = _StepTimer(self.app(scope, receive, send))
+        try:
+            await timer
+        finally:
+            # The router stores the matched route in the scope; anything else
+            # (404s, unknown methods) shares one key so the stats stay bounded
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            method = scope["method"] if scope["method"] in _HTTP_METHODS else "OTHER"
+            self.monitor.record_request(method, route, timer.longest, timer.total)
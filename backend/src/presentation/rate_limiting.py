@@ -0,0 +1,130 @@
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from starlette.responses import JSONResponse
+
+from src.infrastructure.auth.jwt_service import JWTService
+from src.infrastructure.rate_limiting import TokenBucketStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    Token bucket limit for a group of routes: up to burst requests at once,
+    refilled at per_minute. Buckets are per client IP, or per user for
+    per_user rules (per IP for requests without a valid bearer token).
+    """
+
+    name: str
+    path_prefixes: Tuple[str, ...]
+    per_minute: float
+    burst: int
+    per_user: bool = False
+    methods: Optional[frozenset] = None  # None limits every method
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        return path.startswith(self.path_prefixes)
+
+
+@dataclass
+class _RuleStats:
+    allowed: int = 0
+    rejected: int = 0
+
+
+class RateLimiter:
+    """Rate limit rules over a token bucket store, with allowed/rejected counts per rule."""
+
+    def __init__(self, rules: Sequence[RateLimitRule], store: TokenBucketStore):
+        self.rules = list(rules)
+        self.store = store
+        self._stats: Dict[str, _RuleStats] = {rule.name: _RuleStats() for rule in self.rules}
+
+    def match(self, method: str, path: str) -> Optional[RateLimitRule]:
+        return next((rule for rule in self.rules if rule.matches(method, path)), None)
+
+    async def check(self, rule: RateLimitRule, client: str) -> float:
+        """Take a token for the client; returns 0 when allowed, else seconds to wait."""
+        try:
+            retry_after = await self.store.take(f"{rule.name}:{client}", rule.burst, rule.per_minute / 60)
+        except Exception:
+            # An unavailable shared backend must not take the API down with it
+            logger.exception("Rate limit store failed, allowing request for %s", rule.name)
+            retry_after = 0.0
+        stats = self._stats[rule.name]
+        if retry_after > 0:
+            stats.rejected += 1
+        else:
+            stats.allowed += 1
+        return retry_after
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per rule limits and allowed/rejected counts of this worker since startup."""
+        return {
+            rule.name: {
+                "per_minute": rule.per_minute,
+                "burst": rule.burst,
+                "per_user": rule.per_user,
+                "allowed": self._stats[rule.name].allowed,
+                "rejected": self._stats[rule.name].rejected,
+            }
+            for rule in self.rules
+        }
+
+
+def _bearer_subject(scope) -> Optional[str]:
+    """Subject of a valid bearer token in the request headers, None otherwise."""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            payload = JWTService.verify_token(token)
+            subject = payload.get("sub") if payload else None
+            return str(subject) if subject is not None else None
+    return None
+
+
+class RateLimitMiddleware:
+    """ASGI middleware answering 429 with Retry-After once a client's bucket is empty."""
+
+    def __init__(self, app, limiter: RateLimiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rule = self.limiter.match(scope["method"], scope["path"])
+        if rule is not None:
+            retry_after = await self.limiter.check(rule, self._client(scope, rule))
+            if retry_after > 0:
+                seconds = max(1, math.ceil(retry_after))
+                response = JSONResponse(
+                    {"detail": "Too many requests, retry later"},
+                    status_code=429,
+                    headers={"Retry-After": str(seconds)},
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _client(scope, rule: RateLimitRule) -> str:
+        # Behind a reverse proxy, scope["client"] is the X-Forwarded-For address
+        # only for proxies listed in FORWARDED_ALLOW_IPS (see gunicorn.conf.py)
+        if rule.per_user:
+            subject = _bearer_subject(scope)
+            if subject is not None:
+                return f"user:{subject}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
@@ -0,0 +1,36 @@
+import math
+
+from src.infrastructure.database.replicas import ReadYourWritesCookie, track_writes
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware setting the read-your-writes cookie on responses to
+    requests that committed a user's write (see ReadYourWritesCookie).
+    """
+
+    def __init__(self, app, cookie: ReadYourWritesCookie):
+        self.app = app
+        self.cookie = cookie
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_writes() as users:
+
+            async def send_with_cookie(message):
+                # Endpoints commit before they return, so writes are known by the response start
+                if message["type"] == "http.response.start" and len(users) == 1:
+                    message["headers"] = [*message.get("headers", []), self._set_cookie(next(iter(users)))]
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
+
+    def _set_cookie(self, user_id: int):
+        value = (
+            f"{ReadYourWritesCookie.NAME}={self.cookie.issue(user_id)}; "
+            f"Max-Age={math.ceil(self.cookie.window)}; Path=/api; HttpOnly; SameSite=Lax"
+        )
+        return b"set-cookie", value.encode("latin-1")
@@ -27,11 +27,19 @@ class LoginRequest(BaseModel):
     password: str
 
 
+class RefreshTokenRequest(BaseModel):
+    """Request schema for token refresh and logout."""
+
+    refresh_token: str = Field(..., min_length=1, max_length=200)
+
+
 class TokenResponse(BaseModel):
     """Response schema for token."""
 
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None  # Access token lifetime in seconds
 
 
 class UserResponse(BaseModel):
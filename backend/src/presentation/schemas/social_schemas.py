@@ -1,7 +1,9 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
+from src.presentation.schemas.training_schemas import TrainingSummaryResponse
+
 
 class FollowResponse(BaseModel):
     """Schema for follow response."""
@@ -47,6 +49,25 @@ class ReactionResponse(BaseModel):
         from_attributes = True
 
 
+class TrainingSocialSummaryResponse(BaseModel):
+    """Schema for a training's reaction counts, the caller's reaction and comment count."""
+
+    training_id: int
+    reaction_counts: Dict[str, int]  # Every reaction type, zero included
+    my_reaction: Optional[str] = None
+    comment_count: int
+
+
+class FeedItemResponse(BaseModel):
+    """Schema for an activity feed entry: a followed user's completed training."""
+
+    id: int
+    author_id: int
+    author_username: str
+    created_at: datetime
+    training: TrainingSummaryResponse
+
+
 class CommentRequest(BaseModel):
     """Schema for adding a comment."""
 
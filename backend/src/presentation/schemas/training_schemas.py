@@ -3,6 +3,7 @@ from typing import Optional, List
 from datetime import datetime
 
 from src.domain.entities.training import TrainingStatus
+from src.domain.entities.training_import import ImportStatus, ImportFormat
 
 
 class SetBase(BaseModel):
@@ -60,10 +61,44 @@ class TrainingResponse(TrainingBase):
     share_token: Optional[str] = None
     username: Optional[str] = None  # Username of the training owner (for shared trainings)
     implementations: List[ImplementationBase]
+    exercise_count: int = 0
+    set_count: int = 0
+    total_volume: float = 0.0
+    top_weight: Optional[float] = None
 
     class Config:
         from_attributes = True
 
 
+class TrainingSummaryResponse(TrainingBase):
+    """Schema for training list row (view=summary): totals instead of implementations."""
 
+    id: int
+    user_id: int
+    training_template_id: Optional[int]
+    created_at: datetime
+    share_token: Optional[str] = None
+    exercise_count: int
+    set_count: int
+    total_volume: float
+    top_weight: Optional[float] = None
+
+    class Config:
+        from_attributes = True
 
+
+class TrainingImportResponse(BaseModel):
+    """Schema for bulk training import status and progress."""
+
+    id: int
+    file_format: ImportFormat
+    status: ImportStatus
+    processed_rows: int
+    imported_trainings: int
+    skipped_rows: int
+    created_at: datetime
+    error: Optional[str] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
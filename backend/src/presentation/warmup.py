@@ -0,0 +1,59 @@
+import logging
+
+from fastapi import FastAPI
+from sqlalchemy.orm import configure_mappers
+
+from src.infrastructure.database.session import Database
+from src.infrastructure.repositories import ExerciseRepositoryImpl, MuscleGroupRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_for_fork(app: FastAPI) -> None:
+    """
+    Build process-independent state once in the gunicorn master: mapper
+    configuration and the OpenAPI schema are inherited by every forked worker.
+    """
+    configure_mappers()
+    app.openapi()
+
+
+def warm_up(app: FastAPI, database: Database, connections: int) -> None:
+    """Pay first-request costs in a worker before it accepts traffic."""
+    prepare_for_fork(app)  # No-op when already done in the master
+
+    # The database may be briefly unreachable (e.g. during a rolling restart);
+    # a failed warm-up must not keep the worker from booting
+    try:
+        # Open pool connections up front (checked in again right away)
+        opened = []
+        try:
+            for _ in range(connections):
+                opened.append(database.engine.connect())
+        finally:
+            for connection in opened:
+                connection.close()
+
+        # Load the exercise and muscle group catalogs once so their SQL is compiled and cached
+        db = database.SessionLocal()
+        try:
+            ExerciseRepositoryImpl(db).get_all()
+            MuscleGroupRepositoryImpl(db).get_all()
+        finally:
+            db.close()
+    except Exception:
+        logger.warning("Database warm-up failed, starting cold", exc_info=True)
+
+
+async def warm_up_async(database: Database, connections: int) -> None:
+    """Open the async engine's pool connections before the worker accepts traffic."""
+    try:
+        opened = []
+        try:
+            for _ in range(connections):
+                opened.append(await database.async_engine.connect())
+        finally:
+            for connection in opened:
+                await connection.close()
+    except Exception:
+        logger.warning("Async database warm-up failed, starting cold", exc_info=True)
@@ -0,0 +1,153 @@
+import os
+
+# Settings are read at import time; tests never touch DATABASE_URL itself
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+# Tests log in far more often than any client should; rate limiting has its own tests
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+from datetime import datetime, timedelta  # noqa: E402
+from typing import List  # noqa: E402
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine, event, insert  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from src.domain.entities.training import TrainingStatus  # noqa: E402
+from src.infrastructure.auth.jwt_service import verified_token_cache  # noqa: E402
+from src.infrastructure.auth.principal_cache import principal_cache  # noqa: E402
+from src.infrastructure.auth.revocation_filter import revocation_filter  # noqa: E402
+from src.infrastructure.database.base import Base  # noqa: E402
+from src.infrastructure.database.models import (  # noqa: E402
+    ExerciseModel,
+    ImplementationModel,
+    SetModel,
+    TrainingModel,
+    UserModel,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_auth_caches():
+    """Every test starts with its own users, so no principal, token or revoked session may carry over."""
+    principal_cache.clear()
+    revocation_filter.clear()
+    verified_token_cache.clear()
+    yield
+    principal_cache.clear()
+    revocation_filter.clear()
+    verified_token_cache.clear()
+
+
+class StatementCounter:
+    """Records SQL statements executed on an engine."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: List[str] = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+    def close(self) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+@pytest.fixture
+def sqlite_engine():
+    """In-memory SQLite with foreign keys enforced like PostgreSQL."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    event.listen(engine, "connect", lambda conn, _: conn.execute("PRAGMA foreign_keys=ON"))
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(sqlite_engine):
+    """Session configured like the application's (see Database)."""
+    session = sessionmaker(autocommit=False, autoflush=False, bind=sqlite_engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="module")
+def postgres_engine():
+    """Empty schema on the PostgreSQL database in TEST_POSTGRES_URL (skipped when unset)."""
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+def seed_history(
+    db: Session,
+    users: int = 1,
+    trainings_per_user: int = 10,
+    exercises: int = 5,
+    implementations_per_training: int = 3,
+    sets_per_implementation: int = 3,
+) -> None:
+    """Insert users, system exercises and completed trainings with implementations, sets and totals.
+
+    Training t (1-based) uses exercises (t - 1 + i) % exercises + 1; every set has 8 reps.
+    """
+    now = datetime(2025, 1, 1)
+    weights = [50 + 5 * k for k in range(sets_per_implementation)]
+    db.execute(
+        insert(UserModel),
+        [
+            {"email": f"user{u}@example.com", "username": f"user{u}", "hashed_password": "x"}
+            for u in range(1, users + 1)
+        ],
+    )
+    db.execute(
+        insert(ExerciseModel), [{"name": f"Exercise {e}", "is_custom": False} for e in range(exercises)]
+    )
+    db.execute(
+        insert(TrainingModel),
+        [
+            {
+                "user_id": u,
+                "date_time": now - timedelta(days=t),
+                "status": TrainingStatus.COMPLETED,
+                "exercise_count": implementations_per_training,
+                "set_count": implementations_per_training * sets_per_implementation,
+                "total_volume": implementations_per_training * sum(weights) * 8,
+                "top_weight": max(weights, default=None) if implementations_per_training else None,
+            }
+            for u in range(1, users + 1)
+            for t in range(trainings_per_user)
+        ],
+    )
+    trainings = users * trainings_per_user
+    db.execute(
+        insert(ImplementationModel),
+        [
+            {"training_id": t + 1, "exercise_id": (t + i) % exercises + 1, "order_index": i}
+            for t in range(trainings)
+            for i in range(implementations_per_training)
+        ],
+    )
+    db.execute(
+        insert(SetModel),
+        [
+            {"implementation_id": i + 1, "order_index": k, "weight": weight, "reps": 8}
+            for i in range(trainings * implementations_per_training)
+            for k, weight in enumerate(weights)
+        ],
+    )
+    db.flush()
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.database.session import Database
+from src.infrastructure.read_models import AsyncTrainingReadModel, TrainingReadModel
+from src.infrastructure.repositories import (
+    AsyncFollowRepositoryImpl,
+    AsyncTrainingRepositoryImpl,
+    AsyncUserRepositoryImpl,
+    FollowRepositoryImpl,
+    TrainingRepositoryImpl,
+    UserRepositoryImpl,
+)
+
+from .conftest import seed_history
+
+
+@pytest.fixture
+def database(tmp_path):
+    """File-backed SQLite shared by the sync and the async engine; user 1's trainings 6-10 are archived."""
+    database = Database(f"sqlite:///{tmp_path}/reads.db")
+    database.create_tables()
+    db = database.SessionLocal()
+    seed_history(db, users=2, trainings_per_user=10)
+    TrainingRepositoryImpl(db).archive_completed_before(datetime(2024, 12, 28), limit=100)
+    db.commit()
+    db.close()
+    yield database
+    asyncio.run(database.dispose())
+
+
+def read_async(database, read):
+    async def run():
+        async with database.AsyncSessionLocal() as db:
+            return await read(db)
+
+    return asyncio.run(run())
+
+
+def test_async_reads_match_sync_reads(database):
+    db = database.SessionLocal()
+    try:
+        for training_id in (1, 8, 999):
+            training = TrainingRepositoryImpl(db).get_by_id(training_id)
+            assert (training is None) == (training_id == 999)
+            assert read_async(
+                database, lambda adb: AsyncTrainingRepositoryImpl(adb).get_by_id(training_id)
+            ) == training
+        assert read_async(
+            database, lambda adb: AsyncTrainingRepositoryImpl(adb).get_summaries(1)
+        ) == TrainingRepositoryImpl(db).get_summaries(1)
+        assert read_async(
+            database, lambda adb: AsyncTrainingReadModel(adb).list_for_user(1, datetime(2024, 12, 25))
+        ) == TrainingReadModel(db).list_for_user(1, datetime(2024, 12, 25))
+        assert read_async(database, lambda adb: AsyncUserRepositoryImpl(adb).get_by_id(2)) == (
+            UserRepositoryImpl(db).get_by_id(2)
+        )
+        assert read_async(database, lambda adb: AsyncFollowRepositoryImpl(adb).get_by_ids(1, 2)) is None
+        assert FollowRepositoryImpl(db).get_by_ids(1, 2) is None
+    finally:
+        db.close()
@@ -0,0 +1,22 @@
+from src.application.dto.user_body_metric_dto import CreateBodyMetricDTO
+from src.application.use_cases.user_profile.create_body_metric import CreateBodyMetricUseCase
+from src.infrastructure.database.models import UserModel
+from src.infrastructure.repositories import UserBodyMetricRepositoryImpl, UserRepositoryImpl
+
+from .conftest import StatementCounter, seed_history
+
+
+def test_create_body_metric_updates_user_without_loading_it(db, sqlite_engine):
+    seed_history(db, trainings_per_user=1)
+    db.query(UserModel).filter(UserModel.id == 1).update({"height": 180})
+    db.flush()
+    use_case = CreateBodyMetricUseCase(UserBodyMetricRepositoryImpl(db), UserRepositoryImpl(db))
+
+    counter = StatementCounter(sqlite_engine)
+    use_case.execute(CreateBodyMetricDTO(weight=81.5, height=None, date=None), user_id=1)
+    counter.close()
+
+    assert [s.split()[0] for s in counter.statements] == ["INSERT", "UPDATE"]
+    user = db.get(UserModel, 1)
+    db.refresh(user)
+    assert (float(user.weight), float(user.height)) == (81.5, 180.0)
@@ -0,0 +1,31 @@
+from src.infrastructure.database.models import TrainingModel
+from src.infrastructure.repositories import ExerciseRepositoryImpl
+
+from .conftest import seed_history
+
+
+def totals(db):
+    return {
+        t.id: (t.exercise_count, t.set_count, float(t.total_volume), t.top_weight and float(t.top_weight))
+        for t in db.query(TrainingModel).order_by(TrainingModel.id)
+    }
+
+
+def test_delete_recomputes_totals_of_trainings_that_used_the_exercise(db):
+    # Training t uses exercises t and t + 1 (mod 3)
+    seed_history(db, trainings_per_user=3, exercises=3, implementations_per_training=2)
+
+    ExerciseRepositoryImpl(db).delete(1)
+    db.expire_all()
+
+    one_left = (1, 3, 1320.0, 60.0)
+    assert totals(db) == {1: one_left, 2: (2, 6, 2640.0, 60.0), 3: one_left}
+
+
+def test_delete_resets_totals_of_trainings_left_empty(db):
+    seed_history(db, trainings_per_user=2, exercises=2, implementations_per_training=1)
+
+    ExerciseRepositoryImpl(db).delete(2)
+    db.expire_all()
+
+    assert totals(db) == {1: (1, 3, 1320.0, 60.0), 2: (0, 0, 0.0, None)}
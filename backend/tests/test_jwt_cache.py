@@ -0,0 +1,58 @@
+import time
+from datetime import timedelta
+
+from jose import jwt
+
+from src.infrastructure.auth import jwt_service
+from src.infrastructure.auth.jwt_service import JWTService, VerifiedTokenCache
+
+
+def count_decodes(monkeypatch) -> list:
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt_service.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_repeat_verifications_skip_decoding(monkeypatch):
+    decodes = count_decodes(monkeypatch)
+    token = JWTService.create_access_token({"sub": "1"})
+
+    payloads = [JWTService.verify_token(token) for _ in range(5)]
+
+    assert len(decodes) == 1
+    assert all(payload["sub"] == "1" for payload in payloads)
+    payloads[0]["sub"] = "2"  # Callers cannot change the cached payload
+    assert JWTService.verify_token(token)["sub"] == "1"
+
+
+def test_invalid_tokens_are_not_cached(monkeypatch):
+    decodes = count_decodes(monkeypatch)
+    token = JWTService.create_access_token({"sub": "1"})
+    tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+    assert JWTService.verify_token(tampered) is None
+    assert JWTService.verify_token(tampered) is None
+    assert len(decodes) == 2
+    assert JWTService.verify_token(JWTService.create_access_token({"sub": "1"}, timedelta(seconds=-1))) is None
+
+
+def test_entries_end_at_the_token_expiry():
+    cache = VerifiedTokenCache(max_size=2)
+    cache.put(b"expired", {"sub": "1", "exp": time.time() - 1})
+    cache.put(b"a", {"sub": "1", "exp": time.time() + 60})
+    cache.put(b"b", {"sub": "2", "exp": time.time() + 60})
+    cache.put(b"no-exp", {"sub": "3"})
+
+    assert cache.get(b"expired") is None
+    assert cache.get(b"no-exp") is None
+    assert cache.get(b"a")["sub"] == "1"
+    cache.put(b"c", {"sub": "3", "exp": time.time() + 60})
+    assert cache.get(b"b") is None  # Least recently used
+    assert cache.get(b"c")["sub"] == "3"
+
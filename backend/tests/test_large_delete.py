@@ -0,0 +1,78 @@
+"""Deletes rely on ON DELETE CASCADE: a constant number of statements, no children loaded."""
+import tracemalloc
+
+from sqlalchemy import func, insert, select
+
+from src.infrastructure.database.models import (
+    ImplementationModel,
+    SetModel,
+    TrainingModel,
+    TrainingTemplateModel,
+)
+from src.infrastructure.repositories import (
+    ExerciseRepositoryImpl,
+    TrainingRepositoryImpl,
+    TrainingTemplateRepositoryImpl,
+)
+
+from .conftest import StatementCounter, seed_history
+
+# Loading the 20,000 implementations through the ORM peaks around 100 MB
+MAX_PEAK_BYTES = 4 * 1024 * 1024
+
+
+def measure(engine, call):
+    """Statements issued and traced memory peak (bytes) of call."""
+    counter = StatementCounter(engine)
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        counter.close()
+    return counter.statements, peak
+
+
+def count(db, model):
+    return db.scalar(select(func.count()).select_from(model))
+
+
+def test_deleting_an_exercise_used_everywhere(db, sqlite_engine):
+    # 20,000 implementations and 60,000 sets, all of exercise 1
+    seed_history(db, trainings_per_user=5000, exercises=1, implementations_per_training=4)
+    db.expire_all()
+
+    statements, peak = measure(sqlite_engine, lambda: ExerciseRepositoryImpl(db).delete(1))
+
+    # Affected training ids, the DELETE, one totals UPDATE
+    assert len(statements) == 3
+    assert peak < MAX_PEAK_BYTES
+    assert count(db, ImplementationModel) == 0
+    assert count(db, SetModel) == 0
+
+
+def test_deleting_a_large_training(db, sqlite_engine):
+    seed_history(db, trainings_per_user=1, exercises=20, implementations_per_training=2000, sets_per_implementation=5)
+    db.expire_all()
+
+    statements, peak = measure(sqlite_engine, lambda: TrainingRepositoryImpl(db).delete(1))
+
+    # Hot row and archived copy
+    assert len(statements) == 2
+    assert peak < MAX_PEAK_BYTES
+    assert count(db, SetModel) == 0
+
+
+def test_deleting_a_template_detaches_its_trainings(db, sqlite_engine):
+    seed_history(db, trainings_per_user=5000, implementations_per_training=1, sets_per_implementation=1)
+    template_id = db.scalar(insert(TrainingTemplateModel).values(name="Push", user_id=1).returning(TrainingTemplateModel.id))
+    db.query(TrainingModel).update({"training_template_id": template_id})
+    db.expire_all()
+
+    statements, peak = measure(sqlite_engine, lambda: TrainingTemplateRepositoryImpl(db).delete(template_id))
+
+    assert len(statements) == 1
+    assert peak < MAX_PEAK_BYTES
+    assert count(db, TrainingModel) == 5000
+    assert db.scalar(select(func.count()).where(TrainingModel.training_template_id.is_not(None))) == 0
@@ -0,0 +1,36 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.settings import settings
+from src.presentation.main import app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "metrics-secret")
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/metrics/event-loop", "/metrics/database-pool"])
+def test_metrics_require_token(client, monkeypatch, path):
+    assert client.get(path).status_code == 403
+    assert client.get(path, headers={"X-Metrics-Token": "wrong"}).status_code == 403
+
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+    assert client.get(path, headers={"X-Metrics-Token": ""}).status_code == 404
+
+
+def test_metrics_with_token(client):
+    assert client.get("/metrics/event-loop", headers={"X-Metrics-Token": "metrics-secret"}).status_code == 200
+
+
+def test_unmatched_paths_share_one_route_key(client):
+    for path in ("/no/such/path/1", "/no/such/path/2", "/wp-login.php"):
+        assert client.get(path).status_code == 404
+    client.request("BREW", "/")
+
+    routes = client.get("/metrics/event-loop", headers={"X-Metrics-Token": "metrics-secret"}).json()["routes"]
+    keys = [route["route"] for route in routes]
+    assert not [key for key in keys if "/no/such/path" in key or "wp-login" in key or "BREW" in key]
+    assert next(route for route in routes if route["route"] == "GET <unmatched>")["requests"] >= 3
+    assert "OTHER /" in keys
@@ -0,0 +1,56 @@
+import threading
+
+import anyio
+import pytest
+from fastapi import HTTPException
+
+from src.application.dto.auth_dto import LoginUserDTO
+from src.application.use_cases.auth.authenticate_user import AuthenticateUserUseCase
+from src.domain.entities.user import User
+from src.infrastructure.auth.password_service import PasswordService
+from src.infrastructure.repositories import RefreshTokenRepositoryImpl, UserRepositoryImpl
+from src.presentation.api.offload import offload
+
+
+def test_login_upgrades_hashes_with_an_old_cost_factor(db, monkeypatch):
+    monkeypatch.setattr(PasswordService, "BCRYPT_ROUNDS", 5)
+    old_hash = PasswordService.hash_password("secret123")
+    UserRepositoryImpl(db).create(User(id=None, email="a@example.com", username="a", hashed_password=old_hash))
+    monkeypatch.setattr(PasswordService, "BCRYPT_ROUNDS", 4)
+    assert PasswordService.needs_rehash(old_hash)
+
+    AuthenticateUserUseCase(UserRepositoryImpl(db), RefreshTokenRepositoryImpl(db)).execute(
+        LoginUserDTO("a@example.com", "secret123")
+    )
+
+    new_hash = UserRepositoryImpl(db).get_by_email("a@example.com").hashed_password
+    assert new_hash.startswith("$2b$04$")
+    assert not PasswordService.needs_rehash(new_hash)
+    assert PasswordService.verify_password("secret123", new_hash)
+
+
+def test_offload_sheds_calls_beyond_the_queue_limit():
+    release = threading.Event()
+    bounded = offload(1, max_queue=1)(lambda: release.wait(5))
+    outcomes = []
+
+    async def call():
+        try:
+            outcomes.append(await bounded())
+        except HTTPException as error:
+            outcomes.append(error.status_code)
+            release.set()
+
+    async def main():
+        async with anyio.create_task_group() as tasks:
+            for _ in range(3):
+                tasks.start_soon(call)
+                await anyio.sleep(0.05)  # Running, then waiting, then shed
+
+    anyio.run(main)
+    assert sorted(outcomes, key=str) == [503, True, True]
+
+
+@pytest.mark.parametrize("hashed", ["", "not-a-bcrypt-hash", "$2b$xx$abc"])
+def test_needs_rehash_ignores_malformed_hashes(hashed):
+    assert not PasswordService.needs_rehash(hashed)
@@ -0,0 +1,107 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.application.dto.auth_dto import LoginUserDTO
+from src.application.use_cases.auth.authenticate_user import AuthenticateUserUseCase
+from src.domain.entities.user import User
+from src.infrastructure.auth.password_service import PasswordService
+from src.infrastructure.auth.principal_cache import PrincipalCache, principal_cache
+from src.infrastructure.repositories import RefreshTokenRepositoryImpl, UserRepositoryImpl
+from src.presentation.api.dependencies import get_current_user_id
+
+from .conftest import StatementCounter
+
+
+def test_cache_is_bounded_and_expires():
+    cache = PrincipalCache(max_size=2, ttl_seconds=0.05)
+    cache.put(1, "a")
+    cache.put(2, "b")
+    assert cache.get(1) == "a"  # 1 is now the most recently used
+    cache.put(3, "c")
+    assert (cache.get(1), cache.get(2), cache.get(3)) == ("a", None, "c")
+
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    time.sleep(0.06)
+    assert cache.get(3) is None
+
+
+@pytest.fixture
+def login(db):
+    password = PasswordService.hash_password("secret123")
+    user = UserRepositoryImpl(db).create(User(id=None, email="a@example.com", username="a", hashed_password=password))
+    db.commit()
+
+    def token(password: str = "secret123") -> HTTPAuthorizationCredentials:
+        result = AuthenticateUserUseCase(UserRepositoryImpl(db), RefreshTokenRepositoryImpl(db)).execute(
+            LoginUserDTO("a@example.com", password)
+        )
+        return HTTPAuthorizationCredentials(scheme="Bearer", credentials=result.access_token)
+
+    return user, token
+
+
+def authenticate(db, credentials) -> int:
+    return get_current_user_id(credentials=credentials, user_repository=UserRepositoryImpl(db), db=db)
+
+
+def test_repeated_requests_skip_the_user_lookup(db, sqlite_engine, login):
+    user, token = login
+    credentials = token()
+    counter = StatementCounter(sqlite_engine)
+
+    assert authenticate(db, credentials) == user.id
+    assert len(counter.statements) == 1
+    counter.reset()
+    for _ in range(3):
+        assert authenticate(db, credentials) == user.id
+    assert counter.statements == []
+    counter.close()
+
+
+def test_password_change_revokes_older_tokens(db, login):
+    user, token = login
+    old = token()
+    assert authenticate(db, old) == user.id
+
+    user.change_password(PasswordService.hash_password("changed123"))
+    UserRepositoryImpl(db).update(user)
+    db.commit()
+
+    with pytest.raises(HTTPException) as error:
+        authenticate(db, old)
+    assert error.value.status_code == 401
+    assert authenticate(db, token("changed123")) == user.id
+
+
+def test_rehash_on_login_keeps_other_sessions(db, login, monkeypatch):
+    user, token = login
+    other_device = token()
+    assert authenticate(db, other_device) == user.id
+
+    # A lower cost factor makes the next login store a fresh hash of the same password
+    monkeypatch.setattr(PasswordService, "BCRYPT_ROUNDS", 4)
+    this_device = token()
+    db.commit()
+    rehashed = UserRepositoryImpl(db).get_by_id(user.id)
+    assert rehashed.hashed_password != user.hashed_password
+    assert rehashed.password_version == user.password_version
+
+    principal_cache.clear()  # Look the user up again instead of trusting the cached version
+    assert authenticate(db, other_device) == user.id
+    assert authenticate(db, this_device) == user.id
+
+
+def test_deleted_user_is_rejected(db, login):
+    user, token = login
+    credentials = token()
+    assert authenticate(db, credentials) == user.id
+
+    UserRepositoryImpl(db).delete(user.id)
+    db.commit()
+    with pytest.raises(HTTPException) as error:
+        authenticate(db, credentials)
+    assert error.value.detail == "User not found"
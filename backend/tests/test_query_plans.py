@@ -0,0 +1,223 @@
+"""EXPLAIN regression tests: hot repository queries must not scan large tables sequentially.
+
+Runs against PostgreSQL only (set TEST_POSTGRES_URL, e.g.
+postgresql://postgres@localhost/kacheck_test); the schema is recreated there.
+Sequential scans are disabled for the EXPLAIN, so the planner only falls back
+to one when no index can serve the query.
+"""
+import re
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+
+import pytest
+from sqlalchemy import event, insert, null, select, text
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.follow import FollowStatus
+from src.infrastructure.database.models import (
+    FeedEntryModel,
+    FollowModel,
+    TrainingCommentModel,
+    TrainingModel,
+    TrainingReactionModel,
+    TrainingTemplateModel,
+    UserBodyMetricModel,
+)
+from src.infrastructure.read_models import TrainingReadModel
+from src.infrastructure.repositories import (
+    FeedRepositoryImpl,
+    FollowRepositoryImpl,
+    TrainingCommentRepositoryImpl,
+    TrainingReactionRepositoryImpl,
+    TrainingRepositoryImpl,
+    TrainingTemplateRepositoryImpl,
+    UserBodyMetricRepositoryImpl,
+)
+
+from .conftest import seed_history
+
+USERS = 200
+TRAININGS_PER_USER = 50
+LARGE_TABLES = (
+    "trainings",
+    "implementations",
+    "sets",
+    "training_archive",
+    "follows",
+    "training_comments",
+    "training_reactions",
+    "user_body_metrics",
+    "feed_entries",
+)
+SEQ_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+@pytest.fixture(scope="module")
+def db(postgres_engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=postgres_engine)()
+    seed_history(session, users=USERS, trainings_per_user=TRAININGS_PER_USER, exercises=20)
+    session.execute(
+        insert(FollowModel),
+        [
+            {"follower_id": u, "following_id": (u + k) % USERS + 1, "status": FollowStatus.APPROVED}
+            for u in range(1, USERS + 1)
+            for k in range(1, 6)
+        ],
+    )
+    trainings = USERS * TRAININGS_PER_USER
+    session.execute(
+        insert(TrainingCommentModel),
+        [{"training_id": t, "user_id": t % USERS + 1, "text": "Nice"} for t in range(1, trainings + 1, 3)],
+    )
+    session.execute(
+        insert(TrainingReactionModel),
+        [{"training_id": t, "user_id": t % USERS + 1, "reaction_type": "LIKE"} for t in range(1, trainings + 1, 2)],
+    )
+    session.execute(
+        insert(UserBodyMetricModel),
+        [
+            {"user_id": u, "weight": 80, "height": 180, "date": date(2025, 1, 1) - timedelta(days=d)}
+            for u in range(1, USERS + 1)
+            for d in range(20)
+        ],
+    )
+    session.execute(insert(TrainingTemplateModel), [{"name": f"Template {u}", "user_id": u} for u in range(1, USERS + 1)])
+    session.execute(text("UPDATE trainings SET share_token = 'token-' || id WHERE id % 50 = 0"))
+    # Trainings without reactions, comments or a share token go to cold storage
+    TrainingRepositoryImpl(session).archive_completed_before(datetime(2024, 12, 10), limit=trainings)
+    # Hot trainings fanned out to approved followers; every tenth author is over the cap and shared
+    columns = ["user_id", "author_id", "training_id", "created_at"]
+    fanned_out = (
+        select(FollowModel.follower_id, TrainingModel.user_id, TrainingModel.id, TrainingModel.date_time)
+        .join(FollowModel, FollowModel.following_id == TrainingModel.user_id)
+        .where(FollowModel.status == FollowStatus.APPROVED, TrainingModel.user_id % 10 != 0)
+    )
+    shared = select(null(), TrainingModel.user_id, TrainingModel.id, TrainingModel.date_time).where(
+        TrainingModel.user_id % 10 == 0
+    )
+    session.execute(insert(FeedEntryModel).from_select(columns, fanned_out.order_by(TrainingModel.id)))
+    session.execute(insert(FeedEntryModel).from_select(columns, shared.order_by(TrainingModel.id)))
+    session.commit()
+    with postgres_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE"))
+    yield session
+    session.close()
+
+
+def explain(db, call) -> List[Tuple[str, str]]:
+    """Run call, then EXPLAIN every SELECT it issued with sequential scans disabled: (statement, plan) pairs."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert statements, "no SELECT statements were issued"
+
+    connection = db.connection()
+    connection.exec_driver_sql("SET enable_seqscan = off")
+    try:
+        return [
+            (
+                statement,
+                "\n".join(row[0] for row in connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)),
+            )
+            for statement, parameters in statements
+        ]
+    finally:
+        connection.exec_driver_sql("RESET enable_seqscan")
+
+
+def assert_no_seq_scans(db, call) -> None:
+    """Run call, then EXPLAIN every SELECT it issued and fail on sequential scans of large tables."""
+    for statement, plan in explain(db, call):
+        scanned = {table for table in SEQ_SCAN.findall(plan) if table in LARGE_TABLES}
+        assert not scanned, f"sequential scan on {scanned}:\n{statement}\n{plan}"
+
+
+USER_ID = 7
+RANGE = (datetime(2024, 12, 1), datetime(2024, 12, 31))
+SHARED_TRAINING_ID = USER_ID * TRAININGS_PER_USER  # id % 50 == 0, stays hot
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        pytest.param(lambda db: TrainingRepositoryImpl(db, "selectin").get_by_id(SHARED_TRAINING_ID), id="training-by-id-selectin"),
+        pytest.param(lambda db: TrainingRepositoryImpl(db, "joined").get_by_id(SHARED_TRAINING_ID), id="training-by-id-joined"),
+        pytest.param(lambda db: TrainingRepositoryImpl(db).get_by_id(SHARED_TRAINING_ID - 1), id="training-by-id-archived"),
+        pytest.param(lambda db: TrainingRepositoryImpl(db).get_all(USER_ID, *RANGE), id="trainings-all"),
+        pytest.param(lambda db: TrainingRepositoryImpl(db).get_summaries(USER_ID, *RANGE), id="training-summaries"),
+        pytest.param(lambda db: TrainingRepositoryImpl(db).get_last_exercise_implementation(USER_ID, 3), id="last-implementation"),
+        pytest.param(lambda db: TrainingReadModel(db).list_for_user(USER_ID, *RANGE), id="read-model-list"),
+        pytest.param(lambda db: TrainingReadModel(db).get_by_share_token(f"token-{SHARED_TRAINING_ID}"), id="read-model-shared"),
+        pytest.param(lambda db: FollowRepositoryImpl(db).get_by_ids(USER_ID, USER_ID + 2), id="follow-by-ids"),
+        pytest.param(lambda db: FollowRepositoryImpl(db).get_followers_with_usernames(USER_ID, None, None, 50), id="followers"),
+        pytest.param(
+            lambda db: FollowRepositoryImpl(db).get_followers_with_usernames(USER_ID, FollowStatus.APPROVED, 10**6, 50),
+            id="followers-approved-page",
+        ),
+        pytest.param(lambda db: FollowRepositoryImpl(db).get_following_with_usernames(USER_ID, None, None, 50), id="following"),
+        pytest.param(
+            lambda db: FollowRepositoryImpl(db).get_following_with_usernames(USER_ID, FollowStatus.PENDING, 10**6, 50),
+            id="following-pending-page",
+        ),
+        pytest.param(lambda db: FollowRepositoryImpl(db).get_following_approved(USER_ID), id="following-approved"),
+        pytest.param(
+            lambda db: TrainingCommentRepositoryImpl(db).get_by_training_with_usernames(SHARED_TRAINING_ID, None, 50),
+            id="comments",
+        ),
+        pytest.param(
+            lambda db: TrainingCommentRepositoryImpl(db).get_by_training_with_usernames(
+                SHARED_TRAINING_ID, (datetime(2024, 1, 1), 1), 50
+            ),
+            id="comments-page",
+        ),
+        pytest.param(lambda db: TrainingReactionRepositoryImpl(db).get_by_training(SHARED_TRAINING_ID), id="reactions"),
+        pytest.param(
+            lambda db: TrainingReactionRepositoryImpl(db).get_summaries(list(range(301, 321)), USER_ID),
+            id="reaction-summaries",
+        ),
+        pytest.param(
+            lambda db: TrainingCommentRepositoryImpl(db).count_by_trainings(list(range(301, 321))), id="comment-counts"
+        ),
+        pytest.param(
+            lambda db: TrainingReactionRepositoryImpl(db).get_by_training_and_user(SHARED_TRAINING_ID, USER_ID),
+            id="reaction-by-user",
+        ),
+        pytest.param(
+            lambda db: UserBodyMetricRepositoryImpl(db).get_by_user_id(USER_ID, date(2024, 12, 20), date(2025, 1, 1)),
+            id="body-metrics",
+        ),
+        pytest.param(lambda db: UserBodyMetricRepositoryImpl(db).get_latest_by_user_id(USER_ID), id="latest-body-metric"),
+        pytest.param(lambda db: TrainingTemplateRepositoryImpl(db).get_all(USER_ID), id="templates"),
+        pytest.param(lambda db: FeedRepositoryImpl(db).get_page(USER_ID, None, 50), id="feed"),
+        pytest.param(lambda db: FeedRepositoryImpl(db).get_page(USER_ID, 2000, 50), id="feed-page"),
+        pytest.param(lambda db: FeedRepositoryImpl(db).count_followers(USER_ID, 1001), id="feed-follower-count"),
+    ],
+)
+def test_query_uses_indexes(db, query):
+    assert_no_seq_scans(db, lambda: query(db))
+    db.rollback()
+
+
+@pytest.mark.parametrize("before_id", [None, 2000], ids=["first-page", "next-page"])
+def test_feed_page_is_one_query_on_the_feed_indexes(db, before_id):
+    """The user's own entries and followed authors' shared entries each come from a range scan of their index."""
+    [(statement, plan)] = explain(db, lambda: FeedRepositoryImpl(db).get_page(USER_ID, before_id, 50))
+    db.rollback()
+    assert "UNION ALL" in statement
+    assert "ix_feed_entries_user_id_id" in plan, plan
+    assert "ix_feed_entries_author_id_id_shared" in plan, plan
+
+
+def test_seeded_data_is_split_between_hot_and_archive(db):
+    hot = db.query(TrainingModel).count()
+    archived = db.execute(text("SELECT count(*) FROM training_archive")).scalar()
+    assert hot and archived and hot + archived == USERS * TRAININGS_PER_USER
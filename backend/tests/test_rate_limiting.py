@@ -0,0 +1,155 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from src.infrastructure.auth.jwt_service import JWTService
+from src.infrastructure.database.models import RateLimitBucketModel
+from src.infrastructure.database.session import Database
+from src.infrastructure.rate_limiting import DatabaseTokenBucketStore, InMemoryTokenBucketStore
+from src.infrastructure.settings import settings
+from src.presentation.main import app as main_app
+from src.presentation.rate_limiting import RateLimiter, RateLimitMiddleware, RateLimitRule
+
+
+def limited_client(store=None, client=("10.0.0.1", 1234)):
+    limiter = RateLimiter(
+        rules=[
+            RateLimitRule("auth", ("/auth/",), per_minute=60, burst=2),
+            RateLimitRule("reports", ("/reports",), per_minute=60, burst=1, per_user=True),
+        ],
+        store=store or InMemoryTokenBucketStore(),
+    )
+    app = FastAPI()
+    app.add_api_route("/auth/login", lambda: {"ok": True}, methods=["POST"])
+    app.add_api_route("/reports", lambda: {"ok": True})
+    app.add_api_route("/open", lambda: {"ok": True})
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+    return TestClient(app, client=client), limiter
+
+
+def bearer(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {JWTService.create_access_token({'sub': str(user_id)})}"}
+
+
+def test_rejects_beyond_the_burst_with_retry_after():
+    client, limiter = limited_client()
+
+    statuses = [client.post("/auth/login").status_code for _ in range(3)]
+    rejected = client.post("/auth/login")
+
+    assert statuses == [200, 200, 429]
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "1"
+    assert [client.get("/open").status_code for _ in range(5)] == [200] * 5
+    assert limiter.snapshot()["auth"] == {
+        "per_minute": 60, "burst": 2, "per_user": False, "allowed": 2, "rejected": 2
+    }
+
+
+def test_buckets_are_per_ip_and_per_user():
+    client, limiter = limited_client()
+    other_ip, _ = limited_client(store=limiter.store, client=("10.0.0.2", 1))
+
+    assert client.post("/auth/login").status_code == 200
+    assert client.post("/auth/login").status_code == 200
+    assert client.post("/auth/login").status_code == 429
+    assert other_ip.post("/auth/login").status_code == 200
+
+    assert client.get("/reports", headers=bearer(1)).status_code == 200
+    assert client.get("/reports", headers=bearer(1)).status_code == 429
+    assert client.get("/reports", headers=bearer(2)).status_code == 200
+    # Anonymous and invalid tokens fall back to the client IP
+    assert client.get("/reports").status_code == 200
+    assert client.get("/reports", headers={"Authorization": "Bearer nonsense"}).status_code == 429
+
+
+def test_clients_behind_a_trusted_proxy_get_their_own_buckets():
+    direct, _ = limited_client()
+    # What uvicorn applies in front of the app for FORWARDED_ALLOW_IPS (gunicorn.conf.py)
+    proxied = TestClient(ProxyHeadersMiddleware(direct.app, trusted_hosts="10.0.0.1"), client=("10.0.0.1", 1))
+    untrusted = TestClient(ProxyHeadersMiddleware(direct.app, trusted_hosts="10.0.0.1"), client=("10.0.0.9", 1))
+
+    def login(client, forwarded_for):
+        return client.post("/auth/login", headers={"X-Forwarded-For": forwarded_for}).status_code
+
+    assert [login(proxied, "203.0.113.1") for _ in range(3)] == [200, 200, 429]
+    assert login(proxied, "203.0.113.2") == 200
+    # Anyone else's X-Forwarded-For is ignored, so it cannot dodge its own bucket
+    assert [login(untrusted, f"198.51.100.{n}") for n in range(3)] == [200, 200, 429]
+
+
+def test_buckets_refill():
+    store = InMemoryTokenBucketStore()
+
+    async def run():
+        assert await store.take("k", 1, refill_per_second=20) == 0
+        assert await store.take("k", 1, refill_per_second=20) > 0
+        await asyncio.sleep(0.06)
+        assert await store.take("k", 1, refill_per_second=20) == 0
+
+    asyncio.run(run())
+
+
+def test_store_over_capacity_evicts_least_recently_used_buckets():
+    store = InMemoryTokenBucketStore(max_keys=3)
+
+    async def run():
+        # Empty buckets that stay non-full for minutes, as under a flood of distinct IPs
+        assert await store.take("hot", 1, refill_per_second=0.01) == 0
+        for n in range(1000):
+            await store.take(f"ip-{n}", 1, refill_per_second=0.01)
+            # The recently used bucket stays, still empty
+            assert await store.take("hot", 1, refill_per_second=0.01) > 0
+
+    asyncio.run(run())
+    assert list(store._buckets) == ["ip-998", "ip-999", "hot"]
+
+
+def database_urls():
+    urls = ["sqlite"]
+    if os.environ.get("TEST_POSTGRES_URL"):
+        urls.append(os.environ["TEST_POSTGRES_URL"])
+    return urls
+
+
+@pytest.mark.parametrize("url", database_urls())
+def test_database_store_shares_buckets(tmp_path, url):
+    database = Database(f"sqlite:///{tmp_path}/limits.db" if url == "sqlite" else url)
+    database.create_tables()
+    with database.SessionLocal() as db:
+        db.execute(delete(RateLimitBucketModel))
+        db.commit()
+    # Two stores stand in for two workers
+    first = DatabaseTokenBucketStore(lambda: database.async_engine)
+    second = DatabaseTokenBucketStore(lambda: database.async_engine)
+
+    async def run():
+        try:
+            results = [await store.take("test:shared", 3, refill_per_second=1) for store in (first, second, first, second)]
+            await asyncio.sleep(0.05)
+            results.append(await second.take("test:shared", 3, refill_per_second=1))
+            results.append(await first.take("test:other", 3, refill_per_second=1))
+            return results
+        finally:
+            await database.dispose()
+
+    results = asyncio.run(run())
+    assert results[:3] == [0, 0, 0]
+    assert 0.9 < results[3] <= 1
+    assert 0.8 < results[4] < results[3]
+    assert results[5] == 0
+
+
+def test_rate_limit_metrics_require_token(monkeypatch):
+    client = TestClient(main_app)
+    assert client.get("/metrics/rate-limits").status_code in (403, 404)
+
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "metrics-secret")
+    response = client.get("/metrics/rate-limits", headers={"X-Metrics-Token": "metrics-secret"})
+    assert response.status_code == 200
+    assert set(response.json()) == {"auth", "analytics", "training_import"}
@@ -0,0 +1,96 @@
+import asyncio
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.database import session as database_session
+from src.infrastructure.database.replicas import ReadYourWritesCookie
+from src.infrastructure.database.session import Database
+from src.presentation.api.dependencies import get_read_db, read_your_writes_cookie
+from src.presentation.main import app
+from src.presentation.read_your_writes import ReadYourWritesMiddleware
+
+TRAINING = {
+    "date_time": "2025-01-01T10:00:00",
+    "status": "completed",
+    "implementations": [
+        {"exercise_id": 1, "order_index": 0, "sets": [{"order_index": 0, "weight": 100, "reps": 5}]}
+    ],
+}
+
+
+def login(client, email, username):
+    body = {"email": email, "username": username, "password": "secret123"}
+    assert client.post("/api/v1/auth/register", json=body).status_code == 201
+    response = client.post("/api/v1/auth/login", json={"email": email, "password": "secret123"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def replicated(tmp_path, monkeypatch):
+    """Primary plus a replica frozen at its state after two users registered and alice added an exercise."""
+    primary_url = f"sqlite:///{tmp_path}/primary.db"
+    database = Database(primary_url)
+    database.create_tables()
+    monkeypatch.setattr(database_session, "database", database)
+    client = TestClient(ReadYourWritesMiddleware(app, read_your_writes_cookie))
+    alice = login(client, "alice@example.com", "alice")
+    bob = login(client, "bob@example.com", "bob")
+    exercise = {"name": "Bench press", "muscle_group_ids": []}
+    assert client.post("/api/v1/exercises", json=exercise, headers=alice).status_code == 201
+    client.cookies.clear()
+    asyncio.run(database.dispose())
+
+    shutil.copy(tmp_path / "primary.db", tmp_path / "replica.db")
+    database = Database(primary_url, replica_urls=[f"sqlite:///{tmp_path}/replica.db"])
+    monkeypatch.setattr(database_session, "database", database)
+    yield client, alice, bob
+    asyncio.run(database.dispose())
+
+
+def test_reads_follow_the_writer_across_workers(replicated):
+    client, alice, bob = replicated
+    assert client.get("/api/v1/trainings", headers=alice).json() == []
+
+    response = client.post("/api/v1/trainings", json=TRAINING, headers=alice)
+    assert response.status_code == 201, response.text
+    assert ReadYourWritesCookie.NAME in response.cookies
+
+    # Async route on the primary while the cookie is valid
+    assert len(client.get("/api/v1/trainings", headers=alice).json()) == 1
+    # Another worker (no shared memory) honours the same cookie
+    other_worker = TestClient(ReadYourWritesMiddleware(app, read_your_writes_cookie))
+    other_worker.cookies.set(ReadYourWritesCookie.NAME, response.cookies[ReadYourWritesCookie.NAME], path="/api")
+    assert len(other_worker.get("/api/v1/trainings", headers=alice).json()) == 1
+    # The cookie is bound to its user: bob's reads stay on the stale replica
+    assert other_worker.get("/api/v1/trainings/1", headers=bob).status_code == 404
+
+    # Tampered or missing cookie: back to the replica
+    client.cookies.clear()
+    client.cookies.set(ReadYourWritesCookie.NAME, "1.99999999999999.forged", path="/api")
+    assert client.get("/api/v1/trainings", headers=alice).json() == []
+
+
+def test_sync_reads_use_the_primary_after_a_write(replicated):
+    client, alice, bob = replicated
+    assert client.post("/api/v1/social/follow/2", headers=alice).status_code == 201
+    assert len(client.get("/api/v1/social/following", headers=alice).json()) == 1
+
+    client.cookies.clear()
+    assert client.get("/api/v1/social/following", headers=alice).json() == []
+
+
+def test_read_session_without_replicas_is_the_request_session(db, monkeypatch):
+    monkeypatch.setattr(database_session, "database", Database("sqlite://"))
+    dependency = get_read_db(credentials=None, read_primary_until=None, db=db)
+    assert next(dependency) is db
+
+
+def test_cookie_expires():
+    cookie = ReadYourWritesCookie("secret", window_seconds=-1)
+    assert not cookie.is_recent(cookie.issue(1), 1)
+    cookie = ReadYourWritesCookie("secret", window_seconds=5)
+    assert cookie.is_recent(cookie.issue(1), 1)
+    assert not cookie.is_recent(cookie.issue(1), 2)
+    assert not ReadYourWritesCookie("other", window_seconds=5).is_recent(cookie.issue(1), 1)
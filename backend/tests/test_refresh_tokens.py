@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.application.dto.auth_dto import LoginUserDTO, RefreshTokenDTO
+from src.application.use_cases.auth.authenticate_user import AuthenticateUserUseCase
+from src.application.use_cases.auth.logout_user import LogoutUserUseCase
+from src.application.use_cases.auth.refresh_access_token import RefreshAccessTokenUseCase
+from src.domain.entities.user import User
+from src.infrastructure.auth.password_service import PasswordService
+from src.infrastructure.auth.refresh_token_service import RefreshTokenService
+from src.infrastructure.auth.revocation_filter import RevocationFilter, revocation_filter
+from src.infrastructure.database.models import RefreshTokenModel
+from src.infrastructure.repositories import RefreshTokenRepositoryImpl, UserRepositoryImpl
+from src.presentation.api.dependencies import get_current_user_id
+
+
+@pytest.fixture
+def tokens(db):
+    """Log a user in; returns the token response."""
+    hashed = PasswordService.hash_password("secret123")
+    UserRepositoryImpl(db).create(User(id=None, email="a@example.com", username="a", hashed_password=hashed))
+    result = AuthenticateUserUseCase(UserRepositoryImpl(db), RefreshTokenRepositoryImpl(db)).execute(
+        LoginUserDTO("a@example.com", "secret123")
+    )
+    db.commit()
+    return result
+
+
+def refresh(db, refresh_token: str):
+    result = RefreshAccessTokenUseCase(UserRepositoryImpl(db), RefreshTokenRepositoryImpl(db)).execute(
+        RefreshTokenDTO(refresh_token)
+    )
+    db.commit()
+    return result
+
+
+def authenticate(db, access_token: str) -> int:
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+    return get_current_user_id(credentials=credentials, user_repository=UserRepositoryImpl(db), db=db)
+
+
+def test_login_stores_only_the_token_hash(db, tokens):
+    stored = db.query(RefreshTokenModel).one()
+    assert tokens.refresh_token and tokens.expires_in == 30 * 60
+    assert stored.token_hash == RefreshTokenService.hash_token(tokens.refresh_token)
+    assert tokens.refresh_token not in (stored.token_hash, stored.session_id)
+
+
+def test_refresh_rotates_without_checking_the_password(db, tokens, monkeypatch):
+    def no_bcrypt(*args):
+        raise AssertionError("refresh must not hash or verify passwords")
+
+    monkeypatch.setattr(PasswordService, "verify_password", no_bcrypt)
+    monkeypatch.setattr(PasswordService, "hash_password", no_bcrypt)
+
+    refreshed = refresh(db, tokens.refresh_token)
+
+    assert refreshed.refresh_token != tokens.refresh_token
+    assert authenticate(db, refreshed.access_token) == 1
+    assert refresh(db, refreshed.refresh_token).access_token
+
+
+def test_reusing_a_rotated_token_ends_the_session(db, tokens):
+    refreshed = refresh(db, tokens.refresh_token)
+
+    with pytest.raises(ValueError):
+        refresh(db, tokens.refresh_token)
+
+    with pytest.raises(ValueError):
+        refresh(db, refreshed.refresh_token)
+    with pytest.raises(HTTPException) as error:
+        authenticate(db, refreshed.access_token)
+    assert error.value.status_code == 401
+
+
+def test_logout_revokes_the_sessions_access_tokens(db, tokens):
+    assert authenticate(db, tokens.access_token) == 1
+
+    LogoutUserUseCase(RefreshTokenRepositoryImpl(db)).execute(RefreshTokenDTO(tokens.refresh_token))
+    db.commit()
+
+    with pytest.raises(HTTPException):
+        authenticate(db, tokens.access_token)
+    with pytest.raises(ValueError):
+        refresh(db, tokens.refresh_token)
+
+
+def test_expired_and_unknown_tokens_are_rejected(db, tokens):
+    db.query(RefreshTokenModel).update({"expires_at": datetime.utcnow() - timedelta(seconds=1)})
+    db.commit()
+
+    for token in (tokens.refresh_token, "unknown"):
+        with pytest.raises(ValueError):
+            refresh(db, token)
+
+
+def test_other_workers_see_revocations_after_a_sync(db, tokens):
+    LogoutUserUseCase(RefreshTokenRepositoryImpl(db)).execute(RefreshTokenDTO(tokens.refresh_token))
+    db.commit()
+    session_id = db.query(RefreshTokenModel.session_id).scalar()
+    other_worker = RevocationFilter(retention_seconds=60, sync_interval_seconds=30)
+    assert revocation_filter.is_revoked(session_id) and not other_worker.is_revoked(session_id)
+
+    now = datetime.utcnow()
+    other_worker.merge(RefreshTokenRepositoryImpl(db).get_revoked_sessions(now - other_worker.retention), now)
+    assert other_worker.is_revoked(session_id)
+
+    # Once every access token of the session has expired the entry is dropped
+    other_worker.merge([], now + timedelta(seconds=61))
+    assert not other_worker.is_revoked(session_id)
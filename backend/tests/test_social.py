@@ -0,0 +1,215 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.infrastructure.auth.password_service import PasswordService
+from src.infrastructure.database import session as database_session
+from src.infrastructure.database.session import Database
+from src.infrastructure.settings import settings
+from src.presentation.api.pagination import NEXT_CURSOR_HEADER
+from src.presentation.main import app
+
+from .conftest import StatementCounter
+
+USERNAMES = ["alice", "bob", "carol", "dave", "erin"]
+
+
+@pytest.fixture
+def social(tmp_path, monkeypatch):
+    """Users alice..erin; everyone else follows alice, who approved bob and dave."""
+    monkeypatch.setattr(PasswordService, "BCRYPT_ROUNDS", 4)
+    database = Database(f"sqlite:///{tmp_path}/social.db")
+    database.create_tables()
+    monkeypatch.setattr(database_session, "database", database)
+    client = TestClient(app)
+    headers = {}
+    for username in USERNAMES:
+        body = {"email": f"{username}@example.com", "username": username, "password": "secret123"}
+        assert client.post("/api/v1/auth/register", json=body).status_code == 201
+        token = client.post("/api/v1/auth/login", json=body).json()["access_token"]
+        headers[username] = {"Authorization": f"Bearer {token}"}
+    for username in USERNAMES[1:]:
+        assert client.post("/api/v1/social/follow/1", headers=headers[username]).status_code == 201
+    for follower_id in (2, 4):
+        assert client.post(f"/api/v1/social/follow/{follower_id}/approve", headers=headers["alice"]).status_code == 200
+    yield client, headers, database
+    asyncio.run(database.dispose())
+
+
+def pages(client, path, headers, **params):
+    """Every page of a paginated list, following X-Next-Cursor."""
+    result = []
+    while True:
+        response = client.get(path, params=params, headers=headers)
+        assert response.status_code == 200, response.text
+        result.append(response.json())
+        if NEXT_CURSOR_HEADER not in response.headers:
+            return result
+        params["cursor"] = response.headers[NEXT_CURSOR_HEADER]
+
+
+def test_followers_are_paginated_newest_first_with_usernames(social):
+    client, headers, database = social
+    counter = StatementCounter(database.engine)
+    try:
+        result = pages(client, "/api/v1/social/followers", headers["alice"], limit=3)
+    finally:
+        counter.close()
+
+    assert [[f["follower_username"] for f in page] for page in result] == [["erin", "dave", "carol"], ["bob"]]
+    # One query per page, usernames included
+    assert len([s for s in counter.statements if "FROM follows" in s]) == 2
+
+
+def test_follow_lists_filter_by_status(social):
+    client, headers, _ = social
+    approved = pages(client, "/api/v1/social/followers", headers["alice"], status="approved", limit=1)
+    assert [[f["follower_username"] for f in page] for page in approved] == [["dave"], ["bob"]]
+
+    following = client.get("/api/v1/social/following", params={"status": "pending"}, headers=headers["carol"]).json()
+    assert [(f["following_username"], f["status"]) for f in following] == [("alice", "pending")]
+    assert client.get("/api/v1/social/following", params={"status": "approved"}, headers=headers["carol"]).json() == []
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "WyJ4Il0", "WzEsMl0"])
+def test_malformed_cursors_are_rejected(social, cursor):
+    client, headers, _ = social
+    response = client.get("/api/v1/social/followers", params={"cursor": cursor}, headers=headers["alice"])
+    assert response.status_code == 400
+
+
+def create_training(client, headers) -> int:
+    exercise = client.post("/api/v1/exercises", json={"name": "Squat", "muscle_group_ids": []}, headers=headers).json()
+    training = {
+        "date_time": "2025-01-01T10:00:00",
+        "status": "completed",
+        "implementations": [
+            {"exercise_id": exercise["id"], "order_index": 0, "sets": [{"order_index": 0, "weight": 100, "reps": 5}]}
+        ],
+    }
+    response = client.post("/api/v1/trainings", json=training, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def test_comments_are_paginated_oldest_first_with_usernames(social):
+    client, headers, database = social
+    training_id = create_training(client, headers["alice"])
+    path = f"/api/v1/social/trainings/{training_id}/comments"
+    for n, username in enumerate(["bob", "carol", "bob", "dave", "erin"]):
+        assert client.post(path, json={"text": f"Comment {n}"}, headers=headers[username]).status_code == 201
+    with database.SessionLocal() as db:
+        # Comments written in the same instant must neither repeat nor go missing across pages
+        db.execute(text("UPDATE training_comments SET created_at = (SELECT min(created_at) FROM training_comments)"))
+        db.commit()
+
+    counter = StatementCounter(database.engine)
+    try:
+        result = pages(client, path, {}, limit=2)
+    finally:
+        counter.close()
+
+    assert [[(c["text"], c["username"]) for c in page] for page in result] == [
+        [("Comment 0", "bob"), ("Comment 1", "carol")],
+        [("Comment 2", "bob"), ("Comment 3", "dave")],
+        [("Comment 4", "erin")],
+    ]
+    assert len(counter.statements) == 3  # One joined query per page
+
+
+def test_social_summaries_take_two_grouped_queries(social):
+    client, headers, database = social
+    first, second, quiet = (create_training(client, headers["alice"]) for _ in range(3))
+    for username, training_id, reaction in [
+        ("bob", first, "LIKE"), ("carol", first, "LIKE"), ("dave", first, "FIRE"), ("alice", first, "FIRE"),
+        ("bob", second, "MUSCLE"),
+    ]:
+        path = f"/api/v1/social/trainings/{training_id}/reactions"
+        assert client.post(path, json={"reaction_type": reaction}, headers=headers[username]).status_code == 201
+    for n in range(3):
+        path = f"/api/v1/social/trainings/{second}/comments"
+        assert client.post(path, json={"text": f"Comment {n}"}, headers=headers["erin"]).status_code == 201
+
+    counter = StatementCounter(database.engine)
+    try:
+        response = client.get(
+            "/api/v1/social/trainings/summaries",
+            params={"training_ids": [second, first, quiet, second]},
+            headers=headers["bob"],
+        )
+    finally:
+        counter.close()
+
+    assert response.status_code == 200, response.text
+    summaries = {s["training_id"]: s for s in response.json()}
+    assert [s["training_id"] for s in response.json()] == [second, first, quiet]
+    assert summaries[first]["reaction_counts"] == {"LIKE": 2, "LOVE": 0, "FIRE": 2, "MUSCLE": 0, "TARGET": 0}
+    assert (summaries[first]["my_reaction"], summaries[first]["comment_count"]) == ("LIKE", 0)
+    assert (summaries[second]["my_reaction"], summaries[second]["comment_count"]) == ("MUSCLE", 3)
+    assert summaries[quiet] == {
+        "training_id": quiet,
+        "reaction_counts": {"LIKE": 0, "LOVE": 0, "FIRE": 0, "MUSCLE": 0, "TARGET": 0},
+        "my_reaction": None,
+        "comment_count": 0,
+    }
+    assert len([s for s in counter.statements if "training_reactions" in s or "training_comments" in s]) == 2
+
+
+def feed(client, headers, **params):
+    """(author, training ID) pairs of every page of a user's feed."""
+    result = pages(client, "/api/v1/social/feed", headers, **params)
+    return [[(e["author_username"], e["training"]["id"]) for e in page] for page in result]
+
+
+def test_completed_trainings_are_fanned_out_to_approved_followers(social):
+    client, headers, database = social
+    first, second, third = (create_training(client, headers["alice"]) for _ in range(3))
+
+    counter = StatementCounter(database.engine)
+    try:
+        result = feed(client, headers["bob"], limit=2)
+    finally:
+        counter.close()
+
+    assert result == [[("alice", third), ("alice", second)], [("alice", first)]]
+    assert len([s for s in counter.statements if "FROM feed_entries" in s]) == 2  # One query per page
+    assert feed(client, headers["dave"]) == [[("alice", third), ("alice", second), ("alice", first)]]
+    # Pending follow requests get nothing
+    assert feed(client, headers["carol"]) == [[]]
+
+    # Leaving the completed status withdraws the training, completing it again publishes it anew
+    path = f"/api/v1/trainings/{second}"
+    assert client.put(path, json={"status": "planned"}, headers=headers["alice"]).status_code == 200
+    assert feed(client, headers["bob"]) == [[("alice", third), ("alice", first)]]
+    assert client.put(path, json={"status": "completed"}, headers=headers["alice"]).status_code == 200
+    assert feed(client, headers["bob"]) == [[("alice", second), ("alice", third), ("alice", first)]]
+
+    assert client.delete("/api/v1/social/follow/1", headers=headers["bob"]).status_code == 204
+    assert feed(client, headers["bob"]) == [[]]
+    assert len(feed(client, headers["dave"])[0]) == 3
+
+
+def test_authors_above_the_fanout_cap_are_merged_into_feeds_on_read(social, monkeypatch):
+    client, headers, database = social
+    monkeypatch.setattr(settings, "FEED_FANOUT_MAX_FOLLOWERS", 1)
+    # bob is carol's only follower, so carol's trainings are still fanned out
+    assert client.post("/api/v1/social/follow/3", headers=headers["bob"]).status_code == 201
+    assert client.post("/api/v1/social/follow/2/approve", headers=headers["carol"]).status_code == 200
+
+    alice_first = create_training(client, headers["alice"])
+    carol_first = create_training(client, headers["carol"])
+    alice_second = create_training(client, headers["alice"])
+    carol_second = create_training(client, headers["carol"])
+
+    with database.SessionLocal() as db:
+        rows = db.execute(text("SELECT user_id, author_id FROM feed_entries ORDER BY id")).all()
+    assert rows == [(None, 1), (2, 3), (None, 1), (2, 3)]
+
+    assert feed(client, headers["bob"], limit=3) == [
+        [("carol", carol_second), ("alice", alice_second), ("carol", carol_first)],
+        [("alice", alice_first)],
+    ]
+    assert feed(client, headers["dave"]) == [[("alice", alice_second), ("alice", alice_first)]]
+    assert feed(client, headers["carol"]) == [[]]
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+
+from src.application.use_cases.social.add_comment import AddCommentUseCase
+from src.application.use_cases.social.add_reaction import AddReactionUseCase
+from src.domain.entities.training_reaction import ReactionType
+from src.infrastructure.database.models import TrainingArchiveModel, TrainingModel
+from src.infrastructure.repositories import (
+    ExerciseRepositoryImpl,
+    TrainingCommentRepositoryImpl,
+    TrainingReactionRepositoryImpl,
+    TrainingRepositoryImpl,
+)
+
+from .conftest import seed_history
+
+
+@pytest.fixture
+def archived(db):
+    """Two archived trainings; training 1 uses exercises 1 and 2, training 2 uses 2 and 3."""
+    seed_history(db, trainings_per_user=2, exercises=3, implementations_per_training=2)
+    assert TrainingRepositoryImpl(db).archive_completed_before(datetime(2030, 1, 1), limit=10) == 2
+    db.expire_all()
+    return db
+
+
+def test_comment_on_archived_training_restores_it_with_sets(archived):
+    db = archived
+    use_case = AddCommentUseCase(TrainingCommentRepositoryImpl(db), TrainingRepositoryImpl(db))
+
+    comment = use_case.execute(2, user_id=1, text="Nice")
+
+    assert comment.id is not None
+    assert db.get(TrainingArchiveModel, 2) is None
+    training = TrainingRepositoryImpl(db).get_by_id(2)
+    assert [impl.exercise_id for impl in training.implementations] == [2, 3]
+    assert (training.exercise_count, training.set_count) == (2, 6)
+
+
+def test_reaction_on_archived_training_drops_deleted_exercises(archived):
+    db = archived
+    ExerciseRepositoryImpl(db).delete(1)
+    use_case = AddReactionUseCase(TrainingReactionRepositoryImpl(db), TrainingRepositoryImpl(db))
+
+    use_case.execute(1, user_id=1, reaction_type=ReactionType.LIKE)
+
+    db_training = db.get(TrainingModel, 1)
+    assert [impl.exercise_id for impl in db_training.implementations] == [2]
+    assert (db_training.exercise_count, db_training.set_count, float(db_training.total_volume)) == (1, 3, 1320.0)
+
+
+def test_comment_on_missing_training_is_rejected(archived):
+    db = archived
+    use_case = AddCommentUseCase(TrainingCommentRepositoryImpl(db), TrainingRepositoryImpl(db))
+
+    with pytest.raises(ValueError, match="not found"):
+        use_case.execute(99, user_id=1, text="Nice")
@@ -0,0 +1,33 @@
+import glob
+import os
+import tempfile
+
+import anyio
+import pytest
+
+from src.infrastructure.importers import UploadTooLargeError, save_upload
+
+
+async def body(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def leftover_uploads():
+    return set(glob.glob(os.path.join(tempfile.gettempdir(), "training-import-*")))
+
+
+def test_save_upload_writes_all_chunks():
+    path = anyio.run(save_upload, body(b"a" * 700_000, b"b" * 700_000, b"c"), 2_000_000)
+    try:
+        with open(path, "rb") as file:
+            assert file.read() == b"a" * 700_000 + b"b" * 700_000 + b"c"
+    finally:
+        os.remove(path)
+
+
+def test_save_upload_rejects_oversized_body_and_removes_partial_file():
+    before = leftover_uploads()
+    with pytest.raises(UploadTooLargeError):
+        anyio.run(save_upload, body(b"x" * 600, b"x" * 600), 1000)
+    assert leftover_uploads() == before
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.auth.password_service import PasswordService
+from src.infrastructure.database import session as database_session
+from src.infrastructure.database.session import Database
+from src.infrastructure.repositories import TrainingRepositoryImpl
+from src.presentation.main import app
+
+from .conftest import StatementCounter
+
+SUMMARY_FIELDS = {
+    "id", "user_id", "training_template_id", "date_time", "duration", "notes", "status", "created_at",
+    "share_token", "exercise_count", "set_count", "total_volume", "top_weight",
+}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """A logged-in user on a fresh file-backed SQLite database."""
+    monkeypatch.setattr(PasswordService, "BCRYPT_ROUNDS", 4)
+    database = Database(f"sqlite:///{tmp_path}/summaries.db")
+    database.create_tables()
+    monkeypatch.setattr(database_session, "database", database)
+    client = TestClient(app)
+    body = {"email": "alice@example.com", "username": "alice", "password": "secret123"}
+    assert client.post("/api/v1/auth/register", json=body).status_code == 201
+    token = client.post("/api/v1/auth/login", json=body).json()["access_token"]
+    client.headers["Authorization"] = f"Bearer {token}"
+    yield client, database
+    asyncio.run(database.dispose())
+
+
+def create_training(client, date_time, status, implementations) -> int:
+    training = {"date_time": date_time, "status": status, "implementations": implementations}
+    response = client.post("/api/v1/trainings", json=training)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def implementation(exercise_id, order_index, *sets):
+    return {
+        "exercise_id": exercise_id,
+        "order_index": order_index,
+        "sets": [{"order_index": n, "weight": weight, "reps": reps} for n, (weight, reps) in enumerate(sets)],
+    }
+
+
+def test_summary_view_returns_totals_of_hot_and_archived_trainings_in_two_queries(client):
+    client, database = client
+    squat, bench = (
+        client.post("/api/v1/exercises", json={"name": name, "muscle_group_ids": []}).json()["id"]
+        for name in ("Squat", "Bench press")
+    )
+    archived = create_training(
+        client,
+        "2024-01-01T10:00:00",
+        "completed",
+        [implementation(squat, 0, (100, 5), (80, 8)), implementation(bench, 1, (60, 10))],
+    )
+    completed = create_training(client, "2025-01-01T10:00:00", "completed", [implementation(squat, 0, (120, 3))])
+    planned = create_training(client, "2025-02-01T10:00:00", "planned", [implementation(bench, 0)])
+    with database.SessionLocal() as db:
+        assert TrainingRepositoryImpl(db).archive_completed_before(datetime(2024, 6, 1), limit=10) == 1
+        db.commit()
+    # Authenticates once, so the counted request only reads summaries
+    assert client.get("/api/v1/trainings", params={"view": "summary"}).status_code == 200
+
+    counter = StatementCounter(database.async_engine.sync_engine)
+    try:
+        response = client.get("/api/v1/trainings", params={"view": "summary"})
+    finally:
+        counter.close()
+
+    assert response.status_code == 200, response.text
+    summaries = response.json()
+    assert [s["id"] for s in summaries] == [planned, completed, archived]
+    assert all(set(s) == SUMMARY_FIELDS for s in summaries)
+    totals = [(s["exercise_count"], s["set_count"], s["total_volume"], s["top_weight"]) for s in summaries]
+    assert totals == [(1, 0, 0.0, None), (1, 1, 360.0, 120.0), (2, 3, 1740.0, 100.0)]
+    assert (summaries[2]["status"], summaries[2]["date_time"]) == ("completed", "2024-01-01T10:00:00")
+    # One query on the totals columns of trainings, one on the archive; no implementations or sets
+    assert len(counter.statements) == 2
+    assert "FROM trainings" in counter.statements[0]
+    assert "FROM training_archive" in counter.statements[1]
@@ -2,12 +2,12 @@ import { useState, useEffect } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { trainingService } from '../services/training.service'
 import { templateService } from '../services/template.service'
-import type { Training, TrainingTemplate } from '../types'
+import type { TrainingSummary, TrainingTemplate } from '../types'
 import { formatTrainingName } from '../utils/dateFormatter'
 
 export default function TrainingsPage() {
   const navigate = useNavigate()
-  const [trainings, setTrainings] = useState<Training[]>([])
+  const [trainings, setTrainings] = useState<TrainingSummary[]>([])
   const [templates, setTemplates] = useState<TrainingTemplate[]>([])
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string>('')
@@ -21,7 +21,7 @@ export default function TrainingsPage() {
   const loadTrainings = async () => {
     try {
       setLoading(true)
-      const data = await trainingService.getTrainings()
+      const data = await trainingService.getTrainingSummaries()
       setTrainings(data)
       setError('')
     } catch (err: any) {
@@ -85,10 +85,12 @@ export default function TrainingsPage() {
     }
   }
 
-  const handleCreateTemplateFromTraining = async (training: Training) => {
+  const handleCreateTemplateFromTraining = async (summary: TrainingSummary) => {
     if (!confirm('Создать шаблон из этой тренировки?')) return
 
     try {
+      // List rows carry only totals, so load the full training with sets
+      const training = await trainingService.getTrainingById(summary.id)
       // Convert training implementations to template implementations
       const implementation_templates = training.implementations.map((impl) => ({
         exercise_id: impl.exercise_id,
@@ -211,9 +213,9 @@ export default function TrainingsPage() {
                             {getStatusText(training.status)}
                           </span>
                         </div>
-                        {training.implementations && training.implementations.length > 0 && (
+                        {training.exercise_count > 0 && (
                           <p className="text-sm text-gray-500">
-                            Упражнений: {training.implementations.length}
+                            Упражнений: {training.exercise_count}
                           </p>
                         )}
                       </div>
@@ -267,9 +269,14 @@ export default function TrainingsPage() {
                             Длительность: {Math.floor(training.duration / 60)} мин
                           </p>
                         )}
-                        {training.implementations && training.implementations.length > 0 && (
+                        {training.exercise_count > 0 && (
                           <p className="text-sm text-gray-500 mt-1">
-                            Упражнений: {training.implementations.length}
+                            Упражнений: {training.exercise_count}
+                          </p>
+                        )}
+                        {training.total_volume > 0 && (
+                          <p className="text-sm text-gray-500 mt-1">
+                            Объем: {Math.round(training.total_volume)} кг
                           </p>
                         )}
                       </div>
@@ -1,5 +1,5 @@
 import api from './api'
-import type { Training } from '../types'
+import type { Training, TrainingSummary } from '../types'
 
 export interface CreateTrainingRequest {
   date_time: string
@@ -50,6 +50,15 @@ export const trainingService = {
     return response.data
   },
 
+  async getTrainingSummaries(startDate?: string, endDate?: string): Promise<TrainingSummary[]> {
+    const params: Record<string, string> = { view: 'summary' }
+    if (startDate) params.start_date = startDate
+    if (endDate) params.end_date = endDate
+
+    const response = await api.get<TrainingSummary[]>('/trainings', { params })
+    return response.data
+  },
+
   async getTrainingById(id: number): Promise<Training> {
     const response = await api.get<Training>(`/trainings/${id}`)
     return response.data
@@ -69,6 +69,26 @@ export interface Training {
   share_token?: string
   username?: string  // Username of the training owner (for shared trainings)
   implementations: Implementation[]
+  exercise_count: number
+  set_count: number
+  total_volume: number
+  top_weight?: number
+}
+
+export interface TrainingSummary {
+  id: number
+  user_id: number
+  training_template_id?: number
+  date_time: string
+  duration?: number
+  notes?: string
+  status: 'planned' | 'in_progress' | 'completed' | 'skipped'
+  created_at: string
+  share_token?: string
+  exercise_count: number
+  set_count: number
+  total_volume: number
+  top_weight?: number
 }
 
 export interface LoginRequest {